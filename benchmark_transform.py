@@ -0,0 +1,62 @@
+import logging
+import time
+import sys
+from pathlib import Path
+
+# Add src to sys.path
+sys.path.append(str(Path.cwd()))
+
+from src.pipeline.extract import get_landscape_data
+from src.pipeline.index import LandscapeIndex
+from src.pipeline.transform import (
+    get_categories,
+    get_items,
+    get_all_categories,
+    get_stats_per_category,
+    get_stats_by_status,
+    get_items_without_repo_url,
+    get_landscape_by_letter,
+)
+
+TRANSFORMS = [
+    get_categories,
+    get_items,
+    get_all_categories,
+    get_stats_per_category,
+    get_stats_by_status,
+    get_items_without_repo_url,
+    get_landscape_by_letter,
+]
+
+
+def _run_transforms(landscape):
+    return [transform(landscape) for transform in TRANSFORMS]
+
+
+def benchmark(input_path: str = "tests/test_data/landscape_with_excluded.yml", iterations: int = 5):
+    logging.disable(logging.INFO)
+    landscape = get_landscape_data(input_path)
+    iterations = int(iterations)
+
+    # Each transform walks the nested document on its own
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        per_transform = _run_transforms(landscape)
+    per_transform_time = (time.perf_counter() - start_time) / iterations
+
+    # One traversal builds the shared index
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        shared = _run_transforms(LandscapeIndex.build(landscape))
+    shared_time = (time.perf_counter() - start_time) / iterations
+
+    assert shared == per_transform, "Shared index produced different output"
+    index = LandscapeIndex.build(landscape)
+    print(f"Items: {len(index)}, subcategories: {len(index.subcategories)}")
+    print(f"{len(TRANSFORMS)} traversals: {per_transform_time:.4f} seconds")
+    print(f"1 traversal (shared index): {shared_time:.4f} seconds")
+    print(f"Speedup: {per_transform_time / shared_time:.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
@@ -0,0 +1,51 @@
+import time
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add src to sys.path
+sys.path.append(str(Path.cwd()))
+
+from src.serialization import HAS_LIBYAML, PySafeDumper, PySafeLoader, dump_yaml, load_yaml
+
+TRACKER_DUMP_KWARGS = dict(default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+
+def _dump_kwargs(path: Path) -> dict:
+    return TRACKER_DUMP_KWARGS if path.name == "tracker.yaml" else {}
+
+
+def benchmark(data_dir: str = "data"):
+    files = sorted(Path(data_dir).rglob("*.yaml"))
+    sources = [path.read_text(encoding="utf-8") for path in files]
+    print(f"libyaml available: {HAS_LIBYAML}")
+    print(f"Files: {len(files)} ({sum(len(s) for s in sources) / 1024:.0f} KiB)")
+
+    start_time = time.perf_counter()
+    py_docs = [yaml.load(source, Loader=PySafeLoader) for source in sources]
+    py_load = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    docs = [load_yaml(source) for source in sources]
+    fast_load = time.perf_counter() - start_time
+    assert docs == py_docs, "Loaders disagree"
+
+    start_time = time.perf_counter()
+    py_out = [yaml.dump(doc, Dumper=PySafeDumper, **_dump_kwargs(path)) for path, doc in zip(files, docs)]
+    py_dump = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    out = [dump_yaml(doc, **_dump_kwargs(path)) for path, doc in zip(files, docs)]
+    fast_dump = time.perf_counter() - start_time
+
+    mismatches = [str(path) for path, a, b in zip(files, py_out, out) if a != b]
+    print(f"Load: pure-Python {py_load:.3f}s, shared {fast_load:.3f}s ({py_load / fast_load:.1f}x)")
+    print(f"Dump: pure-Python {py_dump:.3f}s, shared {fast_dump:.3f}s ({py_dump / fast_dump:.1f}x)")
+    print(f"Byte-identical output: {len(files) - len(mismatches)}/{len(files)}")
+    for path in mismatches:
+        print(f"  mismatch: {path}")
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
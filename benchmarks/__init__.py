@@ -0,0 +1,20 @@
+"""Benchmarks of the ETL pipeline and tracker on synthetic landscapes.
+
+Run ``python -m benchmarks run --scale=10k`` for a JSON report and
+``python -m benchmarks compare baseline.json current.json`` to list stages
+that got slower.
+"""
+
+from benchmarks.suite import StageResult, compare, measure, percentile, run_suite
+from benchmarks.synthetic import generate_landscape, parse_scale, write_landscape
+
+__all__ = [
+    "StageResult",
+    "compare",
+    "measure",
+    "percentile",
+    "run_suite",
+    "generate_landscape",
+    "parse_scale",
+    "write_landscape",
+]
@@ -0,0 +1,47 @@
+import json
+import sys
+from pathlib import Path
+
+import fire
+
+from benchmarks.suite import DEFAULT_CALLS, DEFAULT_SAMPLES, compare, run_suite
+
+
+class BenchmarkCommands:
+    def run(self, scale="1k", samples: int = DEFAULT_SAMPLES, calls: int = DEFAULT_CALLS, backend: str = "yaml",
+            seed: int = 0, output: str = None):
+        """Benchmarks every stage on a synthetic landscape and prints or saves the JSON report.
+
+        Args:
+            scale: Number of landscape items (1k, 10k, 100k or any count)
+            samples: Timed runs of each pipeline stage
+            calls: Timed calls of update_task and get_progress
+            backend: Tracker backend (yaml, journal or sqlite)
+            output: Write the report to this file instead of stdout
+        """
+        report = json.dumps(run_suite(scale, samples, calls, backend, seed), indent=2)
+        if output:
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            Path(output).write_text(report + "\n", encoding="utf-8")
+        else:
+            print(report)
+
+    def compare(self, baseline: str, current: str, threshold: float = 0.25):
+        """Lists stages whose p50 latency regressed by more than threshold; exits 1 if any did."""
+        regressions = compare(
+            json.loads(Path(baseline).read_text(encoding="utf-8")),
+            json.loads(Path(current).read_text(encoding="utf-8")),
+            threshold,
+        )
+        for regression in regressions:
+            print(
+                f"{regression['stage']}: {regression['baseline_p50_ms']:.3f} ms -> "
+                f"{regression['p50_ms']:.3f} ms ({regression['ratio']}x)"
+            )
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
+
+
+if __name__ == "__main__":
+    fire.Fire(BenchmarkCommands)
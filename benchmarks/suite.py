@@ -0,0 +1,368 @@
+"""Pipeline and tracker benchmarks on a synthetic data tree.
+
+``run_suite`` generates a landscape of the requested size in a temporary
+directory, then times each ETL stage and the main tracker operations on it.
+Every stage reports p50/p95 latency over its samples, throughput in items per
+second and the peak resident set size of the process while it ran, so reports
+from two commits (or two machines) can be compared stage by stage.
+"""
+
+import copy
+import io
+import logging
+import os
+import platform
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from itertools import cycle, zip_longest
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+from src.config import Config, load_config
+from src.pipeline.extract import get_landscape_data
+from src.pipeline.index import LandscapeIndex
+from src.pipeline.instrumentation import current_rss_kb, peak_rss_kb, reset_peak_rss
+from src.pipeline.load import generate_summary, save_partial_data, save_tasks, to_yaml
+from src.pipeline.tool_pages import _get_project_data_cache, generate_tool_pages
+from src.pipeline.transform import (
+    get_all_categories,
+    get_categories,
+    get_items,
+    get_items_without_repo_url,
+    get_landscape_by_letter,
+    get_stats_by_status,
+    get_stats_per_category,
+    get_stats_per_category_per_week,
+)
+from src.serialization import HAS_LIBYAML
+from src.tracker import TaskStatus, get_tracker
+from src.tracker.cache import dump_tracker, live_tracker_cache, restore_tracker, tracker_cache
+from src.tracker.compact import compact_cache
+from src.tracker.models import ItemTasks, WeekTasks, WeekTracker
+from src.tracker.ready_index import ready_index_cache
+
+from benchmarks.synthetic import generate_landscape, parse_scale, write_landscape, write_research
+
+DEFAULT_SAMPLES = 5
+# Samples of the single-task operations (update_task, get_progress)
+DEFAULT_CALLS = 50
+DEFAULT_RESEARCH_FRACTION = 0.05
+
+# Transforms run by run_etl, in its order
+TRANSFORMS = [
+    get_categories,
+    get_items,
+    get_all_categories,
+    get_landscape_by_letter,
+    get_stats_per_category,
+    get_stats_per_category_per_week,
+    get_stats_by_status,
+    get_items_without_repo_url,
+]
+
+# Output files of the index/stats transforms, relative to the data directory
+TRANSFORM_OUTPUTS = {
+    "get_categories": "index/category_index.yaml",
+    "get_items": "index/category_item_index.yaml",
+    "get_all_categories": "index/categories.yaml",
+    "get_stats_per_category": "stats/stats_per_category.yaml",
+    "get_stats_per_category_per_week": "stats/stats_per_category_per_week.yaml",
+    "get_stats_by_status": "stats/stats_by_status.yaml",
+    "get_items_without_repo_url": "extras/excluded_items.yaml",
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentile ``q`` (0-100) of ``values``, interpolating between ranks."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class StageResult:
+    """Timings of one benchmarked stage."""
+    name: str
+    seconds: List[float]
+    items: int
+    peak_rss_kb: int
+    rss_growth_kb: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        mean = sum(self.seconds) / len(self.seconds)
+        return {
+            "samples": len(self.seconds),
+            "items": self.items,
+            "p50_ms": round(percentile(self.seconds, 50) * 1000, 3),
+            "p95_ms": round(percentile(self.seconds, 95) * 1000, 3),
+            "mean_ms": round(mean * 1000, 3),
+            "max_ms": round(max(self.seconds) * 1000, 3),
+            "items_per_s": round(self.items / mean, 1) if mean else None,
+            "peak_rss_kb": self.peak_rss_kb,
+            "rss_growth_kb": self.rss_growth_kb,
+        }
+
+
+def measure(
+    name: str,
+    fn: Callable,
+    samples: int,
+    items: int = 1,
+    setup: Optional[Callable[[], tuple]] = None
+) -> StageResult:
+    """Time ``samples`` calls of ``fn``.
+
+    Args:
+        name: Stage name in the report
+        fn: Operation to time
+        samples: Number of timed calls
+        items: Items handled by one call, for throughput
+        setup: Untimed call before each sample returning the arguments of ``fn``
+
+    Returns:
+        StageResult of the stage
+    """
+    seconds = []
+    peak = 0
+    growth = None
+    for _ in range(max(1, int(samples))):
+        args = setup() if setup else ()
+        start_rss = current_rss_kb() if reset_peak_rss() else None
+        start = time.perf_counter()
+        fn(*args)
+        seconds.append(time.perf_counter() - start)
+        sample_peak = peak_rss_kb()
+        peak = max(peak, sample_peak)
+        if start_rss is not None:
+            growth = max(growth or 0, sample_peak - start_rss)
+    return StageResult(name, seconds, items, peak, growth)
+
+
+def write_outputs(output_dir: Path, outputs: Dict[str, object], landscape_by_letter: Dict[str, dict]) -> None:
+    """Write the files of the load stage sequentially, as ``run_etl --workers 1`` does."""
+    output_dir = Path(output_dir)
+    for name, relative_path in TRANSFORM_OUTPUTS.items():
+        to_yaml(outputs[name], str(output_dir / relative_path))
+    for letter, data in landscape_by_letter.items():
+        index = ord(letter) - ord('A')
+        save_tasks(data['tasks'], letter, index, str(output_dir))
+        for key in data['partial']:
+            save_partial_data(key, data['partial'], letter, index, str(output_dir))
+
+
+def _tracker_config(data_dir: Path) -> SimpleNamespace:
+    return SimpleNamespace(data_dir=data_dir, weeks_dir=data_dir / "weeks", cache_dir=data_dir / ".cache")
+
+
+def _copy_tracker(tracker: WeekTracker) -> WeekTracker:
+    """Copy a tracker in Python with model_construct/model_copy, the alternative to restore_tracker."""
+    return WeekTracker.model_construct(
+        items={
+            name: ItemTasks.model_construct(
+                tasks={task_type: record.model_copy() for task_type, record in item_tasks.tasks.items()},
+                removed=item_tasks.removed,
+            )
+            for name, item_tasks in tracker.items.items()
+        },
+        week_tasks=WeekTasks.model_construct(
+            tasks={task_type: record.model_copy() for task_type, record in tracker.week_tasks.tasks.items()},
+        ),
+        metadata=copy.deepcopy(tracker.metadata),
+    )
+
+
+def _clear_tracker_caches() -> tuple:
+    tracker_cache.clear()
+    live_tracker_cache.clear()
+    compact_cache.clear()
+    ready_index_cache.clear()
+    return ()
+
+
+def run_suite(
+    scale="1k",
+    samples: int = DEFAULT_SAMPLES,
+    calls: int = DEFAULT_CALLS,
+    backend: str = "yaml",
+    seed: int = 0,
+    research_fraction: float = DEFAULT_RESEARCH_FRACTION,
+    workdir: Optional[str] = None
+) -> Dict[str, object]:
+    """Benchmark the pipeline and tracker on a synthetic landscape.
+
+    Args:
+        scale: Number of landscape items, e.g. ``1k``, ``10k`` or ``100k``
+        samples: Timed runs of each pipeline stage
+        calls: Timed calls of the single-task tracker operations
+        backend: Tracker backend ('yaml', 'journal' or 'sqlite')
+        seed: Seed of the synthetic landscape
+        research_fraction: Share of week items given a research file
+        workdir: Parent of the temporary data tree (default: the system temp dir)
+
+    Returns:
+        JSON-serializable report with one entry per stage
+    """
+    items = parse_scale(scale)
+    root = Path(tempfile.mkdtemp(prefix="landscape-bench-", dir=workdir))
+    logging.disable(logging.INFO)
+    try:
+        results: List[StageResult] = []
+        landscape_path = write_landscape(root / "landscape.yml", generate_landscape(items, seed))
+
+        # Extract and transform
+        results.append(measure("extract", partial(get_landscape_data, str(landscape_path)), samples, items))
+        landscape = get_landscape_data(str(landscape_path))
+        results.append(measure("index", partial(LandscapeIndex.build, landscape), samples, items))
+        index = LandscapeIndex.build(landscape)
+        outputs = {}
+        for transform in TRANSFORMS:
+            results.append(measure(f"transform.{transform.__name__}", partial(transform, index), samples, items))
+            outputs[transform.__name__] = transform(index)
+        landscape_by_letter = outputs["get_landscape_by_letter"]
+        week_tasks = {letter: data["tasks"] for letter, data in landscape_by_letter.items() if data["tasks"]}
+        week_items = sum(len(tasks) for tasks in week_tasks.values())
+
+        # Load: into an empty tree, then again with every file unchanged
+        load_dir = root / "load"
+
+        def empty_load_dir():
+            shutil.rmtree(load_dir, ignore_errors=True)
+            return (load_dir,)
+
+        write = partial(write_outputs, outputs=outputs, landscape_by_letter=landscape_by_letter)
+        results.append(measure("load", write, samples, items, setup=empty_load_dir))
+        results.append(measure("load.unchanged", partial(write, load_dir), samples, items))
+        data_dir = root / "data"
+        write(data_dir)
+
+        # Tracker
+        sync_dir = root / "sync"
+        sync_trackers = []
+
+        def empty_tracker():
+            while sync_trackers:
+                sync_trackers.pop().close()
+            shutil.rmtree(sync_dir, ignore_errors=True)
+            sync_trackers.append(get_tracker(backend, _tracker_config(sync_dir)))
+            return (sync_trackers[-1],)
+
+        def sync_all(tracker):
+            for letter, tasks in week_tasks.items():
+                tracker.sync_with_etl(letter, tasks)
+
+        results.append(measure("sync_with_etl", sync_all, samples, week_items, setup=empty_tracker))
+        sync_trackers.pop().close()
+
+        # Seed the tracker of the data tree: research done for every other item
+        tracker = get_tracker(backend, _tracker_config(data_dir))
+        sync_all(tracker)
+        pending = {}
+        for letter, tasks in week_tasks.items():
+            with tracker.batch(letter) as batch:
+                for item in tasks[::2]:
+                    batch.update_task(item, "research", TaskStatus.COMPLETED)
+            pending[letter] = tasks[1::2]
+        # One pending item per week in turn, so consecutive updates hit different weeks
+        targets = [
+            target
+            for row in zip_longest(*([(letter, item) for item in names] for letter, names in pending.items()))
+            for target in row if target
+        ]
+        target_iter = iter(targets)
+        calls = min(int(calls), len(targets)) or 1
+        results.append(measure(
+            "update_task",
+            lambda letter, item: tracker.update_task(letter, item, "research", TaskStatus.IN_PROGRESS),
+            calls,
+            setup=lambda: next(target_iter),
+        ))
+
+        letters = cycle(week_tasks)
+        results.append(measure("get_progress", tracker.get_progress, calls, setup=lambda: (next(letters),)))
+        results.append(measure("get_all_progress", tracker.get_all_progress, samples, week_items))
+        first = next(iter(week_tasks))
+        results.append(measure("load_tracker.cold", tracker.load_tracker, samples, len(week_tasks[first]),
+                               setup=lambda: _clear_tracker_caches() + (first,)))
+        loaded = tracker.load_tracker(first)
+        results.append(measure("load_tracker.warm", partial(tracker.load_tracker, first), samples,
+                               len(week_tasks[first])))
+        # How a cache hit is rebuilt: pydantic-core from the dump, against a Python copy
+        results.append(measure("load_tracker.restore", partial(restore_tracker, dump_tracker(loaded)), samples,
+                               len(week_tasks[first])))
+        results.append(measure("load_tracker.restore.copy", partial(_copy_tracker, loaded), samples,
+                               len(week_tasks[first])))
+        results.append(measure("get_ready_tasks.cold", tracker.get_ready_tasks, samples, week_items,
+                               setup=_clear_tracker_caches))
+        tracker.get_ready_tasks()
+        results.append(measure("get_ready_tasks", tracker.get_ready_tasks, samples, week_items))
+        tracker.close()
+
+        # Rendering
+        results.append(measure(
+            "generate_summary", partial(generate_summary, str(data_dir), landscape_by_letter), samples, week_items
+        ))
+        research_files = write_research(data_dir / "weeks", landscape_by_letter, research_fraction, seed)
+        site_config = Config(root, {"paths": {
+            "data_dir": str(data_dir),
+            "website_dir": str(root / "website"),
+            "templates_dir": str(load_config().templates_dir),
+        }}).to_app_config()
+
+        def render_tool_pages():
+            # Progress lines go to stdout, one per page
+            with redirect_stdout(io.StringIO()):
+                generate_tool_pages(site_config)
+
+        results.append(measure("generate_tool_pages", render_tool_pages, samples, research_files,
+                               setup=lambda: _get_project_data_cache.cache_clear() or ()))
+
+        return {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "scale": {
+                "items": items,
+                "week_items": week_items,
+                "weeks": len(week_tasks),
+                "research_files": research_files,
+                "seed": seed,
+            },
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "libyaml": HAS_LIBYAML,
+                "backend": backend,
+            },
+            "stages": {result.name: result.to_dict() for result in results},
+        }
+    finally:
+        logging.disable(logging.NOTSET)
+        _clear_tracker_caches()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def compare(baseline: Dict[str, object], current: Dict[str, object], threshold: float = 0.25) -> List[dict]:
+    """Stages whose p50 latency grew by more than ``threshold`` (0.25 = 25%) over the baseline."""
+    regressions = []
+    for name, stage in current["stages"].items():
+        before = baseline["stages"].get(name)
+        if not before or not before["p50_ms"]:
+            continue
+        ratio = stage["p50_ms"] / before["p50_ms"]
+        if ratio > 1 + threshold:
+            regressions.append({
+                "stage": name,
+                "baseline_p50_ms": before["p50_ms"],
+                "p50_ms": stage["p50_ms"],
+                "ratio": round(ratio, 2),
+            })
+    return regressions
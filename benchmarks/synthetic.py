@@ -0,0 +1,119 @@
+"""Synthetic landscapes and data trees at a configurable number of items.
+
+Generated landscapes have the same shape as the upstream ``landscape.yml``
+(categories > subcategories > items) and a similar mix of statuses and
+optional fields, so every transform and output file is exercised. Output is
+deterministic for a given size and seed.
+"""
+
+import random
+import string
+from pathlib import Path
+from typing import Dict, List
+
+from src.pipeline.tool_pages import sanitize_for_filename
+from src.serialization import dump_yaml
+
+# Items per subcategory and subcategories per category, roughly as upstream
+ITEMS_PER_SUBCATEGORY = 25
+SUBCATEGORIES_PER_CATEGORY = 8
+
+# (status, weight); None is a non-CNCF item
+STATUS_WEIGHTS = [
+    ("graduated", 3),
+    ("incubating", 5),
+    ("sandbox", 12),
+    ("archived", 2),
+    (None, 78),
+]
+
+SYLLABLES = [
+    "flux", "kube", "mesh", "nat", "vault", "ray", "dex", "lin", "ops", "io",
+    "cloud", "stack", "grid", "core", "hub", "node", "port", "sync", "wave", "zen",
+]
+
+
+def parse_scale(scale) -> int:
+    """Number of items of a scale such as ``1k``, ``100k`` or ``2500``."""
+    text = str(scale).strip().lower()
+    if text.endswith("k"):
+        return int(float(text[:-1]) * 1000)
+    if text.endswith("m"):
+        return int(float(text[:-1]) * 1_000_000)
+    return int(text)
+
+
+def _item(rng: random.Random, n: int) -> dict:
+    letter = rng.choice(string.ascii_uppercase)
+    name = f"{letter}{rng.choice(SYLLABLES)}{rng.choice(SYLLABLES).title()} {n}"
+    slug = sanitize_for_filename(name)
+    statuses, weights = zip(*STATUS_WEIGHTS)
+    item = {
+        "name": name,
+        "homepage_url": f"https://{slug}.example.org",
+        "logo": f"{slug}.svg",
+    }
+    # Items without repo_url are excluded from the weeks, as upstream
+    if rng.random() < 0.9:
+        item["repo_url"] = f"https://github.com/{slug}/{slug}"
+    status = rng.choices(statuses, weights)[0]
+    if status:
+        item["project"] = status
+    if rng.random() < 0.6:
+        item["description"] = f"{name} does {rng.choice(SYLLABLES)} for {rng.choice(SYLLABLES)} workloads."
+    if rng.random() < 0.3:
+        item["twitter"] = f"https://twitter.com/{slug}"
+    if rng.random() < 0.5:
+        item["crunchbase"] = f"https://www.crunchbase.com/organization/{slug}"
+    return item
+
+
+def generate_landscape(items: int, seed: int = 0) -> List[dict]:
+    """Build the ``landscape`` list of a document with ``items`` items."""
+    rng = random.Random(seed)
+    subcategories = max(1, -(-items // ITEMS_PER_SUBCATEGORY))
+    categories = max(1, -(-subcategories // SUBCATEGORIES_PER_CATEGORY))
+    landscape = [{"name": f"Category {c} & Platform", "subcategories": []} for c in range(categories)]
+    for s in range(subcategories):
+        landscape[s % categories]["subcategories"].append({"name": f"Subcategory {s}/Tools", "items": []})
+    buckets = [sub for category in landscape for sub in category["subcategories"]]
+    for n in range(items):
+        buckets[n % len(buckets)]["items"].append(_item(rng, n))
+    return landscape
+
+
+def write_landscape(path: Path, landscape: List[dict]) -> Path:
+    """Write a landscape as a ``landscape.yml`` document."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dump_yaml({"landscape": landscape}, default_flow_style=False, sort_keys=False))
+    return path
+
+
+def write_research(weeks_dir: Path, landscape_by_letter: Dict[str, dict], fraction: float = 0.05,
+                   seed: int = 0) -> int:
+    """Write research files for a share of the items of each week, as the researcher agent does.
+
+    Returns:
+        Number of research files written
+    """
+    rng = random.Random(seed)
+    written = 0
+    for letter, data in landscape_by_letter.items():
+        research_dir = Path(weeks_dir) / f"{ord(letter) - ord('A'):02d}-{letter}" / "research"
+        for name in data["tasks"]:
+            if rng.random() >= fraction:
+                continue
+            research_dir.mkdir(parents=True, exist_ok=True)
+            research = {
+                "project_name": name,
+                "summary": f"{name} is a synthetic project used for benchmarks.",
+                "key_features": [f"Feature {n}" for n in range(5)],
+                "use_cases": ["Benchmarking", "Load testing"],
+                "get_started": f"Install {name} and run it.",
+            }
+            with open(research_dir / f"{sanitize_for_filename(name)}.yaml", "w", encoding="utf-8") as f:
+                f.write(dump_yaml(research, default_flow_style=False, allow_unicode=True))
+            written += 1
+    return written
@@ -1,12 +1,12 @@
 import os
-import yaml
 from pathlib import Path
 from datetime import datetime
 from typing import List
 from src.agentic.agents.researcher import researcher_agent
 from src.agentic.models import ResearchOutput, ProjectMetadata
 from src.tracker import get_tracker, TaskStatus
-from src.config import load_config
+from src.config import load_config, week_id
+from src.serialization import dump_yaml
 from src.agentic.deps import ResearcherDeps
 
 async def research_item(item: ProjectMetadata, week_letter: str) -> ResearchOutput:
@@ -19,11 +19,10 @@ async def research_item(item: ProjectMetadata, week_letter: str) -> ResearchOutp
     Returns:
         Research output
     """
-    tracker = get_tracker()
-
-    # Mark as in progress
+    # Mark as in progress; the tracker is not held open while the agent runs
     try:
-        tracker.update_task(week_letter, item.name, "research", TaskStatus.IN_PROGRESS)
+        with get_tracker() as tracker:
+            tracker.update_task(week_letter, item.name, "research", TaskStatus.IN_PROGRESS)
     except Exception as e:
         pass
 
@@ -39,13 +38,14 @@ async def research_item(item: ProjectMetadata, week_letter: str) -> ResearchOutp
     except Exception as e:
         # Mark as failed in tracker
         try:
-            tracker.update_task(
-                week_letter,
-                item.name,
-                "research",
-                TaskStatus.FAILED,
-                error_message=str(e)
-            )
+            with get_tracker() as tracker:
+                tracker.update_task(
+                    week_letter,
+                    item.name,
+                    "research",
+                    TaskStatus.FAILED,
+                    error_message=str(e)
+                )
         except Exception as track_error:
             pass
 
@@ -57,11 +57,12 @@ async def research_item(item: ProjectMetadata, week_letter: str) -> ResearchOutp
             use_cases="Unknown"
         )
 
-async def save_research(week_letter: str, research: ResearchOutput):
-    """Save individual research file to data/weeks/XX-Letter/research/{sanitized_name}.yaml
-    and update tracker."""
-    tracker = get_tracker()
+def write_research_file(week_letter: str, research: ResearchOutput) -> str:
+    """Write a research file to data/weeks/XX-Letter/research/{sanitized_name}.yaml.
 
+    Returns:
+        Path of the file relative to the week folder, as stored in the tracker
+    """
     cfg = load_config()
     research_dir = cfg.weeks_dir / week_id(week_letter) / "research"
 
@@ -84,17 +85,36 @@ async def save_research(week_letter: str, research: ResearchOutput):
     research_dict = research.model_dump(exclude_none=True)
 
     with open(filename, "w", encoding="utf-8") as f:
-        yaml.dump(research_dict, f, default_flow_style=False, allow_unicode=True)
+        dump_yaml(research_dict, f, default_flow_style=False, allow_unicode=True)
+
+    return f"research/{sanitized_name}.yaml"
+
+async def save_research(week_letter: str, research: ResearchOutput):
+    """Save individual research file to data/weeks/XX-Letter/research/{sanitized_name}.yaml
+    and update tracker."""
+    await save_research_batch(week_letter, [research])
+
+async def save_research_batch(week_letter: str, results: List[ResearchOutput]):
+    """Save the research files of one week and mark them completed with a single tracker write."""
+    completed = [(research.project_name, write_research_file(week_letter, research)) for research in results]
 
     # Update tracker to mark research as completed
-    try:
-        relative_path = f"research/{sanitized_name}.yaml"
-        tracker.update_task(
-            week_letter,
-            research.project_name,
-            "research",
-            TaskStatus.COMPLETED,
-            output_file=relative_path
-        )
-    except Exception as e:
-        pass
\ No newline at end of file
+    with get_tracker() as tracker:
+        try:
+            with tracker.batch(week_letter) as batch:
+                for project_name, relative_path in completed:
+                    batch.update_task(project_name, "research", TaskStatus.COMPLETED, output_file=relative_path)
+        except Exception as e:
+            # The batch is all-or-nothing; retry one by one so a single bad
+            # result (e.g. a project name the tracker does not know) is skipped alone
+            for project_name, relative_path in completed:
+                try:
+                    tracker.update_task(
+                        week_letter,
+                        project_name,
+                        "research",
+                        TaskStatus.COMPLETED,
+                        output_file=relative_path
+                    )
+                except Exception as e:
+                    pass
@@ -1,8 +1,8 @@
 import glob
-import yaml
 from typing import List
 from pathlib import Path
 from src.config import load_config, week_id
+from src.serialization import load_yaml
 from src.agentic.models import ProjectMetadata
 from src.tracker import get_tracker
 
@@ -17,14 +17,13 @@ async def get_items_for_week(letter: str, task_type: str = "research") -> List[P
         List of ProjectMetadata for items with pending tasks
     """
     # Get tracker instance
-    tracker = get_tracker()
+    with get_tracker() as tracker:
+        # Check if tracker exists for this week
+        if not tracker.tracker_exists(letter):
+            return []
 
-    # Check if tracker exists for this week
-    if not tracker.tracker_exists(letter):
-        return []
-
-    # Get pending items from tracker
-    pending_item_names = tracker.get_pending_items(letter, task_type)
+        # Get pending items from tracker
+        pending_item_names = tracker.get_pending_items(letter, task_type)
 
     if not pending_item_names:
         return []
@@ -39,7 +38,7 @@ async def get_items_for_week(letter: str, task_type: str = "research") -> List[P
     for yf in yaml_files:
         try:
             with open(yf, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = load_yaml(f)
                 if isinstance(data, list):
                     for item in data:
                         item_name = item.get('name')
@@ -19,8 +19,6 @@ async def write_weekly_post(week_letter: str, research_results: List[ResearchOut
 
 async def save_post(week_letter: str, draft: BlogPostDraft):
     """Save blog post and update tracker."""
-    tracker = get_tracker()
-
     cfg = load_config()
     year = datetime.now().year
     filename = cfg.hugo_posts_dir / f"{year}-{week_letter}.md"
@@ -42,12 +40,13 @@ draft: false
     # Update tracker to mark blog post as completed
     try:
         relative_path = f"website/content/letters/{year}-{week_letter}.md"
-        tracker.update_task(
-            week_letter,
-            None,
-            "blog_post",
-            TaskStatus.COMPLETED,
-            output_file=relative_path
-        )
+        with get_tracker() as tracker:
+            tracker.update_task(
+                week_letter,
+                None,
+                "blog_post",
+                TaskStatus.COMPLETED,
+                output_file=relative_path
+            )
     except Exception as e:
         pass
\ No newline at end of file
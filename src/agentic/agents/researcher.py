@@ -24,8 +24,8 @@ researcher_agent = Agent(
 
 @researcher_agent.instructions
 def add_research_context(ctx: RunContext[ResearcherDeps]) -> str:
-    tracker = get_tracker(config=ctx.deps.config)
-    progress = tracker.get_progress(ctx.deps.project.week_letter, "research")
+    with get_tracker(config=ctx.deps.config) as tracker:
+        progress = tracker.get_progress(ctx.deps.project.week_letter, "research")
     return (
         f"Current Project: {ctx.deps.project.name}\n"
         f"Week: {ctx.deps.project.week_letter}\n"
@@ -17,30 +17,30 @@ async def determine_next_week() -> NextWeekDecision:
 
 @task
 async def get_ready_tasks_batch(agent_type: str, limit: int = 5) -> List[ReadyTask]:
-    """Get tasks ready for execution by a specific agent.
+    """Claim tasks ready for execution by a specific agent.
+    
+    Tasks are leased to this worker, so parallel workers never receive the
+    same task; a lease that expires (e.g. the worker crashed) is reclaimed.
     
     Args:
         agent_type: 'researcher' or 'writer'
         limit: Maximum tasks to return
         
     Returns:
-        List of ReadyTask objects
+        List of claimed ReadyTask objects
     """
     logger = get_run_logger()
-    logger.info(f"Getting {limit} ready tasks for {agent_type}")
-    
-    tracker = get_tracker()
-    ready_tasks = tracker.get_ready_tasks(limit=limit)
+    logger.info(f"Claiming {limit} ready tasks for {agent_type}")
     
-    # Filter by agent type
-    filtered = [t for t in ready_tasks if t.agent.lower() == agent_type.lower()]
+    with get_tracker() as tracker:
+        claimed = tracker.claim_ready_tasks(agent_type, limit)
     
-    if not filtered:
+    if not claimed:
         logger.info(f"No ready tasks for {agent_type}")
         return []
     
-    logger.info(f"Found {len(filtered)} ready tasks for {agent_type}")
-    return filtered
+    logger.info(f"Claimed {len(claimed)} ready tasks for {agent_type}")
+    return claimed
 
 @task
 async def get_items_for_week(letter: str, task_type: str = "research") -> List[ProjectMetadata]:
@@ -65,8 +65,8 @@ async def get_items_for_week(letter: str, task_type: str = "research") -> List[P
     logger.info(f"Found {len(items)} items with pending '{task_type}' tasks")
 
     # Log progress
-    tracker = get_tracker()
-    progress = tracker.get_progress(letter, task_type)
+    with get_tracker() as tracker:
+        progress = tracker.get_progress(letter, task_type)
     logger.info(
         f"Week {letter} progress for '{task_type}': "
         f"{progress.completed}/{progress.total} completed "
@@ -111,13 +111,13 @@ async def save_post(week_letter: str, draft: BlogPostDraft):
     logger.info(f"Blog post saved for week {week_letter}")
 
 @task
-async def save_research(week_letter: str, research: ResearchOutput):
-    """Save individual research file to data/weeks/XX-Letter/research/{sanitized_name}.yaml
-    and update tracker."""
+async def save_research(week_letter: str, results: List[ResearchOutput]):
+    """Save the research files of one week to data/weeks/XX-Letter/research/
+    and mark them completed in the tracker with a single batched write."""
     logger = get_run_logger()
-    logger.info(f"Saving research for {research.project_name}")
-    await research.save_research(week_letter, research)
-    logger.info(f"Research saved for {research.project_name}")
+    logger.info(f"Saving research for {len(results)} items of week {week_letter}")
+    await research.save_research_batch(week_letter, results)
+    logger.info(f"Research saved for week {week_letter}")
 
 @flow(name="Weekly Content Flow")
 async def weekly_content_flow(limit: Optional[int] = None):
@@ -179,9 +179,8 @@ async def weekly_content_flow(limit: Optional[int] = None):
         research_tasks = [research_item(item, week_letter) for item in items_to_process]
         research_results = await asyncio.gather(*research_tasks)
 
-        # Save research files for each result
-        save_research_tasks = [save_research(week_letter, result) for result in research_results]
-        await asyncio.gather(*save_research_tasks)
+        # Save research files and mark them completed in one tracker write
+        await save_research(week_letter, research_results)
 
         # Write the blog post
         draft = await write_weekly_post(week_letter, research_results)
@@ -272,11 +271,12 @@ async def parallel_orchestration_flow(max_rounds: int = 10, batch_size: int = 5)
             
             research_results = await asyncio.gather(*research_coros, return_exceptions=True)
             
-            # Save research results
-            save_tasks = []
-            for result in research_results:
+            # Save research results, one batched tracker write per week
+            results_by_week = {}
+            for task, result in zip(researcher_tasks, research_results):
                 if isinstance(result, ResearchOutput):
-                    save_tasks.append(save_research(result.project_name, result))
+                    results_by_week.setdefault(task.week_letter, []).append(result)
+            save_tasks = [save_research(letter, results) for letter, results in results_by_week.items()]
             
             if save_tasks:
                 await asyncio.gather(*save_tasks)
@@ -287,7 +287,6 @@ async def parallel_orchestration_flow(max_rounds: int = 10, batch_size: int = 5)
             writer_coros = []
             for task in writer_tasks:
                 # For blog_post tasks, gather all research for that week first
-                tracker = get_tracker()
                 week_research = []  # TODO: gather research results for week
                 writer_coros.append(write_weekly_post(task.week_letter, week_research))
             
@@ -4,11 +4,18 @@ import logfire
 
 logger = logging.getLogger(__name__)
 
+_configured = False
+
+def logfire_enabled() -> bool:
+    """Return True once setup_observability has configured Logfire."""
+    return _configured
+
 def setup_observability():
     """
     Configure Logfire for observability.
     Should be called once at the start of the application.
     """
+    global _configured
     # Configure Logfire if token is present
     if os.getenv('LOGFIRE_TOKEN'):
         try:
@@ -17,6 +24,7 @@ def setup_observability():
             logfire.instrument_pydantic()
             if hasattr(logfire, 'instrument_pydantic_ai'):
                 logfire.instrument_pydantic_ai()
+            _configured = True
             logger.info("Logfire configured successfully.")
         except Exception as e:
             logger.error(f"Failed to configure Logfire: {e}")
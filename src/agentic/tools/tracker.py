@@ -10,9 +10,9 @@ logger = logging.getLogger(__name__)
 def update_tracker_status(ctx: RunContext[AgentDeps], item_name: str, task_type: str, status: str, week_letter: str) -> str:
     """Update the tracker status for a task."""
     try:
-        tracker = get_tracker(config=ctx.deps.config)
         task_status = TaskStatus(status.lower())
-        tracker.update_task(week_letter, item_name, task_type, task_status)
+        with get_tracker(config=ctx.deps.config) as tracker:
+            tracker.update_task(week_letter, item_name, task_type, task_status)
         return f"Updated {item_name} {task_type} to {status}"
     except Exception as e:
         logger.error(f"Failed to update tracker: {e}")
@@ -25,12 +25,12 @@ def check_tracker_progress(ctx: RunContext[AgentDeps], week_letter: str) -> str:
         return "Invalid week letter provided"
     
     try:
-        tracker = get_tracker(config=ctx.deps.config)
-        if not tracker.tracker_exists(week_letter):
-            return f"No tracker found for week {week_letter}. ETL may not have run yet."
-        
-        progress = tracker.get_progress(week_letter, "research")
-        blog_progress = tracker.get_progress(week_letter, "blog_post")
+        with get_tracker(config=ctx.deps.config) as tracker:
+            if not tracker.tracker_exists(week_letter):
+                return f"No tracker found for week {week_letter}. ETL may not have run yet."
+
+            progress = tracker.get_progress(week_letter, "research")
+            blog_progress = tracker.get_progress(week_letter, "blog_post")
         
         return f"Week {week_letter} progress:\n" \
                f"- Research: {progress.completed}/{progress.total} completed ({progress.completion_percentage:.1f}%)\n" \
@@ -57,17 +57,21 @@ def get_all_weeks_status(ctx: RunContext[AgentDeps], data: GetAllWeeksStatusInpu
         GetAllWeeksStatusOutput with formatted status string
     """
     try:
-        tracker = get_tracker(config=ctx.deps.config)
         results = []
         incomplete_count = 0
         
+        # Read from the progress summary, without loading any week
+        with get_tracker(config=ctx.deps.config) as tracker:
+            research_progress = tracker.get_all_progress("research")
+            blog_post_progress = tracker.get_all_progress("blog_post")
+        
         for char_code in range(ord('A'), ord('Z') + 1):
             letter = chr(char_code)
-            if tracker.tracker_exists(letter):
+            if letter in research_progress:
                 # Check research progress
-                res_progress = tracker.get_progress(letter, "research")
+                res_progress = research_progress[letter]
                 # Check blog post progress
-                blog_progress = tracker.get_progress(letter, "blog_post")
+                blog_progress = blog_post_progress[letter]
                 
                 # Determine if this week is complete
                 is_completed = blog_progress.completed > 0
@@ -129,10 +133,9 @@ def get_ready_tasks(ctx: RunContext[AgentDeps], data: GetReadyTasksInput) -> Get
         GetReadyTasksOutput with list of ready tasks and metadata
     """
     try:
-        tracker = get_tracker(config=ctx.deps.config)
-        
         # Get all ready tasks (respects dependency graph via can_start_task)
-        ready_list = tracker.get_ready_tasks(limit=None)
+        with get_tracker(config=ctx.deps.config) as tracker:
+            ready_list = tracker.get_ready_tasks(limit=None)
         
         # Filter by agent if specified
         agent_filter = data.agent_type.strip().lower()
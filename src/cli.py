@@ -13,9 +13,23 @@ logging.basicConfig(
 )
 
 class RunCommands:
-    def etl(self, input_path="https://raw.githubusercontent.com/cncf/landscape/master/landscape.yml", output_dir="data"):
-        """Runs the ETL pipeline."""
-        run_etl(input_path=input_path, output_dir=output_dir)
+    def etl(self, input_path="https://raw.githubusercontent.com/cncf/landscape/master/landscape.yml", output_dir="data", stream: bool = False,
+            workers: int = 4, incremental: bool = False, trace_memory: bool = False, only=None):
+        """Runs the ETL pipeline.
+
+        Args:
+            stream: Index the landscape from the YAML event stream, skipping the parsed document (the index still holds every item)
+            workers: Number of ETL stages running at once (1 runs them one after the other)
+            incremental: Skip stages whose inputs are unchanged since the last run
+            trace_memory: Record peak traced allocations per stage in the run report (about 3x slower)
+            only: Comma-separated stages to run, e.g. stats or pages.A (default: all)
+        """
+        if only is not None:
+            # Fire passes "a,b" as a tuple and "a" as a string
+            names = only if isinstance(only, (list, tuple)) else str(only).split(",")
+            only = [name.strip() for name in map(str, names) if name.strip()]
+        run_etl(input_path=input_path, output_dir=output_dir, stream=stream, workers=workers,
+                incremental=incremental, trace_memory=trace_memory, only=only)
 
     def models(self):
         """Lists available AI models and current configuration."""
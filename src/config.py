@@ -7,7 +7,7 @@ import os
 import tempfile
 from functools import lru_cache
 
-import yaml
+from src.serialization import load_yaml
 
 
 def _repo_root() -> Path:
@@ -41,7 +41,7 @@ def _load_yaml_config(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
     with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+        return load_yaml(handle) or {}
 
 
 def _get_nested(config: Dict[str, Any], keys: list[str], default: Any) -> Any:
@@ -63,6 +63,7 @@ class AppConfig:
     stats_dir: Path
     extras_dir: Path
     weeks_dir: Path
+    cache_dir: Path
     website_dir: Path
     hugo_content_dir: Path
     hugo_posts_dir: Path
@@ -70,6 +71,7 @@ class AppConfig:
     hugo_tools_dir: Path
     templates_dir: Path
     landscape_source: str
+    featured_limit: int
     agents: Dict[str, Any]
 
 
@@ -112,6 +114,10 @@ class Config:
     def weeks_dir(self) -> Path:
         return self.data_dir / "weeks"
     
+    @property
+    def cache_dir(self) -> Path:
+        return self.data_dir / ".cache"
+    
     @property
     def website_dir(self) -> Path:
         path = _get_nested(self._config, ["paths", "website_dir"], "website")
@@ -146,6 +152,10 @@ class Config:
             "https://raw.githubusercontent.com/cncf/landscape/master/landscape.yml",
         )
 
+    @property
+    def featured_limit(self) -> int:
+        return int(_get_nested(self._config, ["etl", "featured_limit"], 6))
+
     @property
     def agents(self) -> Dict[str, Any]:
         return _get_nested(self._config, ["agents"], {})
@@ -159,6 +169,7 @@ class Config:
             stats_dir=self.stats_dir,
             extras_dir=self.extras_dir,
             weeks_dir=self.weeks_dir,
+            cache_dir=self.cache_dir,
             website_dir=self.website_dir,
             hugo_content_dir=self.hugo_content_dir,
             hugo_posts_dir=self.hugo_posts_dir,
@@ -166,6 +177,7 @@ class Config:
             hugo_tools_dir=self.hugo_tools_dir,
             templates_dir=self.templates_dir,
             landscape_source=self.landscape_source,
+            featured_limit=self.featured_limit,
             agents=self.agents,
         )
 
@@ -216,6 +228,7 @@ def resolve_data_dirs(output_dir: Optional[str] = None) -> Dict[str, Path]:
             "stats": base / "stats",
             "extras": base / "extras",
             "weeks": base / "weeks",
+            "cache": base / ".cache",
         }
 
     cfg = load_config()
@@ -225,6 +238,7 @@ def resolve_data_dirs(output_dir: Optional[str] = None) -> Dict[str, Path]:
         "stats": cfg.stats_dir,
         "extras": cfg.extras_dir,
         "weeks": cfg.weeks_dir,
+        "cache": cfg.cache_dir,
     }
 
 
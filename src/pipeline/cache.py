@@ -0,0 +1,72 @@
+"""Content-addressed cache of parsed landscape documents.
+
+Parsing the landscape YAML dominates extract time, so the parsed ``landscape``
+list is pickled under ``data/.cache/parsed/<sha256>.pickle``. Identical input
+bytes (local file or remote snapshot) load from the pickle instead, and only the
+most recently used ``keep`` entries are retained.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_KEEP = 5
+
+
+def content_digest(raw: bytes) -> str:
+    """Return the cache key for a raw landscape document."""
+    return hashlib.sha256(raw).hexdigest()
+
+
+class ParsedCache:
+    """Pickle store of parsed landscapes keyed by content hash."""
+
+    def __init__(self, cache_dir: Path, keep: int = DEFAULT_KEEP):
+        self.root = Path(cache_dir) / "parsed"
+        self.keep = keep
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.root / f"{digest}.pickle"
+
+    def get(self, digest: str) -> Optional[list]:
+        """Return the cached landscape for a digest, or None on a miss."""
+        path = self._entry_path(digest)
+        try:
+            with open(path, "rb") as f:
+                landscape = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as exc:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+        # Refresh the mtime so eviction keeps recently used entries
+        os.utime(path)
+        logger.info(f"Loaded parsed landscape from cache ({digest[:12]})")
+        return landscape
+
+    def put(self, digest: str, landscape: list) -> None:
+        """Store a parsed landscape and evict the oldest entries beyond ``keep``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(digest)
+        temp_path = path.with_suffix(".pickle.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(landscape, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove all but the ``keep`` most recently used entries."""
+        entries = sorted(
+            self.root.glob("*.pickle"),
+            key=lambda p: p.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in entries[self.keep:]:
+            stale.unlink(missing_ok=True)
@@ -1,21 +1,253 @@
-import yaml
 import requests
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+from yaml.composer import ComposerError
+from yaml.events import (
+    AliasEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
 from src.logger import get_logger
+from src.serialization import SafeLoader, load_yaml
+from src.pipeline.cache import ParsedCache, content_digest
+from src.pipeline.snapshot import SnapshotStore
 import os
+from pathlib import Path
 
 logger = get_logger(__name__)
 
-def get_landscape_data(path: str):
+def _parse_cached(raw: bytes, cache: ParsedCache, digest: str = None):
+    """
+    This function parses a raw landscape document, going through the content-hash
+    cache so identical input is only parsed once
+    """
+    digest = digest or content_digest(raw)
+    landscape = cache.get(digest)
+    if landscape is None:
+        landscape = load_yaml(raw)['landscape']
+        cache.put(digest, landscape)
+    return landscape
+
+def _get_remote_landscape(path: str, cache_dir: Path):
+    """
+    This function gets the landscape from a URL through the snapshot store, so an
+    unchanged upstream is answered by a conditional request and the parsed cache
+    """
+    cache = ParsedCache(cache_dir)
+    snapshot = SnapshotStore(cache_dir).fetch(path)
+    if snapshot.not_modified and snapshot.digest:
+        landscape = cache.get(snapshot.digest)
+        if landscape is not None:
+            return landscape
+    with open(snapshot.raw_path, 'rb') as f:
+        raw = f.read()
+    return _parse_cached(raw, cache)
+
+def get_landscape_data(path: str, cache_dir: Path = None):
     """
     This function gets the landscape data from a specific URL or local path that should be in yaml
-    and returns the landscape part of the data
+    and returns the landscape part of the data.
+    When cache_dir is given, remote sources are revalidated against a local snapshot
+    and parsed documents are cached by content hash
     """
     logger.info(f"Getting landscape data from {path}")
-    if path.startswith('http'):
+    if path.startswith('http') and cache_dir:
+        landscape = _get_remote_landscape(path, cache_dir)
+    elif path.startswith('http'):
         landscape_raw = requests.get(path)
-        landscape = yaml.safe_load(landscape_raw.content)['landscape']
+        landscape = load_yaml(landscape_raw.content)['landscape']
+    elif cache_dir:
+        with open(path, 'rb') as f:
+            landscape = _parse_cached(f.read(), ParsedCache(cache_dir))
     else:
         with open(path, 'r') as f:
-            landscape = yaml.safe_load(f)['landscape']
+            landscape = load_yaml(f)['landscape']
     logger.info("Landscape data loaded")
     return landscape
+
+class LandscapeRecord(NamedTuple):
+    """
+    One item of the landscape with its position. Subcategories without items are
+    reported with item=None and categories without subcategories with subcategory=None,
+    so the category tree can be rebuilt from the records alone
+    """
+    category: str
+    subcategory: Optional[str]
+    item: Optional[dict]
+
+def _compose_node(loader, anchors: dict) -> Node:
+    """
+    This function composes the node starting at the next event, like the yaml composer
+    but for a single subtree
+    """
+    event = loader.get_event()
+    if isinstance(event, AliasEvent):
+        if event.anchor not in anchors:
+            raise ComposerError(None, None, f"found undefined alias {event.anchor}", event.start_mark)
+        return anchors[event.anchor]
+    if isinstance(event, ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(ScalarNode, event.value, event.implicit)
+        node = ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+    elif isinstance(event, SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(SequenceNode, None, event.implicit)
+        node = SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(SequenceEndEvent):
+            node.value.append(_compose_node(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+    else:
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(MappingNode, None, event.implicit)
+        node = MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(MappingEndEvent):
+            key = _compose_node(loader, anchors)
+            node.value.append((key, _compose_node(loader, anchors)))
+        node.end_mark = loader.get_event().end_mark
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    return node
+
+def _construct_next(loader, anchors: dict):
+    """
+    This function builds the python value of the next node
+    """
+    return loader.construct_document(_compose_node(loader, anchors))
+
+def _skip_node(loader) -> None:
+    """
+    This function consumes the events of the next node without building it
+    """
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, (SequenceStartEvent, MappingStartEvent)):
+            depth += 1
+        elif isinstance(event, (SequenceEndEvent, MappingEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+def _iter_sequence(loader):
+    """
+    This function yields once per element of the next sequence, leaving the element
+    events to the caller. A null or scalar value is treated as an empty sequence
+    """
+    if not loader.check_event(SequenceStartEvent):
+        _skip_node(loader)
+        return
+    loader.get_event()
+    while not loader.check_event(SequenceEndEvent):
+        yield
+    loader.get_event()
+
+def _iter_named_mapping(loader, anchors: dict, children_key: str, iter_children):
+    """
+    This function walks a mapping with a 'name' key and a list of children, yielding
+    (name, child) pairs. Children seen before the name are buffered until it is known
+    """
+    if not loader.check_event(MappingStartEvent):
+        _skip_node(loader)
+        return
+    loader.get_event()
+    name = None
+    pending = []
+    has_children = False
+    while not loader.check_event(MappingEndEvent):
+        key = _construct_next(loader, anchors)
+        if key == 'name':
+            name = _construct_next(loader, anchors)
+        elif key == children_key:
+            for child in iter_children(loader, anchors):
+                has_children = True
+                if name is None:
+                    pending.append(child)
+                else:
+                    yield name, child
+        else:
+            _skip_node(loader)
+    loader.get_event()
+    for child in pending:
+        yield name, child
+    if not has_children:
+        yield name, None
+
+def _iter_items(loader, anchors: dict):
+    for _ in _iter_sequence(loader):
+        yield _construct_next(loader, anchors)
+
+def _iter_subcategories(loader, anchors: dict):
+    for _ in _iter_sequence(loader):
+        yield from _iter_named_mapping(loader, anchors, 'items', _iter_items)
+
+def _iter_categories(loader, anchors: dict):
+    for _ in _iter_sequence(loader):
+        for category, child in _iter_named_mapping(loader, anchors, 'subcategories', _iter_subcategories):
+            subcategory, item = child if child is not None else (None, None)
+            yield LandscapeRecord(category, subcategory, item)
+
+def iter_landscape_records(stream) -> Iterator[LandscapeRecord]:
+    """
+    This function walks the YAML event stream of a landscape document and yields one
+    LandscapeRecord per item without building the whole document in memory
+    """
+    loader = SafeLoader(stream)
+    anchors = {}
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(StreamEndEvent):
+            raise KeyError('landscape')
+        loader.get_event()  # DocumentStartEvent
+        if not loader.check_event(MappingStartEvent):
+            raise KeyError('landscape')
+        loader.get_event()
+        found = False
+        while not loader.check_event(MappingEndEvent):
+            key = _construct_next(loader, anchors)
+            if key == 'landscape':
+                found = True
+                yield from _iter_categories(loader, anchors)
+            else:
+                _skip_node(loader)
+        if not found:
+            raise KeyError('landscape')
+    finally:
+        loader.dispose()
+
+@contextmanager
+def _open_landscape_stream(path: str, cache_dir: Path = None):
+    """
+    This function opens a landscape source as a binary stream, reusing the
+    snapshot store for remote sources when cache_dir is given
+    """
+    if path.startswith('http') and cache_dir:
+        snapshot = SnapshotStore(cache_dir).fetch(path)
+        with open(snapshot.raw_path, 'rb') as f:
+            yield f
+    elif path.startswith('http'):
+        with requests.get(path, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield response.raw
+    else:
+        with open(path, 'rb') as f:
+            yield f
+
+def stream_landscape_data(path: str, cache_dir: Path = None) -> Iterator[LandscapeRecord]:
+    """
+    This function is the streaming counterpart of get_landscape_data: it yields the
+    landscape one item record at a time, so peak memory does not grow with the
+    size of the document. The transform functions accept this stream directly
+    """
+    logger.info(f"Streaming landscape data from {path}")
+    with _open_landscape_stream(path, cache_dir) as stream:
+        yield from iter_landscape_records(stream)
+    logger.info("Landscape data streamed")
@@ -0,0 +1,159 @@
+"""Item-level diff between ETL runs for incremental processing.
+
+After every run the fingerprint of each item (sha1 of its canonical JSON form),
+keyed by ``<subcategory path>/<name>``, is stored in
+``data/.cache/etl_state.json`` together with the settings that shape the output.
+An incremental run diffs the new landscape against that state and only
+regenerates the letters and subcategory buckets holding added, removed or
+modified items. Without usable state (first run, ``featured_limit`` or state
+version changed) the run falls back to a full regeneration.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from src.logger import get_logger
+from src.pipeline.index import LandscapeIndex
+from src.pipeline.writer import write_if_changed
+
+logger = get_logger(__name__)
+
+STATE_VERSION = 1
+STATE_FILE = "etl_state.json"
+
+
+def _fingerprint(value) -> str:
+    canonical = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class EtlState:
+    """Fingerprints of the last processed landscape."""
+    featured_limit: int
+    structure: str
+    items: Dict[str, str] = field(default_factory=dict)
+    # Letter -> fingerprint of the items of its week; computed, not saved
+    letters: Dict[str, str] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_index(cls, index: LandscapeIndex, featured_limit: int) -> "EtlState":
+        """Fingerprint every item and the category/subcategory structure of an index."""
+        items = {}
+        letter_items = {}
+        for row, item in enumerate(index.items):
+            path = index.subcategory_paths[index.subcategory_ids[row]]
+            key = f"{path}/{index.names[row] or ''}"
+            # Keep duplicate names within a subcategory distinct
+            suffix = 1
+            while key in items:
+                suffix += 1
+                key = f"{path}/{index.names[row] or ''}#{suffix}"
+            items[key] = _fingerprint(item)
+            letter_items.setdefault(index.letters[row], []).append((key, items[key]))
+        structure = _fingerprint([index.categories, index.subcategories, index.subcategory_paths])
+        letters = {
+            chr(code): _fingerprint([featured_limit, structure, letter_items.get(chr(code), [])])
+            for code in range(ord('A'), ord('Z') + 1)
+        }
+        return cls(featured_limit=featured_limit, structure=structure, items=items, letters=letters)
+
+    def digest(self) -> str:
+        """Fingerprint of the whole landscape."""
+        return _fingerprint([self.featured_limit, self.structure, self.items])
+
+
+@dataclass
+class LandscapeDiff:
+    """Items added, removed or modified since the previous run."""
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    modified: Set[str] = field(default_factory=set)
+    structure_changed: bool = False
+
+    @property
+    def changed(self) -> Set[str]:
+        return self.added | self.removed | self.modified
+
+    @property
+    def buckets(self) -> Set[Tuple[str, str]]:
+        """(letter, subcategory path) pairs holding a changed item."""
+        buckets = set()
+        for key in self.changed:
+            path, name = key.split("/", 1)
+            if name and 'A' <= name[0] <= 'Z':
+                buckets.add((name[0], path))
+        return buckets
+
+    @property
+    def letters(self) -> Set[str]:
+        return {letter for letter, _ in self.buckets}
+
+    def __bool__(self) -> bool:
+        return self.structure_changed or bool(self.added or self.removed or self.modified)
+
+
+def diff_states(old: EtlState, new: EtlState) -> LandscapeDiff:
+    """Compare two states item by item."""
+    old_keys = old.items.keys()
+    new_keys = new.items.keys()
+    return LandscapeDiff(
+        added=set(new_keys - old_keys),
+        removed=set(old_keys - new_keys),
+        modified={key for key in new_keys & old_keys if old.items[key] != new.items[key]},
+        structure_changed=old.structure != new.structure,
+    )
+
+
+def load_state(cache_dir: Path) -> Optional[EtlState]:
+    """Return the state of the previous run, or None if it is missing or unusable."""
+    path = Path(cache_dir) / STATE_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Ignoring unreadable ETL state {path}: {exc}")
+        return None
+    if raw.get("version") != STATE_VERSION:
+        return None
+    return EtlState(
+        featured_limit=raw["featured_limit"],
+        structure=raw["structure"],
+        items=raw["items"],
+    )
+
+
+def save_state(cache_dir: Path, state: EtlState) -> None:
+    """Persist the state of a finished run."""
+    content = json.dumps({
+        "version": STATE_VERSION,
+        "featured_limit": state.featured_limit,
+        "structure": state.structure,
+        "items": state.items,
+    }, sort_keys=True)
+    write_if_changed(Path(cache_dir) / STATE_FILE, content)
+
+
+def plan_incremental(cache_dir: Path, state: EtlState) -> Optional[LandscapeDiff]:
+    """Diff ``state`` against the previous run.
+
+    Returns None when a full regeneration is required.
+    """
+    previous = load_state(cache_dir)
+    if previous is None:
+        logger.info("No previous ETL state, running a full regeneration")
+        return None
+    if previous.featured_limit != state.featured_limit:
+        logger.info("featured_limit changed, running a full regeneration")
+        return None
+    diff = diff_states(previous, state)
+    logger.info(
+        f"Landscape diff: {len(diff.added)} added, {len(diff.removed)} removed, "
+        f"{len(diff.modified)} modified; {len(diff.letters)} letters touched"
+    )
+    return diff
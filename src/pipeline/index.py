@@ -0,0 +1,143 @@
+"""Columnar index of the landscape shared by all transform functions.
+
+The landscape is walked once; every item becomes one row in a set of parallel
+columns (name, category id, subcategory id, status code, first letter, valid
+flag, repo_url). Category and subcategory tables hold names, paths and row
+lists, so transforms never re-walk the nested document or re-run
+``make_path`` / ``_is_valid_item`` per item. Valid rows are also bucketed by
+first letter, so per-letter queries cost time proportional to that letter.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.logger import get_logger
+from src.pipeline.extract import LandscapeRecord
+
+logger = get_logger(__name__)
+
+
+def iter_records(landscape: Iterable) -> Iterator[LandscapeRecord]:
+    """Flatten the landscape into LandscapeRecords.
+
+    Accepts the nested category list from ``get_landscape_data`` or the record
+    stream from ``stream_landscape_data``.
+    """
+    for entry in landscape:
+        if not isinstance(entry, dict):
+            yield entry
+            continue
+        subcategories = entry.get('subcategories') or []
+        if not subcategories:
+            yield LandscapeRecord(entry['name'], None, None)
+        for sub in subcategories:
+            items = sub.get('items') or []
+            if not items:
+                yield LandscapeRecord(entry['name'], sub['name'], None)
+            for item in items:
+                yield LandscapeRecord(entry['name'], sub['name'], item)
+
+
+@dataclass
+class LandscapeIndex:
+    """Single-pass columnar view of the landscape."""
+    # Category table (category id -> ...)
+    categories: List[str] = field(default_factory=list)
+    category_subcategories: List[List[int]] = field(default_factory=list)
+    # Subcategory table (subcategory id -> ...)
+    subcategories: List[str] = field(default_factory=list)
+    subcategory_category: array = field(default_factory=lambda: array('i'))
+    subcategory_paths: List[str] = field(default_factory=list)
+    subcategory_rows: List[List[int]] = field(default_factory=list)
+    # Status table (status code -> raw 'project' value)
+    statuses: List[Optional[str]] = field(default_factory=list)
+    # Item columns (row id -> ...)
+    names: List[str] = field(default_factory=list)
+    category_ids: array = field(default_factory=lambda: array('i'))
+    subcategory_ids: array = field(default_factory=lambda: array('i'))
+    status_codes: array = field(default_factory=lambda: array('i'))
+    letters: List[str] = field(default_factory=list)
+    valid: bytearray = field(default_factory=bytearray)
+    repo_urls: List[Optional[str]] = field(default_factory=list)
+    # Raw items, kept because outputs are written from whole items: the index
+    # grows with the landscape even when built from a stream
+    items: List[dict] = field(default_factory=list)
+    # First letter -> valid rows, in landscape order
+    letter_rows: Dict[str, List[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, landscape: Iterable) -> "LandscapeIndex":
+        """Build the index in one pass over a nested landscape or a record stream."""
+        from src.pipeline.transform import _is_valid_item, make_path
+
+        logger.info("Building landscape index")
+        index = cls()
+        category_ids = {}
+        subcategory_ids = {}
+        status_codes = {}
+        for record in iter_records(landscape):
+            category_id = category_ids.get(record.category)
+            if category_id is None:
+                category_id = category_ids[record.category] = len(index.categories)
+                index.categories.append(record.category)
+                index.category_subcategories.append([])
+            if record.subcategory is None:
+                continue
+
+            key = (category_id, record.subcategory)
+            subcategory_id = subcategory_ids.get(key)
+            if subcategory_id is None:
+                subcategory_id = subcategory_ids[key] = len(index.subcategories)
+                index.subcategories.append(record.subcategory)
+                index.subcategory_category.append(category_id)
+                index.subcategory_paths.append(make_path(record.category, record.subcategory))
+                index.subcategory_rows.append([])
+                index.category_subcategories[category_id].append(subcategory_id)
+
+            item = record.item
+            if item is None:
+                continue
+            status = item.get('project')
+            status_code = status_codes.get(status)
+            if status_code is None:
+                status_code = status_codes[status] = len(index.statuses)
+                index.statuses.append(status)
+
+            name = item['name']
+            valid = _is_valid_item(item)
+            if valid and name:
+                index.letter_rows.setdefault(name[0], []).append(len(index.names))
+            index.subcategory_rows[subcategory_id].append(len(index.names))
+            index.names.append(name)
+            index.category_ids.append(category_id)
+            index.subcategory_ids.append(subcategory_id)
+            index.status_codes.append(status_code)
+            index.letters.append(name[0] if name else '')
+            index.valid.append(valid)
+            index.repo_urls.append(item.get('repo_url'))
+            index.items.append(item)
+        logger.info(f"Indexed {len(index.names)} items in {len(index.subcategories)} subcategories")
+        return index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def rows_for_letter(self, prefix: str) -> List[int]:
+        """Return the valid rows whose name starts with ``prefix``, in landscape order.
+
+        The returned list may be shared with the index and must not be mutated.
+        """
+        if not prefix:
+            return [row for row, valid in enumerate(self.valid) if valid]
+        rows = self.letter_rows.get(prefix[0], [])
+        if len(prefix) == 1:
+            return rows
+        return [row for row in rows if self.names[row].startswith(prefix)]
+
+
+def as_index(landscape: Iterable) -> LandscapeIndex:
+    """Return ``landscape`` as a LandscapeIndex, building one if needed."""
+    if isinstance(landscape, LandscapeIndex):
+        return landscape
+    return LandscapeIndex.build(landscape)
@@ -0,0 +1,255 @@
+"""Per-stage instrumentation of ETL runs.
+
+``RunReport`` times the stages of a run: wall time, CPU time of the process,
+peak RSS, and the files each stage wrote or left unchanged. When tracemalloc
+is tracing (``run_etl(trace_memory=True)`` or ``PYTHONTRACEMALLOC``), the peak
+of traced Python allocations is recorded too. tracemalloc makes the ETL about
+3x slower, so it is off by default; everything else costs a few system calls
+per stage and is always on.
+
+Stages of the stage graph run concurrently. CPU time and the RSS and traced
+peaks are those of the whole process while a stage ran, so stages that
+overlap share them; only wall time is the stage's own.
+
+The report is saved as JSON next to the other ETL extras. When
+``setup_observability`` has configured Logfire, every stage is also sent as a
+span.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS without /proc
+    resource = None
+
+from src.pipeline.writer import WriteStats
+
+REPORT_FILE = "etl_run.json"
+
+
+def _proc_status_kb(name: str) -> Optional[int]:
+    """A ``kB`` field of /proc/self/status (Linux only)."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith(name + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def current_rss_kb() -> Optional[int]:
+    """Resident set size of the process in KiB (None without /proc)."""
+    return _proc_status_kb("VmRSS")
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter, so the next reading covers what follows.
+
+    Returns:
+        False where the counter cannot be reset (anything but Linux)
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of the process in KiB, since the last reset (0 if unknown)."""
+    peak = _proc_status_kb("VmHWM")
+    if peak is not None:
+        return peak
+    if resource is None:
+        return 0
+    # Without /proc this is the peak of the whole process lifetime
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _logfire():
+    """The logfire module if setup_observability configured it, else None.
+
+    Looked up in sys.modules: importing the observability module only to check
+    would import logfire, which takes longer than a small ETL run.
+    """
+    observability = sys.modules.get("src.agentic.observability")
+    if observability is None or not observability.logfire_enabled():
+        return None
+    return observability.logfire
+
+
+@dataclass
+class StageMetrics:
+    """Measurements of one stage, summed over its calls (e.g. one per week)."""
+    name: str
+    files: WriteStats
+    calls: int = 0
+    # Calls skipped because their inputs were unchanged
+    skipped: int = 0
+    items: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_kb: int = 0
+    peak_traced_kb: Optional[int] = None
+    # Seconds from the start of the run to the first call
+    started_s: Optional[float] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "skipped": self.skipped,
+            "items": self.items,
+            "wall_ms": round(self.wall_s * 1000, 3),
+            "cpu_ms": round(self.cpu_s * 1000, 3),
+            "peak_rss_kb": self.peak_rss_kb,
+            "peak_traced_kb": self.peak_traced_kb,
+            "files_written": self.files.written,
+            "files_skipped": self.files.skipped,
+        }
+
+
+class RunReport:
+    """Stage measurements of one ETL run.
+
+    Stages are timed with ``stage``, from any thread; entering a stage again
+    adds to its totals. Writers pass ``stage.files`` (or ``files(name)`` for writes done
+    on a thread pool), which also count towards ``write_stats``.
+    """
+
+    def __init__(self, write_stats: Optional[WriteStats] = None, **options):
+        """Start the run.
+
+        Args:
+            write_stats: Totals of the run, parent of every stage's file counters
+            **options: Options of the run, copied into the report
+        """
+        self.write_stats = write_stats if write_stats is not None else WriteStats()
+        self.options = options
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._stages: Dict[str, StageMetrics] = {}
+        self._totals: Optional[Dict[str, float]] = None
+        self._lock = threading.Lock()
+
+    def _metrics(self, name: str) -> StageMetrics:
+        with self._lock:
+            metrics = self._stages.get(name)
+            if metrics is None:
+                metrics = self._stages[name] = StageMetrics(name, WriteStats(parent=self.write_stats))
+            return metrics
+
+    def files(self, name: str) -> WriteStats:
+        """File counters of a stage, for writes that finish outside its ``with`` block."""
+        return self._metrics(name).files
+
+    def skip(self, name: str) -> None:
+        """Count a call of stage ``name`` that was skipped."""
+        metrics = self._metrics(name)
+        with self._lock:
+            metrics.skipped += 1
+
+    @contextmanager
+    def stage(self, name: str, items: int = 0, **attributes) -> Iterator[StageMetrics]:
+        """Measure a block as (one call of) stage ``name``.
+
+        Args:
+            name: Stage name in the report
+            items: Items handled by this call
+            **attributes: Extra attributes of the Logfire span
+        """
+        metrics = self._metrics(name)
+        logfire = _logfire()
+        with ExitStack() as stack:
+            span = stack.enter_context(logfire.span(f"etl.{name}", **attributes)) if logfire else None
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.reset_peak()
+            reset_peak_rss()
+            written, skipped = metrics.files.written, metrics.files.skipped
+            start, cpu_start = time.perf_counter(), time.process_time()
+            try:
+                yield metrics
+            finally:
+                wall, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+                peak_rss = peak_rss_kb()
+                peak_traced = tracemalloc.get_traced_memory()[1] // 1024 if tracing else None
+
+                with self._lock:
+                    if metrics.started_s is None:
+                        metrics.started_s = start - self._start
+                    metrics.calls += 1
+                    metrics.items += items
+                    metrics.wall_s += wall
+                    metrics.cpu_s += cpu
+                    metrics.peak_rss_kb = max(metrics.peak_rss_kb, peak_rss)
+                    if peak_traced is not None:
+                        metrics.peak_traced_kb = max(metrics.peak_traced_kb or 0, peak_traced)
+                if span is not None:
+                    span.set_attributes({
+                        "items": items,
+                        "wall_ms": round(wall * 1000, 3),
+                        "cpu_ms": round(cpu * 1000, 3),
+                        "peak_rss_kb": peak_rss,
+                        "files_written": metrics.files.written - written,
+                        "files_skipped": metrics.files.skipped - skipped,
+                    })
+                    if peak_traced is not None:
+                        span.set_attribute("peak_traced_kb", peak_traced)
+
+    def finish(self) -> Dict[str, Any]:
+        """End the run and return the report; sends the totals to Logfire if it is configured."""
+        if self._totals is None:
+            self._totals = {
+                "wall_s": round(time.perf_counter() - self._start, 3),
+                "cpu_s": round(time.process_time() - self._cpu_start, 3),
+            }
+            logfire = _logfire()
+            if logfire:
+                logfire.info(
+                    "etl run finished",
+                    files_written=self.write_stats.written,
+                    files_skipped=self.write_stats.skipped,
+                    **self._totals,
+                )
+        return self.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        stages = sorted(self._stages.values(), key=lambda m: (m.started_s is None, m.started_s or 0.0))
+        traced = [m.peak_traced_kb for m in stages if m.peak_traced_kb is not None]
+        return {
+            "started_at": self.started_at.isoformat(),
+            **(self._totals or {}),
+            "peak_rss_kb": max((m.peak_rss_kb for m in stages), default=0),
+            "peak_traced_kb": max(traced) if traced else None,
+            "files_written": self.write_stats.written,
+            "files_skipped": self.write_stats.skipped,
+            "options": self.options,
+            "stages": [m.to_dict() for m in stages],
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the report as JSON, replacing the previous run's."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.finish(), f, indent=2)
+            f.write("\n")
+        os.replace(temp_path, path)
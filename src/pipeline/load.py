@@ -1,44 +1,41 @@
-import yaml
 from pathlib import Path
+from typing import Iterable
 from src.config import load_config, resolve_data_dirs, week_id
+from src.serialization import load_yaml
 from src.logger import get_logger
+from src.pipeline.writer import WriteStats, write_if_changed, write_yaml_if_changed
 import jinja2
 
 logger = get_logger(__name__)
 
-def to_yaml(data: dict, path: str):
+def to_yaml(data: dict, path: str, stats: WriteStats = None):
     """
-    This function saves a dictionary to a yaml file
+    This function saves a dictionary to a yaml file, leaving it untouched if unchanged
     """
     logger.info(f"Saving data to {path}")
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w+') as file:
-        yaml.dump(data, file)
+    write_yaml_if_changed(path, data, stats)
 
-def save_partial_data(key: str, partial_data: dict, letter: str, index: int, output_dir: str = "data"):
+def save_partial_data(key: str, partial_data: dict, letter: str, index: int, output_dir: str = "data",
+                      stats: WriteStats = None):
     """
     This function saves the partial data to a yaml file
     """
     dirs = resolve_data_dirs(output_dir)
     week_folder = dirs["weeks"] / week_id(letter)
     categories_dir = week_folder / "categories"
-    categories_dir.mkdir(parents=True, exist_ok=True)
     path = categories_dir / f"{key}.yaml"
     logger.info(f"Saving partial data to {path}")
-    with open(path, 'w+') as file:
-        yaml.dump(partial_data[key], file)
+    write_yaml_if_changed(path, partial_data[key], stats)
 
-def save_tasks(tasks: list, letter: str, index: int, output_dir: str = "data"):
+def save_tasks(tasks: list, letter: str, index: int, output_dir: str = "data", stats: WriteStats = None):
     """
     This function saves the tasks for a specific week to a yaml file
     """
     dirs = resolve_data_dirs(output_dir)
     week_folder = dirs["weeks"] / week_id(letter)
-    week_folder.mkdir(parents=True, exist_ok=True)
     path = week_folder / "tasks.yaml"
     logger.info(f"Saving tasks to {path}")
-    with open(path, 'w+') as file:
-        yaml.dump(tasks, file)
+    write_yaml_if_changed(path, tasks, stats)
 
 def generate_summary(output_dir: str = "data", landscape_by_letter: dict = None) -> dict:
     """
@@ -88,7 +85,7 @@ def generate_summary(output_dir: str = "data", landscape_by_letter: dict = None)
         categories_dir = week_dir / "categories"
         for yaml_file in categories_dir.glob("*.yaml"):
             with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
+                data = load_yaml(f)
                 if data:
                     category = yaml_file.stem.replace('_', ' ').title()
                     item_count = len(data)
@@ -104,7 +101,8 @@ def generate_summary(output_dir: str = "data", landscape_by_letter: dict = None)
 
     return summaries
 
-def generate_letter_pages(output_dir: str = "website/content", summaries: dict = None):
+def generate_letter_pages(output_dir: str = "website/content", summaries: dict = None, stats: WriteStats = None,
+                          letters: Iterable[str] = None, root: bool = True):
     """
     Generates Hugo-style content pages for each letter A–Z under ``{output_dir}/letters/``.
     For each letter, this function creates a directory ``{output_dir}/letters/<LETTER>/`` containing an ``_index.md`` file.
@@ -115,19 +113,21 @@ def generate_letter_pages(output_dir: str = "website/content", summaries: dict =
     - ``data_key``: Key of the corresponding week's data directory, formatted as ``{week_num}-{letter}`` (e.g. ``00-A``).
     - ``layout``: The Hugo layout to use (set to ``"list"``).
     In addition, a root ``_index.md`` is created in ``{output_dir}/letters/`` that defines the "All Letters" section.
+    Pages whose content is unchanged are not rewritten. With ``letters`` only those letter pages are generated,
+    and with ``root=False`` the root ``_index.md`` is not.
     """
     logger.info("Generating letter pages")
     letters_dir = Path(output_dir) / "letters"
-    letters_dir.mkdir(parents=True, exist_ok=True)
 
     for letter_code in range(ord('A'), ord('Z') + 1):
         letter = chr(letter_code)
+        if letters is not None and letter not in letters:
+            continue
         index = letter_code - ord('A')
         week_num = str(index).zfill(2)
         week_key = f"{week_num}-{letter}"
 
         letter_dir = letters_dir / letter
-        letter_dir.mkdir(exist_ok=True)
 
         summary = ""
         if summaries:
@@ -143,8 +143,10 @@ layout: "list"
 
 {summary}
 """
-        with open(letter_dir / "_index.md", "w") as f:
-            f.write(content)
+        write_if_changed(letter_dir / "_index.md", content, stats)
+
+    if not root:
+        return
 
     # Generate the root section index for letters
     content_root = """---
@@ -152,5 +154,4 @@ title: "All Letters"
 layout: "list"
 ---
 """
-    with open(letters_dir / "_index.md", "w") as f:
-        f.write(content_root)
+    write_if_changed(letters_dir / "_index.md", content_root, stats)
@@ -1,5 +1,6 @@
 from src.config import load_config, resolve_data_dirs, Config
-from src.pipeline.extract import get_landscape_data
+from src.pipeline.extract import get_landscape_data, stream_landscape_data
+from src.pipeline.index import LandscapeIndex
 from src.pipeline.transform import (
     get_categories,
     get_items,
@@ -17,18 +18,151 @@ from src.pipeline.load import (
     save_tasks,
     generate_letter_pages,
 )
+from src.pipeline.writer import WriteStats, write_if_changed
+from src.pipeline.incremental import EtlState, plan_incremental, save_state
+from src.pipeline.instrumentation import REPORT_FILE, RunReport
+from src.pipeline.stages import Artifact, Stage, StageGraph, StageRun, digest, load_run, save_run
 from src.logger import get_logger
 from src.tracker import get_tracker
+from functools import partial
 from pathlib import Path
+from typing import Iterable, Optional
+import tracemalloc
 
 logger = get_logger(__name__)
 
+DEFAULT_WORKERS = 4
+
+LETTERS = [chr(letter_code) for letter_code in range(ord('A'), ord('Z') + 1)]
+
+
+class EtlStages:
+    """The stages of an ETL run, bound to its output directory, tracker and report.
+
+    ``landscape`` is the whole landscape and ``landscape.<letter>`` the same
+    landscape fingerprinted by the items of one week only, so the stages of a
+    week only run when one of its items changed. Stages of a week are named
+    ``<group>.<letter>``: ``partition``, ``tasks`` (tasks.yaml and the tracker
+    sync), ``categories``, ``summary`` and ``pages``. The other groups are
+    ``index``, ``stats`` and ``excluded``; ``pages.index`` is the root letters
+    page.
+    """
+
+    def __init__(self, output_dir: str, featured_limit: int, tracker, report: RunReport):
+        self.output_dir = output_dir
+        self.dirs = resolve_data_dirs(output_dir)
+        self.featured_limit = featured_limit
+        self.tracker = tracker
+        self.report = report
+        # Run whose outputs are on disk, and the (letter, subcategory path)
+        # buckets changed since; None rewrites every bucket
+        self.previous: Optional[StageRun] = None
+        self.buckets = None
+
+    def graph(self) -> StageGraph:
+        stages = [
+            Stage("index", self.save_index, inputs=("landscape",)),
+            Stage("stats", self.save_stats, inputs=("landscape",)),
+            Stage("excluded", self.save_excluded, inputs=("landscape",)),
+            Stage("pages.index", self.save_letters_index),
+        ]
+        for letter in LETTERS:
+            stages += [
+                Stage(f"partition.{letter}", partial(self.partition, letter), inputs=(f"landscape.{letter}",),
+                      outputs=(f"week.{letter}", f"task_names.{letter}")),
+                # tasks.yaml creates the week directory the summary is written to
+                Stage(f"tasks.{letter}", partial(self.sync_tasks, letter), inputs=(f"task_names.{letter}",)),
+                Stage(f"categories.{letter}", partial(self.save_categories, letter), inputs=(f"week.{letter}",)),
+                Stage(f"summary.{letter}", partial(self.save_summary, letter), inputs=(f"week.{letter}",),
+                      outputs=(f"summary.{letter}",), after=(f"tasks.{letter}",)),
+                Stage(f"pages.{letter}", partial(self.save_letter_page, letter), inputs=(f"summary.{letter}",)),
+            ]
+        return StageGraph(stages, sources=["landscape"] + [f"landscape.{letter}" for letter in LETTERS])
+
+    def save_index(self, landscape):
+        files = self.report.files("index")
+        to_yaml(get_categories(landscape), str(self.dirs["index"] / "category_index.yaml"), files)
+        to_yaml(get_items(landscape), str(self.dirs["index"] / "category_item_index.yaml"), files)
+        to_yaml(get_all_categories(landscape), str(self.dirs["index"] / "categories.yaml"), files)
+
+    def save_stats(self, landscape):
+        files = self.report.files("stats")
+        to_yaml(get_stats_per_category(landscape), str(self.dirs["stats"] / "stats_per_category.yaml"), files)
+        to_yaml(get_stats_per_category_per_week(landscape),
+                str(self.dirs["stats"] / "stats_per_category_per_week.yaml"), files)
+        to_yaml(get_stats_by_status(landscape), str(self.dirs["stats"] / "stats_by_status.yaml"), files)
+
+    def save_excluded(self, landscape):
+        to_yaml(get_items_without_repo_url(landscape), str(self.dirs["extras"] / "excluded_items.yaml"),
+                self.report.files("excluded"))
+
+    def partition(self, letter: str, landscape) -> dict:
+        week = get_landscape_by_letter(landscape, featured_limit=self.featured_limit, letters=[letter])[letter]
+        # The tracker only depends on the names, not on the item contents
+        return {f"week.{letter}": week, f"task_names.{letter}": Artifact(week['tasks'], digest(week['tasks']))}
+
+    def sync_tasks(self, letter: str, tasks: list):
+        save_tasks(tasks, letter, ord(letter) - ord('A'), self.output_dir, stats=self.report.files("tasks"))
+        if tasks:
+            logger.info(f"Syncing tracker for week {letter} with {len(tasks)} items")
+            with self.report.stage("tracker_sync", items=len(tasks), letter=letter):
+                self.tracker.sync_with_etl(letter, tasks)
+
+    def save_categories(self, letter: str, week: dict):
+        # Only the changed buckets differ from files written by the previous run
+        previous_ran = self.previous is not None and f"categories.{letter}" in self.previous.keys
+        buckets = self.buckets if previous_ran else None
+        files = self.report.files("categories")
+        for key in week['partial']:
+            if buckets is not None and (letter, key) not in buckets:
+                continue
+            save_partial_data(key, week['partial'], letter, ord(letter) - ord('A'), self.output_dir, stats=files)
+
+    def save_summary(self, letter: str, week: dict) -> dict:
+        summaries = generate_summary(self.output_dir, {letter: week})
+        for week_dir_name, content in summaries.items():
+            write_if_changed(self.dirs["weeks"] / week_dir_name / "README.md", content, self.report.files("summary"))
+        return {f"summary.{letter}": summaries}
+
+    def save_letter_page(self, letter: str, summaries: dict):
+        generate_letter_pages(summaries=summaries, stats=self.report.files("pages"), letters={letter}, root=False)
+
+    def save_letters_index(self):
+        generate_letter_pages(stats=self.report.files("pages"), letters=())
+
 
 def run_etl(
     input_path: str = "https://raw.githubusercontent.com/cncf/landscape/master/landscape.yml",
     output_dir: str = "data",
+    stream: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    incremental: bool = False,
+    trace_memory: bool = False,
+    only: Optional[Iterable[str]] = None,
 ):
-    """Run the ETL pipeline and write outputs to disk."""
+    """Run the ETL pipeline and write outputs to disk.
+
+    With ``stream`` the landscape is indexed straight from the YAML event stream
+    instead of being parsed into a nested document first. This avoids the
+    parser's peak, but the index still holds every item, so memory grows with
+    the landscape either way.
+
+    Once the landscape is loaded, the outputs are produced by the stages of
+    ``EtlStages``, up to ``workers`` of them at once: each stage starts as soon
+    as the stages it reads from are done. With ``only`` (stage names or groups,
+    e.g. ``["stats"]``) just those stages run, with the stages they read from.
+
+    With ``incremental`` the landscape is diffed item by item against the state
+    saved by the previous run. Stages whose inputs are unchanged since then are
+    skipped, and only the subcategory files holding changed items are rewritten.
+
+    Every stage is timed into a run report saved as ``extras/etl_run.json``.
+    With ``trace_memory`` the report also holds the peak traced allocations
+    of each stage, at the cost of a much slower run.
+
+    Raises:
+        ValueError: If ``only`` names an unknown stage
+    """
     cfg = load_config()
     if input_path == "https://raw.githubusercontent.com/cncf/landscape/master/landscape.yml":
         input_path = cfg.landscape_source
@@ -43,60 +177,66 @@ def run_etl(
     config = Config(root_path)
 
     logger.info("Starting landscape processing")
-    landscape = get_landscape_data(input_path)
-
-    categories = get_categories(landscape)
-    to_yaml(categories, str(dirs["index"] / "category_index.yaml"))
-
-    items = get_items(landscape)
-    to_yaml(items, str(dirs["index"] / "category_item_index.yaml"))
-
-    all_categories = get_all_categories(landscape)
-    to_yaml(all_categories, str(dirs["index"] / "categories.yaml"))
-
-    landscape_by_letter = get_landscape_by_letter(landscape)
-
-    # Initialize tracker with config
+    write_stats = WriteStats()
+    only = list(only) if only else None
+    report = RunReport(
+        write_stats, input_path=input_path, stream=stream, workers=workers, incremental=incremental, only=only,
+    )
     tracker = get_tracker(config=config)
-
-    for letter_code in range(ord('A'), ord('Z') + 1):
-        letter = chr(letter_code)
-        index = letter_code - ord('A')
-
-        letter_data = landscape_by_letter.get(letter, {'partial': {}, 'tasks': []})
-        partial = letter_data['partial']
-        tasks = letter_data['tasks']
-
-        save_tasks(tasks, letter, index, output_dir)
-        
-        # Sync tracker with ETL output
-        if tasks:
-            logger.info(f"Syncing tracker for week {letter} with {len(tasks)} items")
-            tracker.sync_with_etl(letter, tasks)
-
-        for key in partial:
-            save_partial_data(key, partial, letter, index, output_dir)
-
-    stats_per_category = get_stats_per_category(landscape)
-    to_yaml(stats_per_category, str(dirs["stats"] / "stats_per_category.yaml"))
-
-    stats_per_category_per_week = get_stats_per_category_per_week(landscape)
-    to_yaml(stats_per_category_per_week, str(dirs["stats"] / "stats_per_category_per_week.yaml"))
-
-    stats_by_status = get_stats_by_status(landscape)
-    to_yaml(stats_by_status, str(dirs["stats"] / "stats_by_status.yaml"))
-
-    excluded_items = get_items_without_repo_url(landscape)
-    to_yaml(excluded_items, str(dirs["extras"] / "excluded_items.yaml"))
-
-    summaries = generate_summary(output_dir, landscape_by_letter)
-
-    # Save summaries to README.md in each week's directory
-    for week_dir_name, content in summaries.items():
-        summary_path = dirs["weeks"] / week_dir_name / "README.md"
-        with open(summary_path, "w") as f:
-            f.write(content)
-
-    generate_letter_pages(summaries=summaries)
-
-    logger.info("Landscape processing finished")
\ No newline at end of file
+    started_tracing = False
+    # Closed and stopped however the run ends, so a failed run in a long-lived
+    # process leaves no open connection and no tracing slowdown behind
+    try:
+        etl = EtlStages(output_dir, cfg.featured_limit, tracker, report)
+        graph = etl.graph()
+        # Fail on unknown stage names before downloading anything
+        graph.select(only)
+
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        with report.stage("extract") as stage:
+            if stream:
+                landscape = LandscapeIndex.build(stream_landscape_data(input_path, cache_dir=dirs["cache"]))
+            else:
+                landscape = LandscapeIndex.build(get_landscape_data(input_path, cache_dir=dirs["cache"]))
+            stage.items += len(landscape)
+
+        # Fingerprint the landscape and diff it against the previous run
+        with report.stage("plan"):
+            state = EtlState.from_index(landscape, cfg.featured_limit)
+            diff = plan_incremental(dirs["cache"], state) if incremental else None
+            if diff is not None:
+                etl.previous = load_run(dirs["cache"])
+                etl.buckets = diff.buckets
+            sources = {"landscape": Artifact(landscape, state.digest())}
+            for letter in LETTERS:
+                sources[f"landscape.{letter}"] = Artifact(landscape, state.letters[letter])
+
+        result = graph.run(sources, workers=workers, only=only, previous=etl.previous, report=report)
+        logger.info(f"Ran {len(result.ran)} stages, skipped {len(result.skipped)} with unchanged inputs")
+
+        with report.stage("save_state"):
+            if only is None:
+                save_state(dirs["cache"], state)
+                save_run(dirs["cache"], result)
+            else:
+                # Outputs of a partial run are newer than the saved state: forget
+                # the keys of its stages so the next run does not skip them
+                saved = load_run(dirs["cache"])
+                if saved is not None:
+                    for name in result.ran:
+                        saved.keys.pop(name, None)
+                    save_run(dirs["cache"], saved)
+
+        report.save(dirs["extras"] / REPORT_FILE)
+        logger.info(
+            f"Landscape processing finished: {write_stats.written} files written, "
+            f"{write_stats.skipped} unchanged"
+        )
+    finally:
+        tracker.close()
+        if started_tracing:
+            tracemalloc.stop()
+    return write_stats
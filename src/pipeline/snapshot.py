@@ -0,0 +1,105 @@
+"""On-disk snapshot store for the upstream landscape document.
+
+Keeps the last downloaded ``landscape.yml`` together with its HTTP validators
+(ETag / Last-Modified) and content digest, so an unchanged upstream costs one
+conditional request; the digest then keys the parsed cache in ``cache.py``.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from src.logger import get_logger
+from src.pipeline.cache import content_digest
+
+logger = get_logger(__name__)
+
+REQUEST_TIMEOUT = 60
+
+
+@dataclass
+class Snapshot:
+    """Result of a conditional fetch."""
+    raw_path: Path
+    digest: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+
+class SnapshotStore:
+    """Snapshot cache for a remote landscape URL, rooted at ``cache_dir``."""
+
+    def __init__(self, cache_dir: Path):
+        self.root = Path(cache_dir) / "snapshots"
+
+    def _snapshot_dir(self, url: str) -> Path:
+        """Return the directory holding the snapshot for a URL."""
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        return self.root / key
+
+    def _read_meta(self, snapshot_dir: Path) -> dict:
+        meta_path = snapshot_dir / "meta.json"
+        if not meta_path.exists():
+            return {}
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_atomic(self, path: Path, content: bytes) -> None:
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+    def fetch(self, url: str) -> Snapshot:
+        """Fetch ``url``, revalidating the stored snapshot when there is one.
+
+        Sends If-None-Match / If-Modified-Since from the stored metadata; on a
+        304 the stored raw bytes are reused and nothing is downloaded.
+        """
+        snapshot_dir = self._snapshot_dir(url)
+        raw_path = snapshot_dir / "landscape.yml"
+        meta = self._read_meta(snapshot_dir) if raw_path.exists() else {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and meta:
+            logger.info(f"Upstream not modified since last snapshot ({url})")
+            return Snapshot(
+                raw_path=raw_path,
+                digest=meta.get("digest"),
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+                not_modified=True,
+            )
+        response.raise_for_status()
+
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(raw_path, response.content)
+        meta = {
+            "url": url,
+            "digest": content_digest(response.content),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        self._write_atomic(snapshot_dir / "meta.json", json.dumps(meta, indent=2).encode("utf-8"))
+        logger.info(f"Stored new landscape snapshot ({len(response.content)} bytes)")
+        return Snapshot(
+            raw_path=raw_path,
+            digest=meta["digest"],
+            etag=meta["etag"],
+            last_modified=meta["last_modified"],
+        )
@@ -0,0 +1,318 @@
+"""Declarative stage graph of the ETL and its parallel scheduler.
+
+A ``Stage`` names the artifacts it reads (``inputs``) and the artifacts it
+returns (``outputs``); the edges of the graph follow from which stage produces
+which artifact. ``StageGraph.run`` starts every stage as soon as the stages it
+depends on have finished, on a pool of worker threads, so independent stages
+(e.g. the index files, the stats and each letter's outputs) overlap.
+
+Every stage gets a key: a hash of its name and of the fingerprints of its
+inputs. An artifact's fingerprint is the one its stage returned with it (see
+``Artifact``), or else is derived from the key of the stage that produced it.
+Given a previous run, a stage whose key is unchanged is skipped and its
+outputs keep their previous fingerprints. A skipped stage is run anyway when a
+stage that does run needs the value of one of its outputs.
+"""
+
+import hashlib
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.logger import get_logger
+from src.pipeline.writer import write_if_changed
+
+logger = get_logger(__name__)
+
+KEYS_VERSION = 1
+KEYS_FILE = "etl_stages.json"
+
+
+def digest(*parts) -> str:
+    """sha1 of the JSON form of ``parts``."""
+    return hashlib.sha1(json.dumps(parts, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def stage_group(name: str) -> str:
+    """Group of a stage name: ``categories.A`` belongs to ``categories``."""
+    return name.split(".", 1)[0]
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """A stage output with an explicit content fingerprint."""
+    value: Any
+    fingerprint: str
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of a pipeline.
+
+    ``run`` is called with the values of ``inputs`` (in order) and returns
+    None when there are no outputs, or a dict holding a value (or an
+    ``Artifact``) for each output.
+    """
+    name: str
+    run: Callable[..., Optional[Dict[str, Any]]]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    # Stages that must finish first when both run, without passing data
+    after: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageRun:
+    """Outcome of ``StageGraph.run``."""
+    keys: Dict[str, str] = field(default_factory=dict)
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+    ran: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    values: Dict[str, Any] = field(default_factory=dict)
+
+
+class StageGraph:
+    """Validated set of stages, ordered by their inputs and outputs."""
+
+    def __init__(self, stages: Iterable[Stage], sources: Iterable[str] = ()):
+        """Check the stages and link them.
+
+        Args:
+            stages: Stages of the pipeline
+            sources: Artifacts provided by the caller of ``run``
+
+        Raises:
+            ValueError: On a duplicate stage, an artifact produced twice, an
+                input nobody produces, an unknown ``after`` stage or a cycle
+        """
+        self.stages: Dict[str, Stage] = {}
+        self.producers: Dict[str, str] = {}
+        self.sources = set(sources)
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage {stage.name!r}")
+            self.stages[stage.name] = stage
+            for output in stage.outputs:
+                if output in self.producers or output in self.sources:
+                    raise ValueError(f"Artifact {output!r} is produced more than once")
+                self.producers[output] = stage.name
+
+        self.dependencies: Dict[str, Set[str]] = {}
+        for stage in self.stages.values():
+            for name in stage.inputs:
+                if name not in self.producers and name not in self.sources:
+                    raise ValueError(f"Stage {stage.name!r} reads {name!r}, which no stage produces")
+            for name in stage.after:
+                if name not in self.stages:
+                    raise ValueError(f"Stage {stage.name!r} runs after unknown stage {name!r}")
+            self.dependencies[stage.name] = {
+                self.producers[name] for name in stage.inputs if name in self.producers
+            } | set(stage.after)
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        remaining = {name: len(deps) for name, deps in self.dependencies.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.stages}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        order = []
+        queue = [name for name in self.stages if remaining[name] == 0]
+        while queue:
+            name = queue.pop(0)
+            order.append(name)
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+        if len(order) != len(self.stages):
+            cycle = sorted(name for name in self.stages if name not in order)
+            raise ValueError(f"Stage graph has a cycle through {', '.join(cycle)}")
+        return order
+
+    def select(self, only: Optional[Iterable[str]] = None) -> Set[str]:
+        """Stages to run for ``only`` (stage names or groups), with every stage producing their inputs.
+
+        Raises:
+            ValueError: If a name matches no stage
+        """
+        if not only:
+            return set(self.stages)
+        selected = set()
+        for wanted in only:
+            matches = {name for name in self.stages if name == wanted or stage_group(name) == wanted}
+            if not matches:
+                groups = sorted({stage_group(name) for name in self.stages})
+                raise ValueError(f"Unknown stage {wanted!r}; stages: {', '.join(groups)}")
+            selected |= matches
+        queue = list(selected)
+        while queue:
+            for name in self.stages[queue.pop()].inputs:
+                producer = self.producers.get(name)
+                if producer is not None and producer not in selected:
+                    selected.add(producer)
+                    queue.append(producer)
+        return selected
+
+    def run(
+        self,
+        sources: Dict[str, Artifact],
+        workers: int = 1,
+        only: Optional[Iterable[str]] = None,
+        previous: Optional[StageRun] = None,
+        report=None
+    ) -> StageRun:
+        """Run the selected stages, each as soon as its dependencies are done.
+
+        Args:
+            sources: Value and fingerprint of each source artifact
+            workers: Number of stages running at once
+            only: Stage names or groups to run, with the stages they read from (default: all)
+            previous: An earlier run; stages whose key is unchanged are skipped
+            report: RunReport timing each stage under its group
+
+        Returns:
+            Keys, ran and skipped stages, and the artifacts produced
+
+        Raises:
+            Exception: The first error raised by a stage, once running stages have finished
+        """
+        return _Scheduler(self, sources, max(1, int(workers)), self.select(only), previous, report).run()
+
+
+class _Scheduler:
+    """State of one ``StageGraph.run``.
+
+    Each selected stage is skipped, or queued, run and done. A skipped stage is
+    queued again when a stage that runs needs one of its values.
+    """
+
+    def __init__(self, graph: StageGraph, sources: Dict[str, Artifact], workers: int, selected: Set[str],
+                 previous: Optional[StageRun], report):
+        self.graph = graph
+        self.workers = workers
+        self.selected = selected
+        self.previous = previous
+        self.report = report
+        self.result = StageRun(
+            fingerprints={name: artifact.fingerprint for name, artifact in sources.items()},
+            values={name: artifact.value for name, artifact in sources.items()},
+        )
+        self.fingerprints = self.result.fingerprints
+        self.undecided = [name for name in graph.order if name in selected]
+        self.status: Dict[str, str] = {}
+        # Stages whose output fingerprints are known
+        self.settled: Set[str] = set()
+        self.running: Dict[Future, str] = {}
+
+    def run(self) -> StageRun:
+        error = None
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="etl-stage") as pool:
+            while True:
+                if error is None:
+                    self._decide()
+                    self._submit_ready(pool)
+                if not self.running:
+                    break
+                done, _ = wait(list(self.running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = self.running.pop(future)
+                    try:
+                        outputs = future.result()
+                    except Exception as exc:
+                        logger.error(f"Stage {name} failed: {exc}")
+                        error = error or exc
+                        continue
+                    self._finish(name, outputs)
+        if error is not None:
+            raise error
+        self.result.skipped = [name for name in self.graph.order if self.status.get(name) == "skipped"]
+        return self.result
+
+    def _decide(self) -> None:
+        """Skip or queue every stage whose dependencies are settled."""
+        for name in list(self.undecided):
+            if any(dep in self.selected and dep not in self.settled for dep in self.graph.dependencies[name]):
+                continue
+            self.undecided.remove(name)
+            stage = self.graph.stages[name]
+            key = digest(name, [(input_name, self.fingerprints[input_name]) for input_name in stage.inputs])
+            self.result.keys[name] = key
+            if self.previous is not None and self.previous.keys.get(name) == key:
+                logger.info(f"Skipping stage {name}: inputs unchanged")
+                self.status[name] = "skipped"
+                for output in stage.outputs:
+                    self.fingerprints[output] = self.previous.fingerprints.get(output) or digest(key, output)
+                self.settled.add(name)
+                if self.report is not None:
+                    self.report.skip(stage_group(name))
+            else:
+                self._queue(name)
+
+    def _queue(self, name: str) -> None:
+        """Queue a stage, and queue again the skipped stages producing its inputs."""
+        self.status[name] = "queued"
+        for input_name in self.graph.stages[name].inputs:
+            producer = self.graph.producers.get(input_name)
+            if producer is not None and self.status.get(producer) == "skipped":
+                logger.info(f"Rerunning stage {producer}: {name} needs {input_name}")
+                self._queue(producer)
+
+    def _submit_ready(self, pool: ThreadPoolExecutor) -> None:
+        """Start every queued stage whose inputs have values and whose dependencies are not pending."""
+        for name in self.graph.order:
+            if self.status.get(name) != "queued":
+                continue
+            stage = self.graph.stages[name]
+            if any(self.status.get(dep) in ("queued", "running") for dep in self.graph.dependencies[name]):
+                continue
+            self.status[name] = "running"
+            args = [self.result.values[input_name] for input_name in stage.inputs]
+            self.running[pool.submit(self._call, stage, args)] = name
+
+    def _call(self, stage: Stage, args: list):
+        if self.report is None:
+            return stage.run(*args)
+        with self.report.stage(stage_group(stage.name), stage=stage.name):
+            return stage.run(*args)
+
+    def _finish(self, name: str, outputs: Optional[Dict[str, Any]]) -> None:
+        stage = self.graph.stages[name]
+        outputs = outputs or {}
+        # A skipped stage run again for its values keeps the fingerprints it was given
+        rerun = name in self.settled
+        for output in stage.outputs:
+            value = outputs.get(output)
+            fingerprint = digest(self.result.keys[name], output)
+            if isinstance(value, Artifact):
+                value, fingerprint = value.value, value.fingerprint
+            if not rerun:
+                self.fingerprints[output] = fingerprint
+            self.result.values[output] = value
+        self.status[name] = "done"
+        self.settled.add(name)
+        self.result.ran.append(name)
+
+
+def load_run(cache_dir: Path) -> Optional[StageRun]:
+    """Keys and fingerprints saved by an earlier run, or None if there are none."""
+    path = Path(cache_dir) / KEYS_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Ignoring unreadable stage keys {path}: {exc}")
+        return None
+    if raw.get("version") != KEYS_VERSION:
+        return None
+    return StageRun(keys=raw["keys"], fingerprints=raw["fingerprints"])
+
+
+def save_run(cache_dir: Path, run: StageRun) -> None:
+    """Persist the keys and fingerprints of a run for the next one."""
+    content = json.dumps({"version": KEYS_VERSION, "keys": run.keys, "fingerprints": run.fingerprints}, sort_keys=True)
+    write_if_changed(Path(cache_dir) / KEYS_FILE, content)
@@ -9,11 +9,11 @@ import glob
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
-import yaml
-
 from src.config import load_config, letter_from_week_id
+from src.serialization import dump_yaml, load_yaml
 
 
 def sanitize_for_filename(name: str) -> str:
@@ -32,9 +32,9 @@ def _get_week_dirs(cfg) -> list[Path]:
     return [Path(p) for p in glob.glob(str(cfg.weeks_dir / "*-*"))]
 
 
-@lru_cache(maxsize=1)
-def _get_project_data_cache() -> dict:
-    cfg = load_config()
+@lru_cache(maxsize=4)
+def _get_project_data_cache(weeks_dir: Optional[Path] = None) -> dict:
+    cfg = SimpleNamespace(weeks_dir=weeks_dir) if weeks_dir else load_config()
     cache = {}
     for week_dir in _get_week_dirs(cfg):
         categories_dir = week_dir / "categories"
@@ -43,7 +43,7 @@ def _get_project_data_cache() -> dict:
         for yaml_file in categories_dir.glob("*.yaml"):
             try:
                 with yaml_file.open("r", encoding="utf-8") as f:
-                    items = yaml.safe_load(f)
+                    items = load_yaml(f)
                     if items and isinstance(items, list):
                         for item in items:
                             name = item.get("name")
@@ -54,16 +54,16 @@ def _get_project_data_cache() -> dict:
     return cache
 
 
-def get_cncf_status_from_etl(project_name: str) -> str:
+def get_cncf_status_from_etl(project_name: str, weeks_dir: Optional[Path] = None) -> str:
     """Try to find CNCF status from ETL output files."""
-    cache = _get_project_data_cache()
+    cache = _get_project_data_cache(weeks_dir)
     if project_name in cache:
         return cache[project_name].get("project", "sandbox")
     return "sandbox"
 
 
-def _get_project_urls(project_name: str) -> dict:
-    cache = _get_project_data_cache()
+def _get_project_urls(project_name: str, weeks_dir: Optional[Path] = None) -> dict:
+    cache = _get_project_data_cache(weeks_dir)
     urls = {}
     if project_name in cache:
         item = cache[project_name]
@@ -74,20 +74,21 @@ def _get_project_urls(project_name: str) -> dict:
     return urls
 
 
-def generate_tool_page(research_file: Path, week_id_value: str) -> Optional[str]:
+def generate_tool_page(research_file: Path, week_id_value: str, weeks_dir: Optional[Path] = None) -> Optional[str]:
     """
     Generate a tool page from a research YAML file.
+    ETL output is looked up under ``weeks_dir`` (default: the configured weeks directory).
     """
     try:
         with research_file.open("r", encoding="utf-8") as f:
-            research = yaml.safe_load(f)
+            research = load_yaml(f)
 
         if not research:
             return None
 
         project_name = research.get("project_name", research_file.stem)
         letter = letter_from_week_id(week_id_value)
-        cncf_status = get_cncf_status_from_etl(project_name)
+        cncf_status = get_cncf_status_from_etl(project_name, weeks_dir)
 
         front_matter = {
             "title": project_name,
@@ -110,9 +111,9 @@ def generate_tool_page(research_file: Path, week_id_value: str) -> Optional[str]
             if key in research:
                 front_matter[key] = research[key]
 
-        front_matter.update(_get_project_urls(project_name))
+        front_matter.update(_get_project_urls(project_name, weeks_dir))
 
-        front_matter_yaml = yaml.dump(
+        front_matter_yaml = dump_yaml(
             front_matter, default_flow_style=False, allow_unicode=True
         )
 
@@ -129,9 +130,12 @@ This is an auto-generated tool page. For more details, see the [letter page](/le
         return None
 
 
-def generate_tool_pages() -> int:
-    """Generate all tool pages from research files."""
-    cfg = load_config()
+def generate_tool_pages(cfg=None) -> int:
+    """Generate all tool pages from research files.
+
+    ``cfg`` (default: the loaded config) provides ``weeks_dir`` and ``hugo_tools_dir``.
+    """
+    cfg = cfg or load_config()
     tools_content_dir = cfg.hugo_tools_dir
     tools_content_dir.mkdir(parents=True, exist_ok=True)
 
@@ -144,7 +148,7 @@ def generate_tool_pages() -> int:
         if not research_dir.exists():
             continue
         for research_file in research_dir.glob("*.yaml"):
-            page_content = generate_tool_page(research_file, week_id_value)
+            page_content = generate_tool_page(research_file, week_id_value, cfg.weeks_dir)
             if page_content:
                 output_file = tools_content_dir / f"{research_file.stem}.md"
                 with output_file.open("w", encoding="utf-8") as f:
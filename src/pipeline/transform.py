@@ -1,17 +1,31 @@
+import re
+from functools import lru_cache
+from typing import Iterable
 from src.logger import get_logger
+from src.pipeline.index import LandscapeIndex, as_index
 
 logger = get_logger(__name__)
 
+# One pass equivalent to the chained replaces " & " -> "_", " " -> "_",
+# "_-" -> "", "," -> "", "/" -> "_" (longest alternatives first)
+_PATH_REPLACEMENTS = {
+    " & -": "",
+    " -": "",
+    "_-": "",
+    " & ": "_",
+    " ": "_",
+    ",": "",
+    "/": "_",
+}
+_PATH_PATTERN = re.compile("|".join(re.escape(token) for token in _PATH_REPLACEMENTS))
+
+
+@lru_cache(maxsize=None)
 def make_path(c: str, s: str) -> str:
     """
     This function sanitize a category and subcategory name to make it a viable folder name
     """
-    return (c + "_" + s).lower() \
-        .replace(" & ", "_") \
-        .replace(" ", "_") \
-        .replace("_-", "") \
-        .replace(",", "") \
-        .replace("/", "_")
+    return _PATH_PATTERN.sub(lambda match: _PATH_REPLACEMENTS[match.group()], (c + "_" + s).lower())
 
 def _is_valid_item(item: dict) -> bool:
     """
@@ -19,26 +33,29 @@ def _is_valid_item(item: dict) -> bool:
     """
     return item.get('project') != 'archived' and item.get('repo_url') is not None
 
+# Featured ranking: lower rank wins, unknown statuses rank last
+STATUS_RANKS = {
+    'graduated': 0,
+    'incubating': 1,
+    'sandbox': 2
+}
+DEFAULT_STATUS_RANK = 3
+FEATURED_LIMIT = 6
+
+def _status_rank(project_status) -> int:
+    """
+    This function returns the integer featured rank of a CNCF project status (None counts as sandbox)
+    """
+    if project_status is None:
+        project_status = 'sandbox'
+    return STATUS_RANKS.get(project_status.lower(), DEFAULT_STATUS_RANK)
+
 def _get_featured_priority(item: dict) -> tuple:
     """
     This function returns a priority tuple for featured selection.
     Priority: graduated > incubating > sandbox (alphabetically within same status)
     """
-    project_status = item.get('project')
-    if project_status is None:
-        project_status = 'sandbox'
-    project_status = project_status.lower()
-    
-    status_priority = {
-        'graduated': 0,
-        'incubating': 1,
-        'sandbox': 2
-    }
-    
-    priority = status_priority.get(project_status, 3)
-    name = item.get('name', '')
-    
-    return (priority, name)
+    return (_status_rank(item.get('project')), item.get('name', ''))
 
 def _prepare_item_for_output(item: dict, is_featured: bool = False) -> dict:
     """
@@ -64,176 +81,187 @@ def _prepare_item_for_output(item: dict, is_featured: bool = False) -> dict:
     
     return output_item
 
-def get_items_without_repo_url(landscape: list) -> list:
+def get_items_without_repo_url(landscape: Iterable) -> list:
     """
     This function returns a list of all items in the landscape that do not have a repo_url
     """
+    index = as_index(landscape)
     return sorted([
-        item['name']
-        for c in landscape
-        for sub in (c.get('subcategories') or [])
-        for item in (sub.get('items') or [])
-        if item.get('repo_url') is None
+        name for name, repo_url in zip(index.names, index.repo_urls) if repo_url is None
     ])
 
-def get_only_letter(x: str, landscape: list) -> dict:
+def get_only_letter(x: str, landscape: Iterable) -> dict:
     """
-    This function gets the letter we want, not best performance but does the job
+    This function gets the items of every subcategory whose name starts with x,
+    reading only that letter's bucket of the landscape index.
+    Pass a LandscapeIndex when querying several letters so it is built once
     """
     logger.info(f"Filtering landscape data for letter {x}")
-    return {
-        make_path(c['name'], sub['name']): [
-            item for item in (sub.get('items') or []) if item['name'].startswith(x) and _is_valid_item(item)
-        ]
-        for c in landscape for sub in (c.get('subcategories') or [])
-    }
+    index = as_index(landscape)
+    partial = {path: [] for path in index.subcategory_paths}
+    for row in index.rows_for_letter(x):
+        partial[index.subcategory_paths[index.subcategory_ids[row]]].append(index.items[row])
+    return partial
 
-def get_tasks_for_letter(x: str, landscape: list) -> list:
+def get_tasks_for_letter(x: str, landscape: Iterable) -> list:
     """
-    This function returns a list of tasks (items) for a specific letter
+    This function returns a list of tasks (items) for a specific letter.
+    Pass a LandscapeIndex when querying several letters so it is built once
     """
     logger.info(f"Getting tasks for letter {x}")
-    tasks = []
-    for c in landscape:
-        for sub in (c.get('subcategories') or []):
-            for item in (sub.get('items') or []):
-                if item['name'].startswith(x) and _is_valid_item(item):
-                    tasks.append(item['name'])
-    return sorted(tasks)
+    index = as_index(landscape)
+    return sorted([index.names[row] for row in index.rows_for_letter(x)])
 
-def get_categories(landscape: list) -> dict:
+def get_categories(landscape: Iterable) -> dict:
     """
     This function gets the categories from the landscape data
     """
     logger.info("Getting categories from landscape data")
+    index = as_index(landscape)
     return {
-        c['name']: {
-            sub['name']: make_path(c['name'], sub['name'])
-            for sub in (c.get('subcategories') or [])
+        category: {
+            index.subcategories[sub_id]: index.subcategory_paths[sub_id]
+            for sub_id in index.category_subcategories[category_id]
         }
-        for c in landscape
+        for category_id, category in enumerate(index.categories)
     }
 
-def get_items(landscape: list) -> dict:
+def _valid_names(index: LandscapeIndex, sub_id: int) -> list:
+    """
+    This function returns the names of the valid items of a subcategory
+    """
+    return [index.names[row] for row in index.subcategory_rows[sub_id] if index.valid[row]]
+
+def get_items(landscape: Iterable) -> dict:
     """
     This function gets the items from the landscape data
     """
     logger.info("Getting items from landscape data")
+    index = as_index(landscape)
     return {
-        c['name']: {
-            sub['name']: [
-                item['name'] for item in (sub.get('items') or []) if _is_valid_item(item)
-            ]
-            for sub in (c.get('subcategories') or [])
+        category: {
+            index.subcategories[sub_id]: _valid_names(index, sub_id)
+            for sub_id in index.category_subcategories[category_id]
         }
-        for c in landscape
+        for category_id, category in enumerate(index.categories)
     }
 
-def get_all_categories(landscape: list) -> list:
+def get_all_categories(landscape: Iterable) -> list:
     """
     This function gets all the categories from the landscape data
     """
     logger.info("Getting all categories from landscape data")
+    index = as_index(landscape)
     return [{
-        'category': c['name'],
+        'category': category,
         'subcategories': [{
-            'subcategory': sub['name'],
-            'path': make_path(c['name'], sub['name']),
-            'items': [
-                item['name'] for item in (sub.get('items') or []) if _is_valid_item(item)
-            ]
-        } for sub in (c.get('subcategories') or [])]
-    } for c in landscape]
+            'subcategory': index.subcategories[sub_id],
+            'path': index.subcategory_paths[sub_id],
+            'items': _valid_names(index, sub_id)
+        } for sub_id in index.category_subcategories[category_id]]
+    } for category_id, category in enumerate(index.categories)]
 
-def get_stats_per_category(landscape: list) -> dict:
+def get_stats_per_category(landscape: Iterable) -> dict:
     """
     This function gets the stats per category from the landscape data
     """
     logger.info("Getting stats per category from landscape data")
-    return {c['name']: len((c.get('subcategories') or [])) for c in landscape}
+    index = as_index(landscape)
+    return {
+        category: len(index.category_subcategories[category_id])
+        for category_id, category in enumerate(index.categories)
+    }
 
-def get_stats_per_category_per_week(landscape: list) -> dict:
+def get_stats_per_category_per_week(landscape: Iterable) -> dict:
     """
     This function gets the stats per category per week from the landscape data
     """
     logger.info("Getting stats per category per week from landscape data")
-    stats_per_category = {c['name']: len((c.get('subcategories') or [])) for c in landscape}
+    index = as_index(landscape)
+    stats_per_category = {
+        category: len(index.category_subcategories[category_id])
+        for category_id, category in enumerate(index.categories)
+    }
     return {
         f"week_{str(index).zfill(2)}_{chr(letter)}": stats_per_category.copy()
         for index, letter in enumerate(range(ord('A'), ord('Z') + 1))
     }
 
-def get_stats_by_status(landscape: list) -> dict:
+def get_stats_by_status(landscape: Iterable) -> dict:
     """
     This function gets the stats by status from the landscape data
     """
     logger.info("Getting stats by status from landscape data")
+    index = as_index(landscape)
     stats = {}
-    for c in landscape:
-        for sub in (c.get('subcategories') or []):
-            for item in (sub.get('items') or []):
-                if not _is_valid_item(item):
-                    continue
-                status = item.get('project')
-                if status:
-                    stats[status] = stats.get(status, 0) + 1
+    for status_code, valid in zip(index.status_codes, index.valid):
+        if not valid:
+            continue
+        status = index.statuses[status_code]
+        if status:
+            stats[status] = stats.get(status, 0) + 1
     return stats
 
-def get_landscape_by_letter(landscape: list) -> dict:
+def get_landscape_by_letter(landscape: Iterable, featured_limit: int = FEATURED_LIMIT, letters: Iterable[str] = None) -> dict:
     """
     This function processes the landscape once and returns data for all letters.
     Returns a dict { 'A': {'partial': {...}, 'tasks': [...]}, ... }
-    Includes featured flag (top 6 items per category based on CNCF status).
+    Includes featured flag (top ``featured_limit`` items per category based on CNCF status).
+    With ``letters`` only those letters are computed and returned.
     """
     logger.info("Indexing landscape data by letter")
     index = {}
 
     # Initialize index for all letters A-Z
+    wanted = set(letters) if letters is not None else None
     for letter_code in range(ord('A'), ord('Z') + 1):
         letter = chr(letter_code)
+        if wanted is not None and letter not in wanted:
+            continue
         index[letter] = {
             'partial': {},
             'tasks': []
         }
 
-    # Pre-calculate all paths
-    all_paths = [
-        make_path(c['name'], sub['name'])
-        for c in landscape for sub in (c.get('subcategories') or [])
-    ]
-
-    # Iterate landscape once, collecting by letter and path
-    for c in landscape:
-        for sub in (c.get('subcategories') or []):
-            path = make_path(c['name'], sub['name'])
-            # Group items by first letter
-            items_by_letter = {}
-            for item in (sub.get('items') or []):
-                if _is_valid_item(item):
-                    name = item['name']
-                    if not name:
-                        continue
-                    first_char = name[0]
-                    if 'A' <= first_char <= 'Z':
-                        if first_char not in items_by_letter:
-                            items_by_letter[first_char] = []
-                        items_by_letter[first_char].append(item)
-            
-            # For each letter, sort items and mark top 6 as featured
-            for letter, letter_items in items_by_letter.items():
-                # Sort by featured priority (status then alphabetically)
-                sorted_items = sorted(letter_items, key=_get_featured_priority)
-                
-                # Mark top 6 as featured
-                for idx, item in enumerate(sorted_items):
-                    is_featured = idx < 6
-                    prepared_item = _prepare_item_for_output(item, is_featured)
-
-                    if path not in index[letter]['partial']:
-                        index[letter]['partial'][path] = []
-
-                    index[letter]['partial'][path].append(prepared_item)
-                    index[letter]['tasks'].append(item['name'])
+    landscape_index = as_index(landscape)
+    # Status ranks are resolved once per distinct status, not once per comparison
+    ranks = [_status_rank(status) for status in landscape_index.statuses]
+    names = landscape_index.names
+    status_codes = landscape_index.status_codes
+    if wanted is None:
+        subcategory_rows = enumerate(landscape_index.subcategory_rows)
+    else:
+        # Only visit the rows of the wanted letters, grouped by subcategory
+        rows_by_subcategory = {}
+        for letter in index:
+            for row in landscape_index.letter_rows.get(letter, ()):
+                rows_by_subcategory.setdefault(landscape_index.subcategory_ids[row], []).append(row)
+        subcategory_rows = sorted(rows_by_subcategory.items())
+    for sub_id, rows in subcategory_rows:
+        path = landscape_index.subcategory_paths[sub_id]
+        # One stable sort per subcategory by (status rank, name); grouping the
+        # sorted rows by first letter leaves every letter bucket in the same
+        # order as sorting it on its own
+        ranked_rows = sorted(
+            (row for row in rows
+             if landscape_index.valid[row] and landscape_index.letters[row] in index),
+            key=lambda row: (ranks[status_codes[row]], names[row]),
+        )
+        featured_left = {}
+        for row in ranked_rows:
+            letter = landscape_index.letters[row]
+            item = landscape_index.items[row]
+            # The first featured_limit items of each bucket are featured
+            remaining = featured_left.get(letter, featured_limit)
+            featured_left[letter] = remaining - 1
+            prepared_item = _prepare_item_for_output(item, remaining > 0)
+
+            partial = index[letter]['partial']
+            if path not in partial:
+                partial[path] = []
+
+            partial[path].append(prepared_item)
+            index[letter]['tasks'].append(item['name'])
 
     # Sort tasks
     for letter in index:
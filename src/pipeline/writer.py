@@ -0,0 +1,110 @@
+"""Write-if-changed output layer for the ETL.
+
+Every output is rendered to memory first and compared with the file already on
+disk; unchanged files are left alone so their mtimes, Hugo's build cache and
+``git status`` stay quiet. Changed files are replaced atomically through a
+temporary file in the same directory. A shared ``WriteStats`` counts written
+and skipped files for the run summary.
+"""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+from src.logger import get_logger
+from src.serialization import dump_yaml
+
+logger = get_logger(__name__)
+
+
+def _read_umask() -> int:
+    # os.umask can only be read by setting it; done once at import, before any writer thread runs
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+class WriteStats:
+    """Thread-safe counters of written and skipped (unchanged) files.
+
+    Counts recorded on a WriteStats with a ``parent`` are recorded on the parent too,
+    so a run can keep per-stage counters next to its totals.
+    """
+
+    def __init__(self, parent: Optional["WriteStats"] = None):
+        self.written = 0
+        self.skipped = 0
+        self.parent = parent
+        self._lock = threading.Lock()
+
+    def record(self, written: bool) -> None:
+        with self._lock:
+            if written:
+                self.written += 1
+            else:
+                self.skipped += 1
+        if self.parent is not None:
+            self.parent.record(written)
+
+    def __repr__(self) -> str:
+        return f"WriteStats(written={self.written}, skipped={self.skipped})"
+
+
+def _is_unchanged(path: Path, content: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(content):
+            return False
+        return path.read_bytes() == content
+    except FileNotFoundError:
+        return False
+
+
+def _file_mode(path: Path) -> int:
+    """Mode for a new version of ``path``: the existing file's, or what ``open`` would give a new one."""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def write_if_changed(path: Union[str, Path], content: Union[str, bytes], stats: Optional[WriteStats] = None) -> bool:
+    """Atomically write ``content`` to ``path`` unless the file already holds it.
+
+    The file keeps its permissions; a new file gets the usual ``0o666 & ~umask``
+    rather than the 0600 of the temporary file.
+
+    Returns True when the file was written and False when it was skipped.
+    """
+    path = Path(path)
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    if _is_unchanged(path, content):
+        logger.debug(f"Unchanged, skipping {path}")
+        written = False
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                os.fchmod(f.fileno(), _file_mode(path))
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        written = True
+
+    if stats is not None:
+        stats.record(written)
+    return written
+
+
+def write_yaml_if_changed(path: Union[str, Path], data, stats: Optional[WriteStats] = None) -> bool:
+    """Serialize ``data`` with ``dump_yaml`` and write it only if it changed."""
+    return write_if_changed(path, dump_yaml(data), stats)
@@ -0,0 +1,56 @@
+"""Shared YAML serialization for the ETL, tracker and agentic layers.
+
+Uses PyYAML's libyaml bindings (``CSafeLoader`` / ``CSafeDumper``) when they are
+available and falls back to the pure-Python classes otherwise.
+
+Loading is identical on both paths. Dumping is byte-identical except for one
+emitter difference: libyaml folds long double-quoted scalars differently. Only
+strings containing characters outside printable ASCII are double-quoted, so
+documents containing such strings are emitted by the pure-Python dumper to keep
+committed data stable.
+"""
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as _FastDumper
+    HAS_LIBYAML = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper as _FastDumper
+    HAS_LIBYAML = False
+
+PySafeLoader = yaml.SafeLoader
+PySafeDumper = yaml.SafeDumper
+
+
+def _is_fast_emitter_safe(data: Any) -> bool:
+    """Return True when libyaml emits ``data`` byte-identically to PyYAML."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            if not (node.isascii() and node.isprintable()):
+                return False
+        elif isinstance(node, dict):
+            stack.extend(node.keys())
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return True
+
+
+def load_yaml(stream) -> Any:
+    """Parse a YAML document from a string, bytes or file object."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any, stream=None, **kwargs):
+    """Serialize ``data`` to YAML with the same output as ``yaml.dump``.
+
+    Accepts the same keyword arguments as ``yaml.dump``. Returns the document
+    as a string when ``stream`` is None.
+    """
+    dumper = _FastDumper if HAS_LIBYAML and _is_fast_emitter_safe(data) else PySafeDumper
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
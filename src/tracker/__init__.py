@@ -16,6 +16,11 @@ Example usage:
     >>> tracker.update_task('A', 'MyProject', 'research', TaskStatus.COMPLETED,
     ...                    output_file='research/myproject.yaml')
     >>> 
+    >>> # Update many tasks with a single write
+    >>> with tracker.batch('A') as batch:
+    ...     for name in items:
+    ...         batch.update_task(name, 'research', TaskStatus.SKIPPED)
+    >>> 
     >>> # Check progress
     >>> progress = tracker.get_progress('A')
     >>> print(f"Completed {progress.completed}/{progress.total} tasks")
@@ -23,6 +28,8 @@ Example usage:
 
 from src.tracker.interface import TrackerBackend
 from src.tracker.yaml_backend import YAMLTrackerBackend
+from src.tracker.sqlite_backend import SQLiteTrackerBackend
+from src.tracker.journal_backend import JournaledTrackerBackend
 from src.tracker.models import (
     TaskStatus,
     TaskRecord,
@@ -31,13 +38,19 @@ from src.tracker.models import (
     WeekTracker,
     TaskProgress,
     ReadyTask,
+    TaskUpdate,
+    TaskEvent,
 )
+from src.tracker.batch import TaskBatch
 from src.tracker.config import (
     TaskTypeConfig,
+    TaskGraph,
     TASK_TYPES,
+    TASK_GRAPH,
     DEFAULT_ITEM_TASKS,
     DEFAULT_WEEK_TASKS,
     get_task_config,
+    get_dependents,
     is_valid_task_type,
 )
 from src.tracker.exceptions import (
@@ -46,6 +59,8 @@ from src.tracker.exceptions import (
     InvalidTaskTypeError,
     ItemNotFoundError,
     WeekNotFoundError,
+    TrackerConflictError,
+    DependencyCycleError,
 )
 
 
@@ -53,7 +68,7 @@ def get_tracker(backend_type: str = "yaml", config=None) -> TrackerBackend:
     """Get a tracker backend instance.
     
     Args:
-        backend_type: Type of backend to use ('yaml' is currently supported)
+        backend_type: Type of backend to use ('yaml', 'sqlite' or 'journal')
         config: Optional config to use instead of loading from environment
         
     Returns:
@@ -64,6 +79,10 @@ def get_tracker(backend_type: str = "yaml", config=None) -> TrackerBackend:
     """
     if backend_type == "yaml":
         return YAMLTrackerBackend(config)
+    elif backend_type == "sqlite":
+        return SQLiteTrackerBackend(config)
+    elif backend_type == "journal":
+        return JournaledTrackerBackend(config)
     else:
         raise ValueError(f"Unsupported backend type: {backend_type}")
 
@@ -82,13 +101,19 @@ __all__ = [
     "WeekTasks",
     "WeekTracker",
     "TaskProgress",
+    "TaskUpdate",
+    "TaskBatch",
+    "TaskEvent",
     
     # Config
     "TaskTypeConfig",
+    "TaskGraph",
     "TASK_TYPES",
+    "TASK_GRAPH",
     "DEFAULT_ITEM_TASKS",
     "DEFAULT_WEEK_TASKS",
     "get_task_config",
+    "get_dependents",
     "is_valid_task_type",
     
     # Exceptions
@@ -97,7 +122,11 @@ __all__ = [
     "InvalidTaskTypeError",
     "ItemNotFoundError",
     "WeekNotFoundError",
+    "TrackerConflictError",
+    "DependencyCycleError",
     
     # Backends
     "YAMLTrackerBackend",
+    "SQLiteTrackerBackend",
+    "JournaledTrackerBackend",
 ]
@@ -0,0 +1,44 @@
+"""Batched tracker updates."""
+
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from src.tracker.models import TaskStatus, TaskUpdate
+
+
+class TaskBatch:
+    """Status transitions queued inside a ``tracker.batch(week_letter)`` block.
+
+    Mirrors ``update_task`` without the week letter. Nothing is persisted until
+    the block exits; the backend then applies every queued update with a single
+    ``update_tasks`` call.
+    """
+
+    def __init__(self, week_letter: str):
+        self.week_letter = week_letter
+        self.updates: List[TaskUpdate] = []
+
+    def update_task(
+        self,
+        item: Optional[str],
+        task_type: str,
+        status: TaskStatus,
+        **metadata
+    ) -> None:
+        """Queue a status update (see ``TrackerBackend.update_task``)."""
+        self.updates.append(TaskUpdate(item=item, task_type=task_type, status=status, metadata=metadata))
+
+    def __len__(self) -> int:
+        return len(self.updates)
+
+
+@contextmanager
+def batch_updates(backend, week_letter: str) -> Iterator[TaskBatch]:
+    """Collect updates for ``week_letter`` and apply them on exit.
+
+    If the block raises, the queued updates are discarded.
+    """
+    batch = TaskBatch(week_letter)
+    yield batch
+    if batch.updates:
+        backend.update_tasks(week_letter, batch.updates)
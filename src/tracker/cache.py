@@ -0,0 +1,169 @@
+"""In-process cache of parsed tracker files."""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from src.tracker.models import WeekTracker
+
+DEFAULT_MAXSIZE = 32
+
+FileSignature = Tuple[int, int, int, int]
+
+
+class CacheInfo(NamedTuple):
+    """Hit/miss statistics, shaped like ``functools.lru_cache``'s cache_info()."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def file_signature(path: Path) -> Optional[FileSignature]:
+    """Return (inode, size, mtime_ns, ctime_ns) of a file, or None if it is missing.
+
+    Trackers are replaced atomically through a temp file, so every save also
+    changes the inode; size and timestamps catch in-place edits.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def dump_tracker(tracker: WeekTracker) -> Dict[str, Any]:
+    """Snapshot a tracker as the JSON-compatible data it is saved as."""
+    return tracker.model_dump(mode='json')
+
+
+def restore_tracker(data: Dict[str, Any]) -> WeekTracker:
+    """Rebuild a tracker from ``dump_tracker`` output, sharing nothing with ``data``.
+
+    The data came from a valid tracker, so validation cannot fail; it is used
+    because pydantic-core builds the models about twice as fast as copying
+    them with ``model_construct``/``model_copy`` in Python.
+    """
+    tracker = WeekTracker.model_validate(data)
+    # Validation keeps the objects nested inside Dict[str, Any] fields
+    tracker.metadata = copy.deepcopy(data["metadata"])
+    return tracker
+
+
+def copy_tracker(tracker: WeekTracker) -> WeekTracker:
+    """Copy a tracker down to its TaskRecords."""
+    return restore_tracker(dump_tracker(tracker))
+
+
+class TrackerCache:
+    """LRU cache of WeekTracker objects keyed by tracker file path.
+
+    An entry is only served while the file still has the signature it had when
+    the entry was stored. Entries are kept as ``dump_tracker`` data and every
+    hit is rebuilt with ``restore_tracker``, so callers can mutate what they
+    get without corrupting the cache, and hits equal what a re-read returns.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[FileSignature, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, signature: Optional[FileSignature]) -> Optional[WeekTracker]:
+        """Return a fresh copy of the cached tracker if ``signature`` still matches."""
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or signature is None or entry[0] != signature:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            data = entry[1]
+        return restore_tracker(data)
+
+    def put(self, path: Path, signature: Optional[FileSignature], tracker: WeekTracker) -> None:
+        """Store a snapshot of ``tracker`` as the content of ``path`` at ``signature``."""
+        if signature is None or self.maxsize <= 0:
+            return
+        key = str(path)
+        data = dump_tracker(tracker)
+        with self._lock:
+            self._entries[key] = (signature, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+class LiveTrackerCache:
+    """LRU cache of WeekTracker objects that writers advance in place.
+
+    Unlike ``TrackerCache``, an entry is the tracker object itself. A writer
+    ``take``s it out of the cache, applies its changes and ``put``s it back
+    under the signature of what it wrote, so a write costs no dump or rebuild
+    of the whole week. Readers only ever get copies, and never see a tracker
+    a writer is holding.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Any, WeekTracker]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, path: Path, signature) -> Optional[WeekTracker]:
+        """Remove and return the tracker stored for ``signature``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.pop(str(path), None)
+        if entry is None or signature is None or entry[0] != signature:
+            return None
+        return entry[1]
+
+    def copy(self, path: Path, signature) -> Optional[WeekTracker]:
+        """Return a copy of the tracker stored for ``signature``, or None on a miss."""
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or signature is None or entry[0] != signature:
+                return None
+            self._entries.move_to_end(key)
+            return copy_tracker(entry[1])
+
+    def put(self, path: Path, signature, tracker: WeekTracker) -> None:
+        """Hand ``tracker`` to the cache as the state of ``path`` at ``signature``."""
+        if signature is None or self.maxsize <= 0:
+            return
+        key = str(path)
+        with self._lock:
+            self._entries[key] = (signature, tracker)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every YAMLTrackerBackend in the process; get_tracker() builds a new
+# backend per call, so a per-instance cache would rarely be hit
+tracker_cache = TrackerCache()
+# Folded trackers of the journaled backend, shared the same way
+live_tracker_cache = LiveTrackerCache()
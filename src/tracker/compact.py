@@ -0,0 +1,184 @@
+"""Compact, array-backed view of the task statuses of a week.
+
+A ``WeekTracker`` holds a pydantic ``ItemTasks`` per item and a ``TaskRecord``
+per task. Scans that only need statuses (pending items, dependency checks,
+ready-index builds, progress counts) read a ``CompactWeek`` instead: interned
+item names and one ``uint8`` status array per task type. Backends build it
+once per tracker state and keep it in a cache keyed by file signature;
+pydantic models are only materialized for callers of ``load_tracker`` and for
+writes.
+"""
+
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.tracker.config import TASK_GRAPH
+from src.tracker.models import TaskStatus, WeekTracker
+
+STATUSES = tuple(TaskStatus)
+STATUS_CODES = {status.value: code for code, status in enumerate(STATUSES)}
+PENDING = STATUS_CODES[TaskStatus.PENDING.value]
+COMPLETED = STATUS_CODES[TaskStatus.COMPLETED.value]
+IN_PROGRESS = STATUS_CODES[TaskStatus.IN_PROGRESS.value]
+# Status code of an item without a record for the task type
+NO_TASK = 255
+
+DEFAULT_MAXSIZE = 32
+
+
+def _status_code(status) -> int:
+    return STATUS_CODES[TaskStatus(status).value]
+
+
+class CompactWeek:
+    """Statuses of one week's tasks in flat arrays.
+
+    Item ``i`` of ``names`` has its status for a task type at
+    ``status[task_type][i]``. Read-only once built.
+    """
+
+    __slots__ = ("names", "positions", "removed", "status", "week_status")
+
+    def __init__(self, names: List[str]):
+        self.names = [sys.intern(name) for name in names]
+        self.positions = {name: position for position, name in enumerate(self.names)}
+        self.removed = bytearray(len(names))
+        self.status: Dict[str, array] = {}
+        # Week-level tasks are a handful per week: task_type -> status code
+        self.week_status: Dict[str, int] = {}
+
+    @classmethod
+    def from_tracker(cls, tracker: WeekTracker) -> "CompactWeek":
+        """Build the compact form of a tracker."""
+        week = cls(list(tracker.items))
+        size = len(week.names)
+        for position, item_tasks in enumerate(tracker.items.values()):
+            week.removed[position] = item_tasks.removed
+            for task_type, record in item_tasks.tasks.items():
+                if task_type not in week.status:
+                    week.status[task_type] = array('B', bytes([NO_TASK]) * size)
+                week.status[task_type][position] = _status_code(record.status)
+        for task_type, record in tracker.week_tasks.tasks.items():
+            week.week_status[task_type] = _status_code(record.status)
+        return week
+
+    def dependencies_met(self, item: Optional[str], task_type: str) -> bool:
+        """Same rules as the backends' _check_dependencies."""
+        dependencies = TASK_GRAPH.dependencies[task_type]
+        if item is None or task_type in TASK_GRAPH.week_task_types:
+            return all(self.unmet(dep) == 0 for dep in dependencies)
+        position = self.positions.get(item)
+        if position is None:
+            return False
+        return all(self._code(dep, position) == COMPLETED for dep in dependencies)
+
+    def unmet(self, task_type: str) -> int:
+        """Number of active items whose task of ``task_type`` is not completed."""
+        codes = self.status.get(task_type)
+        active = len(self.names) - sum(self.removed)
+        if codes is None:
+            return active
+        completed = sum(
+            1 for position, code in enumerate(codes) if code == COMPLETED and not self.removed[position]
+        )
+        return active - completed
+
+    def ready_items(self, task_type: str) -> Iterator[str]:
+        """Active items whose task is pending with its dependencies completed, in item order."""
+        codes = self.status.get(task_type)
+        if codes is None:
+            return
+        removed = self.removed
+        if task_type in TASK_GRAPH.week_task_types:
+            # Fan-in dependencies are the same for every item
+            if not self.dependencies_met(None, task_type):
+                return
+            dependencies = []
+        else:
+            dependencies = [self.status.get(dep) for dep in TASK_GRAPH.dependencies[task_type]]
+            if any(dep is None for dep in dependencies):
+                return
+        for position, code in enumerate(codes):
+            if code != PENDING or removed[position]:
+                continue
+            if all(dep[position] == COMPLETED for dep in dependencies):
+                yield self.names[position]
+
+    def items_with_status(self, task_type: str, status: TaskStatus) -> Iterator[str]:
+        """Active items whose task of ``task_type`` has ``status``, in item order."""
+        codes = self.status.get(task_type)
+        if codes is None:
+            return
+        data, code = codes.tobytes(), bytes([_status_code(status)])
+        position = data.find(code)
+        while position != -1:
+            if not self.removed[position]:
+                yield self.names[position]
+            position = data.find(code, position + 1)
+
+    def count_progress(self) -> Dict[str, Dict[str, int]]:
+        """Task records by task type and status, over active items and week-level tasks."""
+        counters: Dict[str, Dict[str, int]] = {}
+        for task_type, codes in self.status.items():
+            tallies = [0] * len(STATUSES)
+            removed = self.removed
+            for position, code in enumerate(codes):
+                if code != NO_TASK and not removed[position]:
+                    tallies[code] += 1
+            by_status = {STATUSES[code].value: n for code, n in enumerate(tallies) if n}
+            if by_status:
+                counters[task_type] = by_status
+        for task_type, code in self.week_status.items():
+            by_status = counters.setdefault(task_type, {})
+            by_status[STATUSES[code].value] = by_status.get(STATUSES[code].value, 0) + 1
+        return counters
+
+    def _code(self, task_type: str, position: int) -> int:
+        codes = self.status.get(task_type)
+        return NO_TASK if codes is None else codes[position]
+
+
+class CompactCache:
+    """CompactWeek objects keyed by tracker path and the signature of its state.
+
+    Entries are shared, not copied: a CompactWeek is never modified after it
+    is built.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Any, CompactWeek]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, signature) -> Optional[CompactWeek]:
+        """Return the cached CompactWeek if ``signature`` still matches."""
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or signature is None or entry[0] != signature:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, path: Path, signature, week: CompactWeek) -> None:
+        """Store ``week`` as the state of ``path`` at ``signature``."""
+        if signature is None or self.maxsize <= 0:
+            return
+        key = str(path)
+        with self._lock:
+            self._entries[key] = (signature, week)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every backend in the process, like the tracker cache
+compact_cache = CompactCache()
@@ -1,8 +1,12 @@
 """Task type configuration and definitions."""
 
-from typing import List, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from pydantic import BaseModel, Field
 
+from src.tracker.exceptions import DependencyCycleError, InvalidTaskTypeError
+
 
 class TaskTypeConfig(BaseModel):
     """Configuration for a task type."""
@@ -49,6 +53,95 @@ TASK_TYPES: dict[str, TaskTypeConfig] = {
     "blog_post": TASK_TYPE_BLOG_POST,
 }
 
+
+@dataclass(frozen=True)
+class TaskGraph:
+    """Task type dependency DAG, compiled once from the task type configurations.
+    
+    Edges point from a task type to the task types it depends on. For an
+    item-level task they refer to the same item; for a week-level task they
+    fan in from every active item of the week.
+    """
+    dependencies: Mapping[str, Tuple[str, ...]]
+    dependents: Mapping[str, Tuple[str, ...]]
+    levels: Tuple[Tuple[str, ...], ...]
+    depth: Mapping[str, int]
+    item_task_types: Tuple[str, ...]
+    week_task_types: Tuple[str, ...]
+    
+    @classmethod
+    def compile(cls, task_types: Mapping[str, TaskTypeConfig]) -> "TaskGraph":
+        """Validate task type configurations and build the graph.
+        
+        Args:
+            task_types: Task type configurations by name
+            
+        Returns:
+            TaskGraph of the task types
+            
+        Raises:
+            InvalidTaskTypeError: If a task type depends on an undefined one, or
+                an item-level task type on a week-level one
+            DependencyCycleError: If the dependencies form a cycle
+        """
+        dependencies = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in task_types}
+        for name, config in task_types.items():
+            for dep in config.depends_on:
+                if dep not in task_types:
+                    raise InvalidTaskTypeError(f"Task type '{name}' depends on unknown task type '{dep}'")
+                if task_types[dep].is_week_level and not config.is_week_level:
+                    raise InvalidTaskTypeError(
+                        f"Item-level task type '{name}' cannot depend on week-level task type '{dep}'"
+                    )
+                dependents[dep].append(name)
+            dependencies[name] = tuple(config.depends_on)
+        
+        # Kahn's algorithm, one level at a time
+        remaining = {name: len(set(deps)) for name, deps in dependencies.items()}
+        level = [name for name, count in remaining.items() if count == 0]
+        levels, level_of = [], {}
+        while level:
+            levels.append(tuple(level))
+            next_level = []
+            for name in level:
+                level_of[name] = len(levels) - 1
+                for dependent in dict.fromkeys(dependents[name]):
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_level.append(dependent)
+            level = next_level
+        if len(level_of) < len(task_types):
+            cycle = sorted(name for name in task_types if name not in level_of)
+            raise DependencyCycleError(f"Task type dependencies form a cycle through: {', '.join(cycle)}")
+        
+        # Longest chain of dependents below each task type, for critical-path ordering
+        depth = {}
+        for level in reversed(levels):
+            for name in level:
+                depth[name] = max((depth[dependent] + 1 for dependent in dependents[name]), default=0)
+        
+        return cls(
+            dependencies=MappingProxyType(dependencies),
+            dependents=MappingProxyType({name: tuple(names) for name, names in dependents.items()}),
+            levels=tuple(levels),
+            depth=MappingProxyType(depth),
+            item_task_types=tuple(name for name, config in task_types.items() if not config.is_week_level),
+            week_task_types=tuple(name for name, config in task_types.items() if config.is_week_level),
+        )
+    
+    def topological_order(self) -> List[str]:
+        """Task types with every dependency before its dependents."""
+        return [name for level in self.levels for name in level]
+    
+    def schedule_key(self, task_type: str) -> Tuple[int, str]:
+        """Sort key putting the task types on the critical path (longest chain of dependents) first."""
+        return (-self.depth.get(task_type, 0), task_type)
+
+
+# Compiled at import so a broken configuration fails fast
+TASK_GRAPH = TaskGraph.compile(TASK_TYPES)
+
 # Default item-level tasks (tasks to initialize for each new item)
 DEFAULT_ITEM_TASKS = ["research", "content"]
 
@@ -81,3 +174,15 @@ def is_valid_task_type(task_type: str) -> bool:
         True if task type exists, False otherwise
     """
     return task_type in TASK_TYPES
+
+
+def get_dependents(task_type: str) -> List[str]:
+    """Get the task types that depend on a task type.
+    
+    Args:
+        task_type: Name of the task type
+        
+    Returns:
+        Names of the task types listing it in depends_on
+    """
+    return list(TASK_GRAPH.dependents.get(task_type, ()))
@@ -24,3 +24,13 @@ class ItemNotFoundError(TrackerError):
 class WeekNotFoundError(TrackerError):
     """Raised when a week's tracker data is not found."""
     pass
+
+
+class TrackerConflictError(TrackerError):
+    """Raised when a tracker changed on disk since it was loaded."""
+    pass
+
+
+class DependencyCycleError(InvalidTaskTypeError):
+    """Raised when task type dependencies form a cycle."""
+    pass
@@ -1,7 +1,8 @@
 """Protocol interface for tracker backends."""
 
-from typing import Protocol, List, Dict, Any, Optional
-from src.tracker.models import WeekTracker, TaskProgress, TaskStatus
+from typing import Protocol, List, Dict, Any, ContextManager, Iterable, Optional
+from src.tracker.models import WeekTracker, TaskProgress, TaskStatus, TaskUpdate, ReadyTask
+from src.tracker.batch import TaskBatch
 
 
 class TrackerBackend(Protocol):
@@ -83,6 +84,79 @@ class TrackerBackend(Protocol):
         """
         ...
     
+    def update_tasks(self, week_letter: str, updates: Iterable[TaskUpdate]) -> None:
+        """Apply several task updates atomically.
+        
+        Updates are applied in order against one view of the tracker and
+        persisted together; if any of them fails, none is persisted.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            updates: TaskUpdate objects to apply
+            
+        Raises:
+            ItemNotFoundError: If an item doesn't exist
+            InvalidTaskTypeError: If a task type is invalid
+            DependencyNotMetError: If trying to start a task with unmet dependencies
+        """
+        ...
+    
+    def batch(self, week_letter: str) -> ContextManager[TaskBatch]:
+        """Collect updates in a ``with`` block and apply them with update_tasks on exit.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            
+        Returns:
+            Context manager yielding a TaskBatch; updates are discarded if the block raises
+        """
+        ...
+    
+    def claim_ready_tasks(
+        self,
+        agent: Optional[str] = None,
+        n: int = 1,
+        lease_seconds: float = 900,
+        worker_id: Optional[str] = None
+    ) -> List[ReadyTask]:
+        """Atomically claim ready tasks for a worker.
+        
+        Claimed tasks move to IN_PROGRESS with a lease (lease_owner,
+        lease_expires_at). Tasks whose lease expired can be claimed again.
+        
+        Args:
+            agent: Only claim tasks of this agent (None for any agent)
+            n: Maximum number of tasks to claim
+            lease_seconds: How long the claim holds without renew_lease()
+            worker_id: Identity of the claiming worker (default: hostname and pid)
+            
+        Returns:
+            Claimed tasks, sorted by week, then critical path first, then item
+        """
+        ...
+    
+    def renew_lease(
+        self,
+        week_letter: str,
+        item: Optional[str],
+        task_type: str,
+        lease_seconds: float = 900,
+        worker_id: Optional[str] = None
+    ) -> bool:
+        """Extend a lease held by a worker.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            item: Name of the item (None for week-level tasks)
+            task_type: Type of the claimed task
+            lease_seconds: New lease duration, counted from now
+            worker_id: Worker holding the lease (default: hostname and pid)
+            
+        Returns:
+            True if the lease was extended, False if the worker no longer holds it
+        """
+        ...
+    
     def sync_with_etl(self, week_letter: str, items: List[str]) -> None:
         """Synchronize tracker with ETL output.
         
@@ -108,6 +182,31 @@ class TrackerBackend(Protocol):
         """
         ...
     
+    def get_all_progress(self, task_type: Optional[str] = None) -> Dict[str, TaskProgress]:
+        """Get progress statistics for every week with a tracker, without loading item records.
+        
+        Args:
+            task_type: Specific task type to check (None for all tasks)
+            
+        Returns:
+            TaskProgress by week letter, in week order
+        """
+        ...
+    
+    def close(self) -> None:
+        """Release connections or handles held by the backend.
+        
+        Backends are also context managers that close on exit:
+        ``with get_tracker() as tracker: ...``
+        """
+        ...
+    
+    def __enter__(self) -> "TrackerBackend":
+        ...
+    
+    def __exit__(self, *exc_info) -> None:
+        ...
+    
     def tracker_exists(self, week_letter: str) -> bool:
         """Check if tracker exists for a week.
         
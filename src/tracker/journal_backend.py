@@ -0,0 +1,297 @@
+"""Journaled YAML tracker backend implementation.
+
+Each status change is appended as one JSON line to ``tracker.log.jsonl`` next
+to the week's ``tracker.yaml``; the current state is that snapshot with the log
+replayed on top. Once the log passes a size or age threshold it is compacted:
+the folded state becomes the new snapshot and the log lines move to
+``tracker.history.jsonl``, which keeps the full audit trail of transitions.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from src.logger import get_logger
+from src.tracker.cache import file_signature, live_tracker_cache
+from src.tracker.config import get_task_config
+from src.tracker.locking import file_lock
+from src.tracker.models import TaskEvent, TaskStatus, TaskUpdate, WeekTracker
+from src.tracker.progress import record_transition
+from src.tracker.ready_index import ready_index_cache
+from src.tracker.yaml_backend import YAMLTrackerBackend
+
+logger = get_logger(__name__)
+
+LOG_FILE = "tracker.log.jsonl"
+HISTORY_FILE = "tracker.history.jsonl"
+
+# Compaction thresholds: log size in bytes, age of the oldest logged event in seconds
+DEFAULT_COMPACT_BYTES = 256 * 1024
+DEFAULT_COMPACT_AGE = 3600
+
+
+def _replay(tracker: WeekTracker, event: TaskEvent) -> None:
+    """Apply a logged event to a tracker. Events carry the full record, so replay is idempotent."""
+    if event.item is None:
+        tasks = tracker.week_tasks.tasks
+    elif event.item in tracker.items:
+        tasks = tracker.items[event.item].tasks
+    else:
+        logger.warning(f"Skipping journal event for unknown item {event.item!r}")
+        return
+    old = tasks.get(event.task_type)
+    record_transition(tracker, event.item, event.task_type, old.status if old else None, event.record.status)
+    tasks[event.task_type] = event.record
+
+
+def _read_events(path: Path) -> Iterator[TaskEvent]:
+    """Yield the events of a journal file, skipping lines that do not parse (e.g. a torn last write)."""
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield TaskEvent.model_validate_json(line)
+            except ValueError as exc:
+                logger.warning(f"Skipping unreadable journal line {path}:{line_number}: {exc}")
+
+
+class JournaledTrackerBackend(YAMLTrackerBackend):
+    """YAML tracker backend with an append-only per-week event log.
+
+    Status updates append to the log instead of rewriting ``tracker.yaml``, so
+    their disk cost no longer grows with the number of items in the week. The
+    folded state is kept in a ``LiveTrackerCache`` and advanced in place by
+    each append, so their CPU cost does not either: only a signature mismatch
+    (a write by another process, an external edit) replays the log from the
+    snapshot. Anything that saves a full tracker (``save_tracker``,
+    ``sync_with_etl``) writes a new snapshot and archives the log, since the
+    saved state already contains it.
+    """
+
+    def __init__(
+        self,
+        config=None,
+        cache=None,
+        live_cache=None,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+        compact_age: float = DEFAULT_COMPACT_AGE,
+    ):
+        """Initialize journaled tracker backend.
+
+        Args:
+            config: Optional config to use instead of loading from environment
+            cache: TrackerCache for parsed trackers (default: the process-wide cache)
+            live_cache: LiveTrackerCache of folded trackers (default: the process-wide cache)
+            compact_bytes: Compact once the log reaches this many bytes
+            compact_age: Compact once the oldest logged event is this many seconds old
+        """
+        super().__init__(config, cache)
+        self.live_cache = live_cache if live_cache is not None else live_tracker_cache
+        self.compact_bytes = compact_bytes
+        self.compact_age = compact_age
+
+    def _get_log_path(self, week_letter: str) -> Path:
+        """Get path to the event log of a week."""
+        return self._get_tracker_path(week_letter).with_name(LOG_FILE)
+
+    def _get_history_path(self, week_letter: str) -> Path:
+        """Get path to the archived events of a week."""
+        return self._get_tracker_path(week_letter).with_name(HISTORY_FILE)
+
+    def _state_signature(self, week_letter: str):
+        """Signatures of the snapshot and of the event log."""
+        return (file_signature(self._get_tracker_path(week_letter)), file_signature(self._get_log_path(week_letter)))
+
+    def load_tracker(self, week_letter: str) -> WeekTracker:
+        """Load the snapshot of a week and replay its event log."""
+        log_path = self._get_log_path(week_letter)
+        signature = self._state_signature(week_letter)
+        if signature[1] is None:
+            return super().load_tracker(week_letter)
+
+        live = self.live_cache.copy(log_path, signature)
+        if live is not None:
+            return live
+        cached = self.cache.get(log_path, signature)
+        if cached is not None:
+            return cached
+
+        tracker = super().load_tracker(week_letter)
+        for event in _read_events(log_path):
+            _replay(tracker, event)
+        self.cache.put(log_path, signature, tracker)
+        return tracker
+
+    def _take_live(self, week_letter: str) -> WeekTracker:
+        """Take the folded tracker of a week out of the live cache, loading it on a miss.
+
+        Call under the week's lock, and hand the tracker back with
+        ``live_cache.put`` once the files match it again.
+        """
+        tracker = self.live_cache.take(self._get_log_path(week_letter), self._state_signature(week_letter))
+        return tracker if tracker is not None else self.load_tracker(week_letter)
+
+    def save_tracker(
+        self,
+        week_letter: str,
+        tracker: WeekTracker,
+        expected_version: Optional[int] = None
+    ) -> None:
+        """Save a full snapshot; the saved state supersedes the event log, which is archived."""
+        with file_lock(self._get_lock_path(week_letter)):
+            super().save_tracker(week_letter, tracker, expected_version)
+            signature = self._state_signature(week_letter)
+            self._archive_log(week_letter)
+            # The archived events are part of the snapshot, so the index still holds
+            ready_index_cache.rekey(self._get_tracker_path(week_letter), signature, self._state_signature(week_letter))
+            self._publish_progress(week_letter, tracker)
+
+    def _modify(
+        self,
+        week_letter: str,
+        mutate: Callable[[WeekTracker], bool],
+        create: bool = False
+    ) -> None:
+        """Read-modify-write under the week's lock.
+
+        Appends do not change the snapshot version, so the optimistic check
+        alone would miss events logged by other writers in the meantime.
+        """
+        with file_lock(self._get_lock_path(week_letter)):
+            super()._modify(week_letter, mutate, create)
+
+    def update_tasks(self, week_letter: str, updates: Iterable[TaskUpdate]) -> None:
+        """Validate updates against the current state and append them to the log in one write."""
+        updates = list(updates)
+        if not updates:
+            return
+
+        # Validate and append under the lock so every event is checked
+        # against the state including all earlier events
+        with file_lock(self._get_lock_path(week_letter)):
+            # Not handed back if an update fails, so a half-applied batch is dropped
+            tracker = self._take_live(week_letter)
+            now = datetime.now()
+            lines = []
+            for update in updates:
+                record = self._apply_update(tracker, update.item, update.task_type, update.status, update.metadata)
+                is_week_task = update.item is None or get_task_config(update.task_type).is_week_level
+                event = TaskEvent(
+                    ts=now,
+                    item=None if is_week_task else update.item,
+                    task_type=update.task_type,
+                    record=record,
+                )
+                # Serialize now: later updates in the batch may change the same record
+                lines.append(event.model_dump_json(exclude_none=True))
+
+            log_path = self._get_log_path(week_letter)
+            old_signature = self._state_signature(week_letter)
+            self._append(log_path, "".join(line + "\n" for line in lines))
+
+            signature = self._state_signature(week_letter)
+            ready_index_cache.advance(
+                self._get_tracker_path(week_letter), old_signature, signature, tracker, tracker._transitions
+            )
+            tracker._transitions.clear()
+            self._publish_progress(week_letter, tracker)
+            if self._should_compact(log_path, signature[1][1]):
+                self.save_tracker(week_letter, tracker)
+                signature = self._state_signature(week_letter)
+            self.live_cache.put(log_path, signature, tracker)
+
+    def _plan_updates(
+        self,
+        week_letter: str,
+        plan: Callable[[WeekTracker], List[TaskUpdate]]
+    ) -> List[TaskUpdate]:
+        """Derive updates from the current state and append them, under the week's lock."""
+        with file_lock(self._get_lock_path(week_letter)):
+            tracker = self._take_live(week_letter)
+            planned = plan(tracker)
+            self.live_cache.put(self._get_log_path(week_letter), self._state_signature(week_letter), tracker)
+            self.update_tasks(week_letter, planned)
+        return planned
+
+    def update_task(
+        self,
+        week_letter: str,
+        item: Optional[str],
+        task_type: str,
+        status: TaskStatus,
+        **metadata
+    ) -> None:
+        """Update task status and metadata by appending one event to the log."""
+        self.update_tasks(week_letter, [TaskUpdate(item=item, task_type=task_type, status=status, metadata=metadata)])
+
+    def compact(self, week_letter: str) -> None:
+        """Fold the event log into ``tracker.yaml`` and archive it."""
+        with file_lock(self._get_lock_path(week_letter)):
+            if file_signature(self._get_log_path(week_letter)) is not None:
+                self.save_tracker(week_letter, self.load_tracker(week_letter))
+
+    def get_history(
+        self,
+        week_letter: str,
+        item: Optional[str] = None,
+        task_type: Optional[str] = None
+    ) -> List[TaskEvent]:
+        """Get logged transitions of a week, oldest first.
+
+        Args:
+            week_letter: Letter of the week (A-Z)
+            item: Only events of this item
+            task_type: Only events of this task type
+
+        Returns:
+            Archived events followed by the events not yet compacted
+        """
+        events = []
+        for path in (self._get_history_path(week_letter), self._get_log_path(week_letter)):
+            for event in _read_events(path):
+                if item is not None and event.item != item:
+                    continue
+                if task_type is not None and event.task_type != task_type:
+                    continue
+                events.append(event)
+        return events
+
+    def _append(self, path: Path, content: str) -> None:
+        """Append to a file with a single O_APPEND write."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, content.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+    def _should_compact(self, log_path: Path, size: int) -> bool:
+        """Check the log against the size and age thresholds."""
+        if size >= self.compact_bytes:
+            return True
+        with open(log_path, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+        try:
+            oldest = datetime.fromisoformat(json.loads(first_line)["ts"])
+        except (ValueError, KeyError, TypeError):
+            return True
+        return (datetime.now() - oldest).total_seconds() >= self.compact_age
+
+    def _archive_log(self, week_letter: str) -> None:
+        """Move the events of the log to the history file."""
+        log_path = self._get_log_path(week_letter)
+        try:
+            with open(log_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return
+        if content:
+            self._append(self._get_history_path(week_letter), content)
+        log_path.unlink()
@@ -0,0 +1,53 @@
+"""Task leases handed out by ``claim_ready_tasks``.
+
+A claim moves a ready task to IN_PROGRESS and records which worker holds it
+and until when. Once the lease expires without the worker completing, failing
+or renewing the task, the task becomes claimable again, so a crashed worker
+cannot strand it.
+"""
+
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from src.tracker.config import TASK_GRAPH
+from src.tracker.models import ReadyTask, TaskRecord, TaskStatus
+
+# Long enough for one agent run on an item
+DEFAULT_LEASE_SECONDS = 900
+
+
+def default_worker_id() -> str:
+    """Identify the calling process as ``<hostname>:<pid>``."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def lease_expired(record: TaskRecord, now: datetime) -> bool:
+    """Check whether a task is held by a lease that has lapsed."""
+    return (
+        record.status == TaskStatus.IN_PROGRESS
+        and record.lease_expires_at is not None
+        and record.lease_expires_at <= now
+    )
+
+
+def lease_fields(worker_id: str, now: datetime, lease_seconds: float) -> Dict[str, Any]:
+    """TaskRecord fields recording a lease taken at ``now``."""
+    return {
+        "lease_owner": worker_id,
+        "lease_expires_at": now + timedelta(seconds=lease_seconds),
+    }
+
+
+def ready_order(task: ReadyTask):
+    """Sort key of ready tasks: by week, critical path first, then by item."""
+    return (task.week_letter, TASK_GRAPH.schedule_key(task.task_type), task.item_name or "")
+
+
+def select_claims(candidates: List[ReadyTask], agent: Optional[str], n: int) -> List[ReadyTask]:
+    """Pick the first ``n`` candidates for ``agent`` in get_ready_tasks order."""
+    if agent is not None:
+        candidates = [task for task in candidates if (task.agent or "").lower() == agent.lower()]
+    candidates.sort(key=ready_order)
+    return candidates[:max(n, 0)]
@@ -0,0 +1,53 @@
+"""Advisory file locks serializing tracker writers across threads and processes."""
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads of this process are serialized
+    fcntl = None
+
+_thread_locks: Dict[str, threading.RLock] = {}
+_thread_locks_guard = threading.Lock()
+# Depth of the locks held by the current thread, so nested acquisitions
+# (e.g. a compaction inside a locked update) do not deadlock on flock
+_held = threading.local()
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` (created if missing).
+
+    Re-entrant within a thread. Threads of this process queue on an RLock;
+    other processes are kept out with ``fcntl.flock``.
+    """
+    key = str(path)
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(key, threading.RLock())
+
+    with thread_lock:
+        depth = getattr(_held, "depth", None)
+        if depth is None:
+            depth = _held.depth = {}
+        if depth.get(key):
+            depth[key] += 1
+            try:
+                yield
+            finally:
+                depth[key] -= 1
+            return
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            depth[key] = 1
+            try:
+                yield
+            finally:
+                depth[key] = 0
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
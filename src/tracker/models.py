@@ -1,9 +1,9 @@
 """Pydantic models for task tracking."""
 
 from enum import Enum
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 
 class TaskStatus(str, Enum):
@@ -15,6 +15,10 @@ class TaskStatus(str, Enum):
     SKIPPED = "skipped"
 
 
+def _is_none(value) -> bool:
+    return value is None
+
+
 class TaskRecord(BaseModel):
     """Record of a single task execution."""
     status: TaskStatus = Field(default=TaskStatus.PENDING, description="Current status of the task")
@@ -24,6 +28,13 @@ class TaskRecord(BaseModel):
     error_message: Optional[str] = Field(default=None, description="Error message if task failed")
     retry_count: int = Field(default=0, description="Number of times task was retried")
     agent: Optional[str] = Field(default=None, description="Agent that executed the task")
+    # Left out of dumps when unset, so trackers without claims do not carry them
+    lease_owner: Optional[str] = Field(
+        default=None, description="Worker holding the claim on the task", exclude_if=_is_none
+    )
+    lease_expires_at: Optional[datetime] = Field(
+        default=None, description="When the claim lapses and the task can be reclaimed", exclude_if=_is_none
+    )
     
     model_config = ConfigDict(use_enum_values=True)
 
@@ -69,9 +80,31 @@ class WeekTracker(BaseModel):
     week_tasks: WeekTasks = Field(default_factory=WeekTasks, description="Week-level tasks")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
+    # (item, task_type, old_status, new_status) of status changes applied since
+    # load, and (item, None, was_active, is_active) when sync_with_etl adds,
+    # removes or restores an item; lets a backend advance its ready-task index
+    # instead of rebuilding it
+    _transitions: List[Tuple[Optional[str], Optional[str], Any, Any]] = PrivateAttr(default_factory=list)
+    
     model_config = ConfigDict(use_enum_values=True)
 
 
+class TaskUpdate(BaseModel):
+    """A status transition to apply as part of a batch (see ``update_tasks``)."""
+    item: Optional[str] = Field(default=None, description="Item name (None for week-level tasks)")
+    task_type: str = Field(description="Type of task to update")
+    status: TaskStatus = Field(description="New status for the task")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="TaskRecord fields to set (output_file, etc.)")
+
+
+class TaskEvent(BaseModel):
+    """A task transition recorded in a week's journal."""
+    ts: datetime = Field(description="When the transition was recorded")
+    item: Optional[str] = Field(default=None, description="Item name (None for week-level tasks)")
+    task_type: str = Field(description="Type of task")
+    record: TaskRecord = Field(description="Task record after the transition")
+
+
 class TaskProgress(BaseModel):
     """Progress statistics for tasks."""
     total: int = Field(description="Total number of tasks")
@@ -95,5 +128,7 @@ class ReadyTask(BaseModel):
     item_name: Optional[str] = Field(default=None, description="Item name (None for week-level tasks)")
     task_type: str = Field(description="Type of task (research, content, blog_post, etc.)")
     agent: Optional[str] = Field(default=None, description="Agent assigned to this task type")
+    lease_owner: Optional[str] = Field(default=None, description="Worker that claimed the task (claim_ready_tasks only)")
+    lease_expires_at: Optional[datetime] = Field(default=None, description="When the claim lapses (claim_ready_tasks only)")
     
     model_config = ConfigDict(use_enum_values=True)
@@ -0,0 +1,151 @@
+"""Task status counters kept with each tracker, and their cross-week summary.
+
+Every tracker carries ``metadata["progress"]``: the number of task records per
+task type and status, over active items and week-level tasks. Backends adjust
+the counters on each transition instead of recounting the week, and mirror
+them into ``progress.json`` in the cache directory, keyed by week letter and
+stamped with the signature of the state they describe. Progress across all
+weeks can then be read without loading a single tracker. Signatures are
+specific to the host's files, so the summary stays out of the committed data.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.tracker.locking import file_lock
+from src.tracker.models import ItemTasks, TaskProgress, TaskStatus, WeekTracker
+
+PROGRESS_KEY = "progress"
+SUMMARY_FILE = "progress.json"
+
+Counters = Dict[str, Dict[str, int]]
+
+
+def _status_value(status) -> str:
+    return TaskStatus(status).value
+
+
+def count_progress(tracker: WeekTracker) -> Counters:
+    """Count the task records of a tracker by task type and status."""
+    counters: Counters = {}
+    for item_tasks in tracker.items.values():
+        if item_tasks.removed:
+            continue
+        for task_type, record in item_tasks.tasks.items():
+            _add(counters, task_type, record.status, 1)
+    for task_type, record in tracker.week_tasks.tasks.items():
+        _add(counters, task_type, record.status, 1)
+    return counters
+
+
+def ensure_progress(tracker: WeekTracker) -> Counters:
+    """Counters of a tracker, counted now if it has none (e.g. an older tracker file)."""
+    counters = tracker.metadata.get(PROGRESS_KEY)
+    if counters is None:
+        counters = tracker.metadata[PROGRESS_KEY] = count_progress(tracker)
+    return counters
+
+
+def record_transition(
+    tracker: WeekTracker,
+    item: Optional[str],
+    task_type: str,
+    old_status,
+    new_status
+) -> None:
+    """Move one task between counters.
+
+    Args:
+        tracker: Tracker whose counters to adjust
+        item: Item of the task (None for week-level tasks)
+        task_type: Type of the task
+        old_status: Status before the transition (None for a new record)
+        new_status: Status after the transition
+    """
+    counters = tracker.metadata.get(PROGRESS_KEY)
+    if counters is None:
+        return
+    if item is not None and tracker.items[item].removed:
+        return
+    if old_status is not None:
+        _add(counters, task_type, old_status, -1)
+    _add(counters, task_type, new_status, 1)
+
+
+def record_membership(tracker: WeekTracker, item_tasks: ItemTasks, added: bool) -> None:
+    """Count an item's tasks in or out when it is added, restored or removed."""
+    counters = tracker.metadata.get(PROGRESS_KEY)
+    if counters is None:
+        return
+    for task_type, record in item_tasks.tasks.items():
+        _add(counters, task_type, record.status, 1 if added else -1)
+
+
+def to_task_progress(counters: Counters, task_type: Optional[str] = None) -> TaskProgress:
+    """Sum counters into TaskProgress, for one task type or all of them."""
+    counts = {status.value: 0 for status in TaskStatus}
+    for name, by_status in counters.items():
+        if task_type is None or name == task_type:
+            for status, n in by_status.items():
+                counts[status] += n
+    return TaskProgress(
+        total=sum(counts.values()),
+        pending=counts[TaskStatus.PENDING.value],
+        in_progress=counts[TaskStatus.IN_PROGRESS.value],
+        completed=counts[TaskStatus.COMPLETED.value],
+        failed=counts[TaskStatus.FAILED.value],
+        skipped=counts[TaskStatus.SKIPPED.value],
+    )
+
+
+def _add(counters: Counters, task_type: str, status, n: int) -> None:
+    by_status = counters.setdefault(task_type, {})
+    key = _status_value(status)
+    by_status[key] = by_status.get(key, 0) + n
+    if not by_status[key]:
+        del by_status[key]
+
+
+class ProgressSummary:
+    """The ``progress.json`` file holding the counters of every week."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def read(self) -> Dict[str, Dict[str, Any]]:
+        """Entries by week letter: ``{"signature": ..., "progress": counters}``."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            # Rebuilt from the trackers on the next read
+            return {}
+
+    def update(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the entries of some weeks, keeping the others."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.path.with_name(self.path.name + ".lock")):
+            summary = self.read()
+            for letter, entry in entries.items():
+                summary[letter] = {
+                    # Stored the way JSON reads it back, so comparisons match
+                    "signature": json.loads(json.dumps(entry["signature"])),
+                    "progress": entry["progress"],
+                }
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+    @staticmethod
+    def matches(entry: Optional[Dict[str, Any]], signature) -> bool:
+        """Check that a summary entry describes the state with ``signature``."""
+        return (
+            entry is not None
+            and signature is not None
+            and entry.get("signature") == json.loads(json.dumps(signature))
+        )
@@ -0,0 +1,281 @@
+"""Incrementally maintained index of ready tasks.
+
+A ``ReadyIndex`` holds, per task type, the tasks of one week that are pending
+with their dependencies met and the tasks in progress (whose lease may expire),
+and for each week-level task type the number of (active item, dependency)
+pairs still not completed. Building it costs one
+pass over the week's ``CompactWeek``; after that each status change only
+touches the task itself and its dependents from the ``depends_on`` graph, and
+listing ready work costs O(k) for k results: each task type's ready items
+are kept sorted as they are added.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from src.tracker.compact import IN_PROGRESS, PENDING, CompactWeek
+from src.tracker.config import TASK_GRAPH, get_task_config
+from src.tracker.models import ReadyTask, TaskRecord, TaskStatus, WeekTracker
+
+DEFAULT_MAXSIZE = 64
+
+T = TypeVar("T")
+
+
+def _is_week_task(item: Optional[str], task_type: str) -> bool:
+    return item is None or get_task_config(task_type).is_week_level
+
+
+def _sort_key(item: Optional[str]) -> str:
+    return item or ""
+
+
+class ReadyIndex:
+    """Ready tasks of one week, kept in sync with status transitions."""
+
+    def __init__(self, week_letter: str):
+        self.week_letter = week_letter
+        # task_type -> sorted item names (None for the week-level task)
+        self.ready: Dict[str, List[Optional[str]]] = {}
+        # task_type -> items whose task is in progress (None for the week-level task)
+        self.in_progress: Dict[str, Set[Optional[str]]] = {}
+        # week-level task_type -> active items times dependencies not completed
+        self.unmet: Dict[str, int] = {}
+
+    @classmethod
+    def build(cls, week_letter: str, week: CompactWeek) -> "ReadyIndex":
+        """Index every ready task of a week from its compact form."""
+        index = cls(week_letter)
+        for task_type in TASK_GRAPH.week_task_types:
+            index.unmet[task_type] = sum(week.unmet(dep) for dep in TASK_GRAPH.dependencies[task_type])
+
+        for task_type in week.status:
+            ready = sorted(week.ready_items(task_type))
+            if ready:
+                index.ready[task_type] = ready
+            in_progress = set(week.items_with_status(task_type, TaskStatus.IN_PROGRESS))
+            if in_progress:
+                index.in_progress[task_type] = in_progress
+        for task_type, code in week.week_status.items():
+            if code == PENDING and index.unmet.get(task_type, 0) == 0:
+                index._add(task_type, None)
+            elif code == IN_PROGRESS:
+                index.in_progress.setdefault(task_type, set()).add(None)
+        return index
+
+    def apply(self, tracker: WeekTracker, transitions: Iterable[Tuple[Optional[str], Optional[str], Any, Any]]) -> None:
+        """Advance the index over changes already applied to ``tracker``.
+
+        Args:
+            tracker: Tracker in its state after the transitions
+            transitions: (item, task_type, old_status, new_status) in the order
+                applied, or (item, None, was_active, is_active) for items added,
+                removed or restored by a sync
+        """
+        transitions = list(transitions)
+        # Counters cannot be replayed against the final state once items came
+        # or went in between, so a sync recounts them in one pass
+        membership_changed = any(task_type is None for _, task_type, _, _ in transitions)
+        if membership_changed:
+            self._count_unmet(tracker)
+
+        refresh = {}
+        for item, task_type, old_status, new_status in transitions:
+            if task_type is None:
+                for item_task_type in tracker.items[item].tasks:
+                    refresh[(item, item_task_type)] = None
+                for dependent in self.unmet:
+                    refresh[(None, dependent)] = None
+                continue
+
+            week_task = _is_week_task(item, task_type)
+            key = None if week_task else item
+            refresh[(key, task_type)] = None
+
+            for dependent in TASK_GRAPH.dependents.get(task_type, ()):
+                if get_task_config(dependent).is_week_level:
+                    # Only item completions move the week-level counters
+                    if not week_task and not membership_changed and not tracker.items[item].removed:
+                        was, now = _completed_status(old_status), _completed_status(new_status)
+                        if was != now:
+                            self.unmet[dependent] = self.unmet.get(dependent, 0) + (1 if was else -1)
+                    refresh[(None, dependent)] = None
+                elif key is not None:
+                    refresh[(key, dependent)] = None
+
+        for key, task_type in refresh:
+            self._refresh(tracker, key, task_type)
+
+    def ready_tasks(self, limit: Optional[int] = None, agent: Optional[str] = None) -> List[ReadyTask]:
+        """Ready tasks of the week (only those of ``agent`` if given), critical path first, then sorted by item."""
+        tasks = []
+        for task_type in sorted(self.ready, key=TASK_GRAPH.schedule_key):
+            task_agent = get_task_config(task_type).agent
+            if agent is not None and (task_agent or "").lower() != agent.lower():
+                continue
+            names = self.ready[task_type]
+            if limit is not None:
+                names = names[:limit - len(tasks)]
+            for item_name in names:
+                tasks.append(ReadyTask(
+                    week_letter=self.week_letter,
+                    item_name=item_name,
+                    task_type=task_type,
+                    agent=task_agent,
+                ))
+            if limit is not None and len(tasks) >= limit:
+                break
+        return tasks
+
+    def in_progress_tasks(self) -> List[Tuple[Optional[str], str]]:
+        """(item, task_type) of the tasks in progress, item None for week-level tasks."""
+        return [(item, task_type) for task_type, items in self.in_progress.items() for item in items]
+
+    def _count_unmet(self, tracker: WeekTracker) -> None:
+        """Count the dependencies of week-level tasks not completed by active items."""
+        active = [item_tasks for item_tasks in tracker.items.values() if not item_tasks.removed]
+        for task_type in TASK_GRAPH.week_task_types:
+            self.unmet[task_type] = sum(
+                1
+                for item_tasks in active
+                for dep_task_type in TASK_GRAPH.dependencies[task_type]
+                if not _completed(item_tasks.get(dep_task_type))
+            )
+
+    def _dependencies_met(self, tracker: WeekTracker, item: Optional[str], task_type: str) -> bool:
+        """Same rules as the backends' _check_dependencies, using the counters for week-level tasks."""
+        if _is_week_task(item, task_type):
+            return self.unmet.get(task_type, 0) == 0
+        item_tasks = tracker.items[item]
+        return all(_completed(item_tasks.get(dep)) for dep in TASK_GRAPH.dependencies[task_type])
+
+    def _refresh(self, tracker: WeekTracker, item: Optional[str], task_type: str) -> None:
+        """Recompute whether one task is ready or in progress."""
+        if item is None:
+            record = tracker.week_tasks.get(task_type)
+            active = True
+        else:
+            item_tasks = tracker.items.get(item)
+            record = item_tasks.get(task_type) if item_tasks else None
+            active = item_tasks is not None and not item_tasks.removed
+
+        is_ready = (
+            active
+            and record is not None
+            and record.status == TaskStatus.PENDING
+            and self._dependencies_met(tracker, item, task_type)
+        )
+        if is_ready:
+            self._add(task_type, item)
+        else:
+            self._discard(task_type, item)
+
+        if active and record is not None and record.status == TaskStatus.IN_PROGRESS:
+            self.in_progress.setdefault(task_type, set()).add(item)
+        elif task_type in self.in_progress:
+            self.in_progress[task_type].discard(item)
+            if not self.in_progress[task_type]:
+                del self.in_progress[task_type]
+
+    def _add(self, task_type: str, item: Optional[str]) -> None:
+        names = self.ready.setdefault(task_type, [])
+        position = bisect_left(names, _sort_key(item), key=_sort_key)
+        if position == len(names) or names[position] != item:
+            names.insert(position, item)
+
+    def _discard(self, task_type: str, item: Optional[str]) -> None:
+        names = self.ready.get(task_type)
+        if names is None:
+            return
+        position = bisect_left(names, _sort_key(item), key=_sort_key)
+        if position < len(names) and names[position] == item:
+            del names[position]
+            if not names:
+                del self.ready[task_type]
+
+
+def _completed(record: Optional[TaskRecord]) -> bool:
+    return record is not None and record.status == TaskStatus.COMPLETED
+
+
+def _completed_status(status) -> bool:
+    return status is not None and status == TaskStatus.COMPLETED
+
+
+class ReadyIndexCache:
+    """ReadyIndex objects keyed by tracker path and the signature of its state.
+
+    Indexes never leave the cache: reads and advances happen under its lock,
+    so a poll never sees an index halfway through an update.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Any, ReadyIndex]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ready_tasks(self, path: Path, signature, limit: Optional[int] = None) -> Optional[List[ReadyTask]]:
+        """Ready tasks from the index stored for ``signature``, or None on a miss."""
+        return self.read(path, signature, lambda index: index.ready_tasks(limit))
+
+    def read(self, path: Path, signature, read: Callable[[ReadyIndex], T]) -> Optional[T]:
+        """Call ``read`` on the index stored for ``signature``, under the lock; None on a miss."""
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or signature is None or entry[0] != signature:
+                return None
+            self._entries.move_to_end(key)
+            return read(entry[1])
+
+    def put(self, path: Path, signature, index: ReadyIndex) -> None:
+        """Store ``index`` as the state of ``path`` at ``signature``."""
+        if signature is None or self.maxsize <= 0:
+            return
+        key = str(path)
+        with self._lock:
+            self._entries[key] = (signature, index)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def advance(
+        self,
+        path: Path,
+        old_signature,
+        new_signature,
+        tracker: WeekTracker,
+        transitions: List[Tuple[Optional[str], str, Any, Any]]
+    ) -> None:
+        """Move the index stored for ``old_signature`` to ``new_signature``.
+
+        Without a matching entry or without transitions the entry is dropped
+        and rebuilt on the next poll.
+        """
+        key = str(path)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or old_signature is None or entry[0] != old_signature or not transitions:
+                return
+            index = entry[1]
+            index.apply(tracker, transitions)
+        self.put(path, new_signature, index)
+
+    def rekey(self, path: Path, old_signature, new_signature) -> None:
+        """Keep the index stored for ``old_signature`` across a change that leaves the state as is."""
+        key = str(path)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is not None and old_signature is not None and entry[0] == old_signature:
+            self.put(path, new_signature, entry[1])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every backend in the process, like the tracker cache
+ready_index_cache = ReadyIndexCache()
@@ -0,0 +1,784 @@
+"""SQLite-based tracker backend implementation."""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional
+
+from src.config import load_config, week_id
+from src.serialization import load_yaml
+from src.tracker.models import (
+    WeekTracker,
+    ItemTasks,
+    WeekTasks,
+    TaskRecord,
+    TaskProgress,
+    TaskStatus,
+    ReadyTask,
+    TaskUpdate,
+)
+from src.tracker.batch import TaskBatch, batch_updates
+from src.tracker.leases import DEFAULT_LEASE_SECONDS, default_worker_id, lease_fields, ready_order, select_claims
+from src.tracker.config import (
+    get_task_config,
+    is_valid_task_type,
+    DEFAULT_ITEM_TASKS,
+    DEFAULT_WEEK_TASKS,
+)
+from src.tracker.exceptions import (
+    DependencyNotMetError,
+    InvalidTaskTypeError,
+    ItemNotFoundError,
+    WeekNotFoundError,
+)
+from src.tracker.progress import PROGRESS_KEY, count_progress, to_task_progress
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS weeks (
+    letter TEXT PRIMARY KEY,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS items (
+    week TEXT NOT NULL REFERENCES weeks(letter) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    removed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (week, name)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    week TEXT NOT NULL,
+    item TEXT NOT NULL,
+    task_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT,
+    completed_at TEXT,
+    output_file TEXT,
+    error_message TEXT,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    agent TEXT,
+    lease_owner TEXT,
+    lease_expires_at TEXT,
+    lease_expires_ts REAL,
+    PRIMARY KEY (week, item, task_type),
+    FOREIGN KEY (week, item) REFERENCES items(week, name) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS tasks_by_status ON tasks (status, task_type, week);
+CREATE TABLE IF NOT EXISTS week_tasks (
+    week TEXT NOT NULL REFERENCES weeks(letter) ON DELETE CASCADE,
+    task_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT,
+    completed_at TEXT,
+    output_file TEXT,
+    error_message TEXT,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    agent TEXT,
+    lease_owner TEXT,
+    lease_expires_at TEXT,
+    lease_expires_ts REAL,
+    PRIMARY KEY (week, task_type)
+);
+CREATE INDEX IF NOT EXISTS week_tasks_by_status ON week_tasks (status, task_type);
+"""
+
+# TaskRecord fields stored as columns, in column order
+RECORD_FIELDS = (
+    "status",
+    "started_at",
+    "completed_at",
+    "output_file",
+    "error_message",
+    "retry_count",
+    "agent",
+    "lease_owner",
+    "lease_expires_at",
+)
+# Lease expiry in epoch seconds, next to the ISO text of lease_expires_at:
+# ISO strings with different offsets or precision do not compare in order
+LEASE_EXPIRY_COLUMN = "lease_expires_ts"
+# Columns written for a TaskRecord
+ROW_COLUMNS = RECORD_FIELDS + (LEASE_EXPIRY_COLUMN,)
+# Columns added after the first schema, with their types
+ADDED_COLUMNS = (("lease_owner", "TEXT"), ("lease_expires_at", "TEXT"), (LEASE_EXPIRY_COLUMN, "REAL"))
+TERMINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED)
+
+
+def _to_column(value):
+    """Convert a TaskRecord value to its SQLite representation."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, TaskStatus):
+        return value.value
+    return value
+
+
+def _epoch(value) -> Optional[float]:
+    """Epoch seconds of a datetime or ISO timestamp (None stays None)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+def _record_row(record: TaskRecord) -> tuple:
+    """Values of ``ROW_COLUMNS`` for a record."""
+    return tuple(_to_column(getattr(record, field)) for field in RECORD_FIELDS) + (_epoch(record.lease_expires_at),)
+
+
+def _record_from_row(row: sqlite3.Row) -> TaskRecord:
+    return TaskRecord(**{field: row[field] for field in RECORD_FIELDS})
+
+
+def _dependencies_sql(depends_on: List[str]) -> str:
+    """Return an SQL condition on ``tasks t`` requiring every dependency of the item to be completed."""
+    return "".join(
+        " AND EXISTS (SELECT 1 FROM tasks d WHERE d.week = t.week AND d.item = t.item"
+        " AND d.task_type = ? AND d.status = 'completed')"
+        for _ in depends_on
+    )
+
+
+class SQLiteTrackerBackend:
+    """SQLite database tracker backend.
+
+    All weeks live in one database (``data/tracker.db`` by default) opened in
+    WAL mode, so readers never block the writer. Item, task and week-task rows
+    are indexed by status, which turns status updates into single-row UPDATEs
+    and ready-task queries into indexed SELECTs instead of whole-file rewrites.
+    """
+
+    def __init__(self, config=None, db_path: Optional[Path] = None):
+        """Initialize SQLite tracker backend.
+
+        Args:
+            config: Optional config to use instead of loading from environment
+            db_path: Database file (default: ``<data_dir>/tracker.db``)
+        """
+        self.cfg = config or load_config()
+        self.db_path = Path(db_path) if db_path else self.cfg.data_dir / "tracker.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Add columns missing from databases created by older versions."""
+        for table in ("tasks", "week_tasks"):
+            columns = {row["name"] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            for column, column_type in ADDED_COLUMNS:
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            if LEASE_EXPIRY_COLUMN not in columns:
+                rows = self._conn.execute(
+                    f"SELECT rowid, lease_expires_at FROM {table} WHERE lease_expires_at IS NOT NULL"
+                ).fetchall()
+                self._conn.executemany(
+                    f"UPDATE {table} SET {LEASE_EXPIRY_COLUMN} = ? WHERE rowid = ?",
+                    [(_epoch(row["lease_expires_at"]), row["rowid"]) for row in rows],
+                )
+
+    def close(self) -> None:
+        """Close the database connection; the backend cannot be used afterwards."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "SQLiteTrackerBackend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql: str, params=()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _get_tasks_path(self, week_letter: str) -> Path:
+        """Get path to tasks.yaml file for a week."""
+        return self.cfg.weeks_dir / week_id(week_letter) / "tasks.yaml"
+
+    def _ensure_week(self, week_letter: str) -> None:
+        """Make sure a week exists, initializing it from tasks.yaml if needed.
+
+        Raises:
+            WeekNotFoundError: If neither the week nor its tasks.yaml exist
+        """
+        if self.tracker_exists(week_letter):
+            return
+        tasks_path = self._get_tasks_path(week_letter)
+        if not tasks_path.exists():
+            raise WeekNotFoundError(f"No tracker or tasks found for week {week_letter}")
+
+        with open(tasks_path, 'r', encoding='utf-8') as f:
+            item_names = load_yaml(f) or []
+
+        tracker = self._new_tracker(week_letter)
+        for item_name in item_names:
+            tracker.items[item_name] = self._create_default_item_tasks()
+        self.save_tracker(week_letter, tracker)
+
+    def _new_tracker(self, week_letter: str) -> WeekTracker:
+        """Create an empty tracker with default week-level tasks."""
+        tracker = WeekTracker(
+            items={},
+            week_tasks=WeekTasks(),
+            metadata={
+                "created_at": datetime.now().isoformat(),
+                "week_letter": week_letter,
+            }
+        )
+        for task_type in DEFAULT_WEEK_TASKS:
+            tracker.week_tasks.tasks[task_type] = TaskRecord(
+                status=TaskStatus.PENDING,
+                agent=get_task_config(task_type).agent
+            )
+        return tracker
+
+    def _create_default_item_tasks(self) -> ItemTasks:
+        """Create default tasks for a new item."""
+        tasks = {}
+        for task_type in DEFAULT_ITEM_TASKS:
+            config = get_task_config(task_type)
+            tasks[task_type] = TaskRecord(
+                status=TaskStatus.PENDING,
+                agent=config.agent
+            )
+        return ItemTasks(tasks=tasks)
+
+    def tracker_exists(self, week_letter: str) -> bool:
+        """Check if tracker exists for a week."""
+        return bool(self._query("SELECT 1 FROM weeks WHERE letter = ?", (week_letter,)))
+
+    def load_tracker(self, week_letter: str) -> WeekTracker:
+        """Load tracker data for a specific week."""
+        self._ensure_week(week_letter)
+
+        with self._lock:
+            metadata = self._conn.execute(
+                "SELECT metadata FROM weeks WHERE letter = ?", (week_letter,)
+            ).fetchone()["metadata"]
+            items = self._conn.execute(
+                "SELECT name, removed FROM items WHERE week = ? ORDER BY position", (week_letter,)
+            ).fetchall()
+            task_rows = self._conn.execute(
+                "SELECT * FROM tasks WHERE week = ? ORDER BY rowid", (week_letter,)
+            ).fetchall()
+            week_task_rows = self._conn.execute(
+                "SELECT * FROM week_tasks WHERE week = ? ORDER BY rowid", (week_letter,)
+            ).fetchall()
+
+        tracker = WeekTracker(metadata=json.loads(metadata))
+        for row in items:
+            tracker.items[row["name"]] = ItemTasks(removed=bool(row["removed"]))
+        for row in task_rows:
+            tracker.items[row["item"]].tasks[row["task_type"]] = _record_from_row(row)
+        for row in week_task_rows:
+            tracker.week_tasks.tasks[row["task_type"]] = _record_from_row(row)
+        # Counted from the rows rather than stored, so they can never go stale
+        tracker.metadata[PROGRESS_KEY] = count_progress(tracker)
+        return tracker
+
+    def save_tracker(self, week_letter: str, tracker: WeekTracker) -> None:
+        """Save tracker data for a specific week, replacing what is stored."""
+        placeholders = ", ".join("?" for _ in ROW_COLUMNS)
+        columns = ", ".join(ROW_COLUMNS)
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM weeks WHERE letter = ?", (week_letter,))
+            conn.execute(
+                "INSERT INTO weeks (letter, metadata) VALUES (?, ?)",
+                (week_letter, json.dumps(
+                    {key: value for key, value in tracker.metadata.items() if key != PROGRESS_KEY}, default=str
+                )),
+            )
+            conn.executemany(
+                "INSERT INTO items (week, name, position, removed) VALUES (?, ?, ?, ?)",
+                [
+                    (week_letter, name, position, int(item_tasks.removed))
+                    for position, (name, item_tasks) in enumerate(tracker.items.items())
+                ],
+            )
+            conn.executemany(
+                f"INSERT INTO tasks (week, item, task_type, {columns}) VALUES (?, ?, ?, {placeholders})",
+                [
+                    (week_letter, name, task_type) + _record_row(record)
+                    for name, item_tasks in tracker.items.items()
+                    for task_type, record in item_tasks.tasks.items()
+                ],
+            )
+            conn.executemany(
+                f"INSERT INTO week_tasks (week, task_type, {columns}) VALUES (?, ?, {placeholders})",
+                [
+                    (week_letter, task_type) + _record_row(record)
+                    for task_type, record in tracker.week_tasks.tasks.items()
+                ],
+            )
+
+    def get_pending_items(self, week_letter: str, task_type: str) -> List[str]:
+        """Get list of items with pending tasks of a specific type."""
+        if not is_valid_task_type(task_type):
+            raise InvalidTaskTypeError(f"Invalid task type: {task_type}")
+
+        self._ensure_week(week_letter)
+        config = get_task_config(task_type)
+        if config.is_week_level:
+            if not self._week_dependencies_met(week_letter, config.depends_on):
+                return []
+            dependencies, params = "", ()
+        else:
+            dependencies, params = _dependencies_sql(config.depends_on), tuple(config.depends_on)
+
+        rows = self._query(
+            "SELECT t.item FROM tasks t JOIN items i ON i.week = t.week AND i.name = t.item"
+            " WHERE t.week = ? AND t.task_type = ? AND t.status = 'pending' AND i.removed = 0"
+            f"{dependencies} ORDER BY i.position",
+            (week_letter, task_type) + params,
+        )
+        return [row["item"] for row in rows]
+
+    def _week_dependencies_met(self, week_letter: str, depends_on: List[str]) -> bool:
+        """Check that every active item of a week completed each dependency."""
+        for dep_task_type in depends_on:
+            blocked = self._query(
+                "SELECT 1 FROM items i WHERE i.week = ? AND i.removed = 0 AND NOT EXISTS ("
+                "SELECT 1 FROM tasks d WHERE d.week = i.week AND d.item = i.name"
+                " AND d.task_type = ? AND d.status = 'completed') LIMIT 1",
+                (week_letter, dep_task_type),
+            )
+            if blocked:
+                return False
+        return True
+
+    def _check_dependencies(self, week_letter: str, item: Optional[str], task_type: str) -> bool:
+        """Check if dependencies are met for a task."""
+        config = get_task_config(task_type)
+
+        # Week-level task
+        if item is None or config.is_week_level:
+            return self._week_dependencies_met(week_letter, config.depends_on)
+
+        # Item-level task
+        if not self._query("SELECT 1 FROM items WHERE week = ? AND name = ?", (week_letter, item)):
+            return False
+
+        # Check each dependency
+        for dep_task_type in config.depends_on:
+            dep_task = self._query(
+                "SELECT status FROM tasks WHERE week = ? AND item = ? AND task_type = ?",
+                (week_letter, item, dep_task_type),
+            )
+            if not dep_task or dep_task[0]["status"] != TaskStatus.COMPLETED.value:
+                return False
+        return True
+
+    def can_start_task(self, week_letter: str, item: Optional[str], task_type: str) -> bool:
+        """Check if a task can be started (dependencies met)."""
+        if not is_valid_task_type(task_type):
+            return False
+
+        self._ensure_week(week_letter)
+        return self._check_dependencies(week_letter, item, task_type)
+
+    def update_task(
+        self,
+        week_letter: str,
+        item: Optional[str],
+        task_type: str,
+        status: TaskStatus,
+        **metadata
+    ) -> None:
+        """Update task status and metadata with a single-row UPDATE."""
+        self.update_tasks(week_letter, [TaskUpdate(item=item, task_type=task_type, status=status, metadata=metadata)])
+
+    def update_tasks(self, week_letter: str, updates: Iterable[TaskUpdate]) -> None:
+        """Apply several task updates in one transaction.
+
+        Updates are applied in order, so a task can be started once an earlier
+        update in the same batch completed its dependencies. If any update
+        fails, the whole transaction is rolled back.
+        """
+        updates = list(updates)
+        if not updates:
+            return
+
+        self._ensure_week(week_letter)
+        with self._transaction() as conn:
+            for update in updates:
+                self._apply_update(conn, week_letter, update.item, update.task_type, update.status, update.metadata)
+
+    def batch(self, week_letter: str) -> ContextManager[TaskBatch]:
+        """Queue updates in a ``with`` block and commit them together on exit."""
+        return batch_updates(self, week_letter)
+
+    def _apply_update(
+        self,
+        conn: sqlite3.Connection,
+        week_letter: str,
+        item: Optional[str],
+        task_type: str,
+        status: TaskStatus,
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Apply one status transition inside an open transaction."""
+        if not is_valid_task_type(task_type):
+            raise InvalidTaskTypeError(f"Invalid task type: {task_type}")
+
+        config = get_task_config(task_type)
+        status = TaskStatus(status)
+
+        # Determine if week-level or item-level task
+        is_week_task = item is None or config.is_week_level
+        if is_week_task:
+            table, key_sql, key = "week_tasks", "week = ? AND task_type = ?", (week_letter, task_type)
+        else:
+            table, key_sql, key = "tasks", "week = ? AND item = ? AND task_type = ?", (week_letter, item, task_type)
+
+        if not is_week_task and not conn.execute(
+            "SELECT 1 FROM items WHERE week = ? AND name = ?", (week_letter, item)
+        ).fetchone():
+            raise ItemNotFoundError(f"Item not found: {item}")
+
+        # Check dependencies if transitioning to IN_PROGRESS
+        if status == TaskStatus.IN_PROGRESS and not self._check_dependencies(week_letter, item, task_type):
+            deps = ", ".join(config.depends_on)
+            raise DependencyNotMetError(
+                f"Cannot start task '{task_type}' for {'week' if is_week_task else item}: "
+                f"dependencies not met ({deps})"
+            )
+
+        conn.execute(
+            f"INSERT OR IGNORE INTO {table} ({'week, task_type' if is_week_task else 'week, item, task_type'},"
+            f" status, agent) VALUES ({', '.join('?' for _ in key)}, ?, ?)",
+            key + (TaskStatus.PENDING.value, config.agent),
+        )
+
+        now = datetime.now().isoformat()
+        assignments = ["status = ?"]
+        values = [status.value]
+        if status == TaskStatus.IN_PROGRESS:
+            assignments.append("started_at = COALESCE(started_at, ?)")
+            values.append(now)
+        if status in TERMINAL_STATUSES:
+            assignments.append("completed_at = ?")
+            values.append(now)
+        if status != TaskStatus.IN_PROGRESS:
+            # A task leaving IN_PROGRESS no longer holds a claim
+            assignments.extend(
+                f"{field} = NULL" for field in ("lease_owner", "lease_expires_at") if field not in metadata
+            )
+            if "lease_expires_at" not in metadata:
+                assignments.append(f"{LEASE_EXPIRY_COLUMN} = NULL")
+        for field, value in metadata.items():
+            if field in RECORD_FIELDS and field != "status":
+                assignments.append(f"{field} = ?")
+                values.append(_to_column(value))
+                if field == "lease_expires_at":
+                    assignments.append(f"{LEASE_EXPIRY_COLUMN} = ?")
+                    values.append(_epoch(value))
+
+        conn.execute(f"UPDATE {table} SET {', '.join(assignments)} WHERE {key_sql}", tuple(values) + key)
+
+    def sync_with_etl(self, week_letter: str, items: List[str]) -> None:
+        """Synchronize tracker with ETL output."""
+        if not self.tracker_exists(week_letter):
+            self.save_tracker(week_letter, self._new_tracker(week_letter))
+            changes_detected = True
+        else:
+            changes_detected = False
+
+        columns = ", ".join(ROW_COLUMNS)
+        placeholders = ", ".join("?" for _ in ROW_COLUMNS)
+        with self._transaction() as conn:
+            metadata = json.loads(conn.execute(
+                "SELECT metadata FROM weeks WHERE letter = ?", (week_letter,)
+            ).fetchone()["metadata"])
+            existing: Dict[str, bool] = {
+                row["name"]: bool(row["removed"])
+                for row in conn.execute("SELECT name, removed FROM items WHERE week = ?", (week_letter,))
+            }
+
+            # Check for missing metadata or mismatched count
+            if "last_synced" not in metadata or metadata.get("etl_item_count") != len(items):
+                changes_detected = True
+
+            # Add new items from ETL and restore removed items
+            position = conn.execute(
+                "SELECT COALESCE(MAX(position), -1) FROM items WHERE week = ?", (week_letter,)
+            ).fetchone()[0]
+            new_items, restored = [], []
+            for item_name in items:
+                if item_name not in existing:
+                    position += 1
+                    new_items.append((week_letter, item_name, position))
+                    existing[item_name] = False
+                elif existing[item_name]:
+                    restored.append((week_letter, item_name))
+
+            # Mark removed items (preserve history)
+            etl_items_set = set(items)
+            removed = [
+                (week_letter, item_name)
+                for item_name, is_removed in existing.items()
+                if not is_removed and item_name not in etl_items_set
+            ]
+
+            if new_items or restored or removed:
+                changes_detected = True
+            conn.executemany("INSERT INTO items (week, name, position) VALUES (?, ?, ?)", new_items)
+            default_tasks = self._create_default_item_tasks().tasks
+            conn.executemany(
+                f"INSERT INTO tasks (week, item, task_type, {columns}) VALUES (?, ?, ?, {placeholders})",
+                [
+                    (week_letter, item_name, task_type) + _record_row(record)
+                    for _, item_name, _ in new_items
+                    for task_type, record in default_tasks.items()
+                ],
+            )
+            conn.executemany("UPDATE items SET removed = 0 WHERE week = ? AND name = ?", restored)
+            conn.executemany("UPDATE items SET removed = 1 WHERE week = ? AND name = ?", removed)
+
+            if changes_detected:
+                metadata["last_synced"] = datetime.now().isoformat()
+                metadata["etl_item_count"] = len(items)
+                conn.execute(
+                    "UPDATE weeks SET metadata = ? WHERE letter = ?",
+                    (json.dumps(metadata, default=str), week_letter),
+                )
+
+    def get_progress(self, week_letter: str, task_type: Optional[str] = None) -> TaskProgress:
+        """Get progress statistics for a week."""
+        self._ensure_week(week_letter)
+        return to_task_progress(self._progress(week_letter).get(week_letter, {}), task_type)
+
+    def get_all_progress(self, task_type: Optional[str] = None) -> Dict[str, TaskProgress]:
+        """Get progress statistics for every week with a tracker, in one grouped query.
+
+        Args:
+            task_type: Specific task type to check (None for all tasks)
+
+        Returns:
+            TaskProgress by week letter, in week order
+        """
+        counters = self._progress()
+        weeks = [row["letter"] for row in self._query("SELECT letter FROM weeks ORDER BY letter")]
+        return {letter: to_task_progress(counters.get(letter, {}), task_type) for letter in weeks}
+
+    def _progress(self, week_letter: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Status counters by week and task type, over active items and week-level tasks."""
+        week_filter = " AND t.week = ?" if week_letter is not None else ""
+        params = (week_letter,) if week_letter is not None else ()
+        rows = self._query(
+            "SELECT t.week, t.task_type, t.status, COUNT(*) AS n"
+            " FROM tasks t JOIN items i ON i.week = t.week AND i.name = t.item"
+            f" WHERE i.removed = 0{week_filter} GROUP BY t.week, t.task_type, t.status",
+            params,
+        )
+        rows += self._query(
+            "SELECT week, task_type, status, COUNT(*) AS n FROM week_tasks t"
+            f" WHERE 1 = 1{week_filter} GROUP BY week, task_type, status",
+            params,
+        )
+        counters: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for row in rows:
+            by_status = counters.setdefault(row["week"], {}).setdefault(row["task_type"], {})
+            by_status[row["status"]] = by_status.get(row["status"], 0) + row["n"]
+        return counters
+
+    def get_ready_tasks(self, limit: Optional[int] = None) -> List[ReadyTask]:
+        """Get all ready tasks across all weeks (graph-aware).
+
+        Args:
+            limit: Maximum number of tasks to return (None for unlimited)
+
+        Returns:
+            List of ReadyTask objects ready for execution, sorted by week, then critical path first, then item
+        """
+        ready_tasks = []
+
+        # Item-level tasks: one indexed query per pending task type
+        pending_types = [
+            row["task_type"]
+            for row in self._query("SELECT DISTINCT task_type FROM tasks WHERE status = 'pending'")
+        ]
+        for task_type in pending_types:
+            config = get_task_config(task_type)
+            if config.is_week_level:
+                weeks = [
+                    row["week"]
+                    for row in self._query(
+                        "SELECT DISTINCT week FROM tasks WHERE status = 'pending' AND task_type = ?", (task_type,)
+                    )
+                ]
+                ready_weeks = [week for week in weeks if self._week_dependencies_met(week, config.depends_on)]
+                dependencies, params = f" AND t.week IN ({', '.join('?' for _ in ready_weeks)})", tuple(ready_weeks)
+            else:
+                dependencies, params = _dependencies_sql(config.depends_on), tuple(config.depends_on)
+            rows = self._query(
+                "SELECT t.week, t.item FROM tasks t JOIN items i ON i.week = t.week AND i.name = t.item"
+                f" WHERE t.status = 'pending' AND t.task_type = ? AND i.removed = 0{dependencies}",
+                (task_type,) + params,
+            )
+            ready_tasks.extend(
+                ReadyTask(week_letter=row["week"], item_name=row["item"], task_type=task_type, agent=config.agent)
+                for row in rows
+            )
+
+        # Week-level tasks
+        for row in self._query("SELECT week, task_type FROM week_tasks WHERE status = 'pending'"):
+            config = get_task_config(row["task_type"])
+            if self._week_dependencies_met(row["week"], config.depends_on):
+                ready_tasks.append(ReadyTask(
+                    week_letter=row["week"],
+                    item_name=None,
+                    task_type=row["task_type"],
+                    agent=config.agent
+                ))
+
+        # Sort by week, then critical path first, for deterministic ordering
+        ready_tasks.sort(key=ready_order)
+
+        # Apply limit if specified
+        if limit is not None:
+            ready_tasks = ready_tasks[:limit]
+
+        return ready_tasks
+
+    def _expired_leases(self, now: datetime) -> Dict[tuple, ReadyTask]:
+        """Get IN_PROGRESS tasks whose lease lapsed by ``now``, keyed by (week, item, task_type)."""
+        expired = {}
+        rows = self._query(
+            "SELECT t.week, t.item, t.task_type FROM tasks t JOIN items i ON i.week = t.week AND i.name = t.item"
+            f" WHERE t.status = 'in_progress' AND t.{LEASE_EXPIRY_COLUMN} <= ? AND i.removed = 0",
+            (_epoch(now),),
+        )
+        rows += self._query(
+            "SELECT week, NULL AS item, task_type FROM week_tasks"
+            f" WHERE status = 'in_progress' AND {LEASE_EXPIRY_COLUMN} <= ?",
+            (_epoch(now),),
+        )
+        for row in rows:
+            expired[(row["week"], row["item"], row["task_type"])] = ReadyTask(
+                week_letter=row["week"],
+                item_name=row["item"],
+                task_type=row["task_type"],
+                agent=get_task_config(row["task_type"]).agent,
+            )
+        return expired
+
+    def claim_ready_tasks(
+        self,
+        agent: Optional[str] = None,
+        n: int = 1,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        worker_id: Optional[str] = None
+    ) -> List[ReadyTask]:
+        """Atomically claim up to ``n`` ready tasks for one worker, in one transaction.
+
+        See ``YAMLTrackerBackend.claim_ready_tasks``.
+        """
+        worker_id = worker_id or default_worker_id()
+        claimed = []
+        with self._transaction() as conn:
+            now = datetime.now()
+            expired = self._expired_leases(now)
+            for task in select_claims(self.get_ready_tasks() + list(expired.values()), agent, n):
+                lease = lease_fields(worker_id, now, lease_seconds)
+                fields = dict(lease)
+                if (task.week_letter, task.item_name, task.task_type) in expired:
+                    fields["retry_count"] = self._retry_count(task) + 1
+                self._apply_update(conn, task.week_letter, task.item_name, task.task_type, TaskStatus.IN_PROGRESS, fields)
+                claimed.append(task.model_copy(update=lease))
+        return claimed
+
+    def _retry_count(self, task: ReadyTask) -> int:
+        if task.item_name is None:
+            rows = self._query(
+                "SELECT retry_count FROM week_tasks WHERE week = ? AND task_type = ?",
+                (task.week_letter, task.task_type),
+            )
+        else:
+            rows = self._query(
+                "SELECT retry_count FROM tasks WHERE week = ? AND item = ? AND task_type = ?",
+                (task.week_letter, task.item_name, task.task_type),
+            )
+        return rows[0]["retry_count"]
+
+    def renew_lease(
+        self,
+        week_letter: str,
+        item: Optional[str],
+        task_type: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        worker_id: Optional[str] = None
+    ) -> bool:
+        """Extend a lease taken with claim_ready_tasks; False if the worker no longer holds it."""
+        worker_id = worker_id or default_worker_id()
+        expires_at = lease_fields(worker_id, datetime.now(), lease_seconds)["lease_expires_at"]
+        if item is None or get_task_config(task_type).is_week_level:
+            table, key_sql, key = "week_tasks", "week = ? AND task_type = ?", (week_letter, task_type)
+        else:
+            table, key_sql, key = "tasks", "week = ? AND item = ? AND task_type = ?", (week_letter, item, task_type)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE {table} SET lease_expires_at = ?, {LEASE_EXPIRY_COLUMN} = ?"
+                f" WHERE {key_sql} AND status = 'in_progress' AND lease_owner = ?",
+                (expires_at.isoformat(), _epoch(expires_at)) + key + (worker_id,),
+            )
+        return cursor.rowcount > 0
+
+    def import_from_yaml(self, yaml_backend=None) -> List[str]:
+        """Import every week's tracker.yaml into the database.
+
+        Args:
+            yaml_backend: YAMLTrackerBackend to read from (default: one sharing this config)
+
+        Returns:
+            Letters of the imported weeks
+        """
+        from src.tracker.yaml_backend import YAMLTrackerBackend
+
+        yaml_backend = yaml_backend or YAMLTrackerBackend(self.cfg)
+        imported = []
+        for char_code in range(ord('A'), ord('Z') + 1):
+            letter = chr(char_code)
+            if yaml_backend.tracker_exists(letter):
+                self.save_tracker(letter, yaml_backend.load_tracker(letter))
+                imported.append(letter)
+        return imported
+
+    def export_to_yaml(self, yaml_backend=None) -> List[str]:
+        """Write every week in the database back to tracker.yaml files.
+
+        Args:
+            yaml_backend: YAMLTrackerBackend to write to (default: one sharing this config)
+
+        Returns:
+            Letters of the exported weeks
+        """
+        from src.tracker.yaml_backend import YAMLTrackerBackend
+
+        yaml_backend = yaml_backend or YAMLTrackerBackend(self.cfg)
+        exported = []
+        for row in self._query("SELECT letter FROM weeks ORDER BY letter"):
+            yaml_backend.save_tracker(row["letter"], self.load_tracker(row["letter"]))
+            exported.append(row["letter"])
+        return exported
@@ -1,12 +1,14 @@
 """YAML-based tracker backend implementation."""
 
 import os
-import yaml
+import random
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional
 from datetime import datetime
 
 from src.config import load_config, week_id
+from src.serialization import dump_yaml, load_yaml
 from src.tracker.models import (
     WeekTracker,
     ItemTasks,
@@ -16,6 +18,7 @@ from src.tracker.models import (
     TaskStatus,
 )
 from src.tracker.config import (
+    TASK_GRAPH,
     get_task_config,
     is_valid_task_type,
     DEFAULT_ITEM_TASKS,
@@ -25,17 +28,61 @@ from src.tracker.exceptions import (
     DependencyNotMetError,
     InvalidTaskTypeError,
     ItemNotFoundError,
+    TrackerConflictError,
     WeekNotFoundError,
 )
-from src.tracker.models import ReadyTask
+from src.tracker.models import ReadyTask, TaskUpdate
+from src.tracker.batch import TaskBatch, batch_updates
+from src.tracker.cache import file_signature, tracker_cache
+from src.tracker.leases import (
+    DEFAULT_LEASE_SECONDS,
+    default_worker_id,
+    lease_expired,
+    lease_fields,
+    select_claims,
+)
+from src.tracker.compact import CompactWeek, compact_cache
+from src.tracker.locking import file_lock
+from src.tracker.progress import (
+    PROGRESS_KEY,
+    SUMMARY_FILE,
+    ProgressSummary,
+    count_progress,
+    ensure_progress,
+    record_membership,
+    record_transition,
+    to_task_progress,
+)
+from src.tracker.ready_index import ReadyIndex, ready_index_cache
+
+DEFAULT_MAX_RETRIES = 5
+# Base delay before retrying a conflicting write, doubled per attempt
+RETRY_BACKOFF = 0.01
 
 
 class YAMLTrackerBackend:
     """YAML file-based tracker backend."""
     
-    def __init__(self, config=None):
-        """Initialize YAML tracker backend."""
+    def __init__(self, config=None, cache=None, max_retries: int = DEFAULT_MAX_RETRIES):
+        """Initialize YAML tracker backend.
+
+        Args:
+            config: Optional config to use instead of loading from environment
+            cache: TrackerCache for parsed trackers (default: the process-wide cache)
+            max_retries: Attempts of a read-modify-write before giving up on conflicts
+        """
         self.cfg = config or load_config()
+        self.cache = cache if cache is not None else tracker_cache
+        self.max_retries = max_retries
+
+    def close(self) -> None:
+        """Release resources; YAML trackers hold none between calls."""
+
+    def __enter__(self) -> "YAMLTrackerBackend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _get_tracker_path(self, week_letter: str) -> Path:
         """Get path to tracker file for a week.
@@ -61,6 +108,21 @@ class YAMLTrackerBackend:
         week_dir = self.cfg.weeks_dir / week_id(week_letter)
         return week_dir / "tasks.yaml"
     
+    def _get_lock_path(self, week_letter: str) -> Path:
+        """Get path to the lock file guarding a week's tracker.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            
+        Returns:
+            Path to tracker.yaml.lock file
+        """
+        return self._get_tracker_path(week_letter).with_suffix('.yaml.lock')
+    
+    def _get_summary(self) -> ProgressSummary:
+        """Get the progress summary shared by all weeks."""
+        return ProgressSummary(self.cfg.cache_dir / SUMMARY_FILE)
+    
     def tracker_exists(self, week_letter: str) -> bool:
         """Check if tracker exists for a week."""
         return self._get_tracker_path(week_letter).exists()
@@ -68,51 +130,180 @@ class YAMLTrackerBackend:
     def load_tracker(self, week_letter: str) -> WeekTracker:
         """Load tracker data for a specific week."""
         tracker_path = self._get_tracker_path(week_letter)
+        signature = file_signature(tracker_path)
         
-        if not tracker_path.exists():
+        if signature is None:
             # Initialize from tasks.yaml if it exists
             if self._get_tasks_path(week_letter).exists():
                 return self._initialize_from_tasks(week_letter)
             else:
                 raise WeekNotFoundError(f"No tracker or tasks found for week {week_letter}")
         
-        with open(tracker_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        cached = self.cache.get(tracker_path, signature)
+        if cached is not None:
+            return cached
         
-        return WeekTracker(**data)
+        with open(tracker_path, 'r', encoding='utf-8') as f:
+            data = load_yaml(f)
+        
+        tracker = WeekTracker(**data)
+        # Recounted on every parse, which costs little next to the parse
+        # itself, so a hand-edited file cannot leave stale counters behind
+        tracker.metadata[PROGRESS_KEY] = count_progress(tracker)
+        # Keyed on the signature taken before reading: a concurrent rewrite
+        # only makes the next lookup miss
+        self.cache.put(tracker_path, signature, tracker)
+        return tracker
     
-    def save_tracker(self, week_letter: str, tracker: WeekTracker) -> None:
-        """Save tracker data for a specific week."""
+    def save_tracker(
+        self,
+        week_letter: str,
+        tracker: WeekTracker,
+        expected_version: Optional[int] = None
+    ) -> None:
+        """Save tracker data for a specific week.
+        
+        The write happens under the week's lock and increments
+        ``metadata["version"]``.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            tracker: WeekTracker instance to save
+            expected_version: If given, only save while the stored tracker still has this version
+            
+        Raises:
+            TrackerConflictError: If the stored version differs from expected_version
+        """
         tracker_path = self._get_tracker_path(week_letter)
         
         # Ensure directory exists
         tracker_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert to dict and save atomically
-        data = tracker.model_dump(mode='json')
-        
-        # Write to temp file first, then rename (atomic on POSIX)
-        temp_path = tracker_path.with_suffix('.yaml.tmp')
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-        
-        temp_path.replace(tracker_path)
+        with file_lock(self._get_lock_path(week_letter)):
+            stored_version = self._stored_version(week_letter)
+            if expected_version is not None and stored_version != expected_version:
+                raise TrackerConflictError(
+                    f"Tracker for week {week_letter} changed on disk "
+                    f"(version {stored_version}, expected {expected_version})"
+                )
+            tracker.metadata["version"] = stored_version + 1
+            # Blind saves may carry trackers built without going through transitions
+            if expected_version is None:
+                tracker.metadata[PROGRESS_KEY] = count_progress(tracker)
+            else:
+                ensure_progress(tracker)
+            old_signature = self._state_signature(week_letter)
+            
+            # Convert to dict and save atomically
+            data = tracker.model_dump(mode='json')
+            
+            # Write to temp file first, then rename (atomic on POSIX)
+            temp_path = tracker_path.with_suffix('.yaml.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                dump_yaml(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            
+            temp_path.replace(tracker_path)
+            
+            # Write-through so the next load does not re-parse what was just saved
+            self.cache.put(tracker_path, file_signature(tracker_path), tracker)
+            
+            # Only a version-checked save is known to derive from the indexed
+            # state; blind saves leave the index to be rebuilt
+            transitions = tracker._transitions if expected_version is not None else []
+            ready_index_cache.advance(
+                tracker_path, old_signature, self._state_signature(week_letter), tracker, transitions
+            )
+            tracker._transitions.clear()
+            self._publish_progress(week_letter, tracker)
     
-    def _initialize_from_tasks(self, week_letter: str) -> WeekTracker:
-        """Initialize tracker from tasks.yaml file.
+    def _publish_progress(self, week_letter: str, tracker: WeekTracker) -> None:
+        """Copy the counters of a just-written tracker into the progress summary."""
+        self._get_summary().update({
+            week_letter: {"signature": self._state_signature(week_letter), "progress": ensure_progress(tracker)}
+        })
+    
+    def _compact_week(self, week_letter: str) -> CompactWeek:
+        """Get the compact status arrays of a week, building them on a miss.
         
         Args:
             week_letter: Letter of the week (A-Z)
             
         Returns:
-            Newly initialized WeekTracker
+            CompactWeek of the current state (shared, do not modify)
         """
-        tasks_path = self._get_tasks_path(week_letter)
+        tracker_path = self._get_tracker_path(week_letter)
+        # Taken before loading: a concurrent write only makes the next lookup miss
+        signature = self._state_signature(week_letter)
+        week = compact_cache.get(tracker_path, signature)
+        if week is None:
+            week = CompactWeek.from_tracker(self.load_tracker(week_letter))
+            compact_cache.put(tracker_path, signature, week)
+        return week
+    
+    def _state_signature(self, week_letter: str):
+        """Signature of everything the state of a week is read from."""
+        return file_signature(self._get_tracker_path(week_letter))
+    
+    def _stored_version(self, week_letter: str) -> int:
+        """Version of the tracker.yaml on disk (0 if there is none)."""
+        if file_signature(self._get_tracker_path(week_letter)) is None:
+            return 0
+        return YAMLTrackerBackend.load_tracker(self, week_letter).metadata.get("version", 0)
+    
+    def _modify(
+        self,
+        week_letter: str,
+        mutate: Callable[[WeekTracker], bool],
+        create: bool = False
+    ) -> None:
+        """Read-modify-write a tracker with an optimistic version check.
         
-        with open(tasks_path, 'r', encoding='utf-8') as f:
-            item_names = yaml.safe_load(f) or []
+        ``mutate`` runs on a freshly loaded tracker and returns False to skip
+        the write. If another writer saved the week in the meantime, the whole
+        cycle is retried against its state, the last time under the week's lock.
         
-        # Initialize tracker with all items
+        Args:
+            week_letter: Letter of the week (A-Z)
+            mutate: Function applying the change in memory
+            create: Start from an empty tracker if the week has none
+            
+        Raises:
+            TrackerConflictError: If a writer bypassing the lock changed the file
+        """
+        attempts = max(self.max_retries, 1)
+        for attempt in range(attempts):
+            if attempt == attempts - 1:
+                # Last attempt: hold the lock for the whole cycle so that
+                # writers using this backend cannot conflict with it
+                with file_lock(self._get_lock_path(week_letter)):
+                    self._modify_once(week_letter, mutate, create)
+                return
+            try:
+                self._modify_once(week_letter, mutate, create)
+                return
+            except TrackerConflictError:
+                time.sleep(RETRY_BACKOFF * (2 ** attempt) * (1 + random.random()))
+    
+    def _modify_once(self, week_letter: str, mutate: Callable[[WeekTracker], bool], create: bool) -> None:
+        """One load, mutate and version-checked save cycle."""
+        if create and not self.tracker_exists(week_letter):
+            tracker = self._new_tracker(week_letter)
+        else:
+            tracker = self.load_tracker(week_letter)
+        version = tracker.metadata.get("version", 0)
+        
+        if mutate(tracker):
+            self.save_tracker(week_letter, tracker, expected_version=version)
+    
+    def _new_tracker(self, week_letter: str) -> WeekTracker:
+        """Create an empty tracker with default week-level tasks.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            
+        Returns:
+            WeekTracker without items
+        """
         tracker = WeekTracker(
             items={},
             week_tasks=WeekTasks(),
@@ -121,17 +312,31 @@ class YAMLTrackerBackend:
                 "week_letter": week_letter,
             }
         )
-        
-        # Add each item with default tasks
-        for item_name in item_names:
-            tracker.items[item_name] = self._create_default_item_tasks()
-        
-        # Add week-level tasks
         for task_type in DEFAULT_WEEK_TASKS:
             tracker.week_tasks.tasks[task_type] = TaskRecord(
                 status=TaskStatus.PENDING,
                 agent=get_task_config(task_type).agent
             )
+        return tracker
+    
+    def _initialize_from_tasks(self, week_letter: str) -> WeekTracker:
+        """Initialize tracker from tasks.yaml file.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            
+        Returns:
+            Newly initialized WeekTracker
+        """
+        tasks_path = self._get_tasks_path(week_letter)
+        
+        with open(tasks_path, 'r', encoding='utf-8') as f:
+            item_names = load_yaml(f) or []
+        
+        # Initialize tracker with all items and week-level tasks
+        tracker = self._new_tracker(week_letter)
+        for item_name in item_names:
+            tracker.items[item_name] = self._create_default_item_tasks()
         
         # Save initialized tracker
         self.save_tracker(week_letter, tracker)
@@ -159,22 +364,8 @@ class YAMLTrackerBackend:
         if not is_valid_task_type(task_type):
             raise InvalidTaskTypeError(f"Invalid task type: {task_type}")
         
-        tracker = self.load_tracker(week_letter)
-        
-        pending_items = []
-        for item_name, item_tasks in tracker.items.items():
-            # Skip removed items
-            if item_tasks.removed:
-                continue
-            
-            # Check if task exists and is pending
-            task_record = item_tasks.get(task_type)
-            if task_record and task_record.status == TaskStatus.PENDING:
-                # Check if dependencies are met
-                if self._check_dependencies(tracker, item_name, task_type):
-                    pending_items.append(item_name)
-        
-        return pending_items
+        # Active items with a pending task whose dependencies are met
+        return list(self._compact_week(week_letter).ready_items(task_type))
     
     def can_start_task(
         self,
@@ -188,7 +379,7 @@ class YAMLTrackerBackend:
             return False
         
         if tracker is None:
-            tracker = self.load_tracker(week_letter)
+            return self._compact_week(week_letter).dependencies_met(item, task_type)
         
         return self._check_dependencies(tracker, item, task_type)
     
@@ -209,11 +400,12 @@ class YAMLTrackerBackend:
             True if dependencies are met, False otherwise
         """
         config = get_task_config(task_type)
+        dependencies = TASK_GRAPH.dependencies[task_type]
         
         # Week-level task
         if item is None or config.is_week_level:
             # Check if all items have completed the dependent task
-            for dep_task_type in config.depends_on:
+            for dep_task_type in dependencies:
                 for item_name, item_tasks in tracker.items.items():
                     if item_tasks.removed:
                         continue
@@ -230,7 +422,7 @@ class YAMLTrackerBackend:
         item_tasks = tracker.items[item]
         
         # Check each dependency
-        for dep_task_type in config.depends_on:
+        for dep_task_type in dependencies:
             dep_task = item_tasks.get(dep_task_type)
             if not dep_task or dep_task.status != TaskStatus.COMPLETED:
                 return False
@@ -246,10 +438,62 @@ class YAMLTrackerBackend:
         **metadata
     ) -> None:
         """Update task status and metadata."""
+        self.update_tasks(week_letter, [TaskUpdate(item=item, task_type=task_type, status=status, metadata=metadata)])
+    
+    def update_tasks(self, week_letter: str, updates: Iterable[TaskUpdate]) -> None:
+        """Apply several task updates with one load and one atomic write.
+        
+        Updates are applied in order to the in-memory tracker, so a task can
+        be started once an earlier update in the same batch completed its
+        dependencies. If any update fails, nothing is written. A concurrent
+        save by another writer makes the batch re-apply on top of it.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            updates: TaskUpdate objects to apply
+        """
+        updates = list(updates)
+        if not updates:
+            return
+        
+        def apply(tracker: WeekTracker) -> bool:
+            for update in updates:
+                self._apply_update(tracker, update.item, update.task_type, update.status, update.metadata)
+            return True
+        
+        self._modify(week_letter, apply)
+    
+    def batch(self, week_letter: str) -> ContextManager[TaskBatch]:
+        """Queue updates in a ``with`` block and persist them together on exit.
+        
+        Example:
+            >>> with tracker.batch('A') as batch:
+            ...     batch.update_task('Argo', 'research', TaskStatus.COMPLETED)
+            ...     batch.update_task('Atlantis', 'research', TaskStatus.COMPLETED)
+        """
+        return batch_updates(self, week_letter)
+    
+    def _apply_update(
+        self,
+        tracker: WeekTracker,
+        item: Optional[str],
+        task_type: str,
+        status: TaskStatus,
+        metadata: Dict[str, Any]
+    ) -> TaskRecord:
+        """Apply one status transition to an in-memory tracker.
+        
+        Returns:
+            The updated TaskRecord
+        
+        Raises:
+            InvalidTaskTypeError: If task type is invalid
+            ItemNotFoundError: If item doesn't exist
+            DependencyNotMetError: If trying to start task with unmet dependencies
+        """
         if not is_valid_task_type(task_type):
             raise InvalidTaskTypeError(f"Invalid task type: {task_type}")
         
-        tracker = self.load_tracker(week_letter)
         config = get_task_config(task_type)
         
         # Determine if week-level or item-level task
@@ -257,7 +501,8 @@ class YAMLTrackerBackend:
         
         if is_week_task:
             # Week-level task
-            if task_type not in tracker.week_tasks.tasks:
+            created = task_type not in tracker.week_tasks.tasks
+            if created:
                 tracker.week_tasks.tasks[task_type] = TaskRecord(agent=config.agent)
             
             task_record = tracker.week_tasks.tasks[task_type]
@@ -266,7 +511,8 @@ class YAMLTrackerBackend:
             if item not in tracker.items:
                 raise ItemNotFoundError(f"Item not found: {item}")
             
-            if task_type not in tracker.items[item].tasks:
+            created = task_type not in tracker.items[item].tasks
+            if created:
                 tracker.items[item].tasks[task_type] = TaskRecord(agent=config.agent)
             
             task_record = tracker.items[item].tasks[task_type]
@@ -281,6 +527,9 @@ class YAMLTrackerBackend:
                 )
         
         # Update task record
+        key = None if is_week_task else item
+        tracker._transitions.append((key, task_type, task_record.status, status))
+        record_transition(tracker, key, task_type, None if created else task_record.status, status)
         task_record.status = status
         
         if status == TaskStatus.IN_PROGRESS and task_record.started_at is None:
@@ -289,106 +538,98 @@ class YAMLTrackerBackend:
         if status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED):
             task_record.completed_at = datetime.now()
         
+        # A task leaving IN_PROGRESS no longer holds a claim
+        if status != TaskStatus.IN_PROGRESS:
+            task_record.lease_owner = None
+            task_record.lease_expires_at = None
+        
         # Update metadata
         for key, value in metadata.items():
             if hasattr(task_record, key):
                 setattr(task_record, key, value)
         
-        # Save updated tracker
-        self.save_tracker(week_letter, tracker)
+        return task_record
     
     def sync_with_etl(self, week_letter: str, items: List[str]) -> None:
         """Synchronize tracker with ETL output."""
-        changes_detected = False
-
-        # Load or initialize tracker
-        if self.tracker_exists(week_letter):
-            tracker = self.load_tracker(week_letter)
-        else:
-            changes_detected = True
-            tracker = WeekTracker(
-                items={},
-                week_tasks=WeekTasks(),
-                metadata={
-                    "created_at": datetime.now().isoformat(),
-                    "week_letter": week_letter,
-                }
-            )
+        def apply(tracker: WeekTracker) -> bool:
+            changes_detected = False
             
-            # Initialize week-level tasks
-            for task_type in DEFAULT_WEEK_TASKS:
-                tracker.week_tasks.tasks[task_type] = TaskRecord(
-                    status=TaskStatus.PENDING,
-                    agent=get_task_config(task_type).agent
-                )
-        
-        # Check for missing metadata or mismatched count
-        if "last_synced" not in tracker.metadata or tracker.metadata.get("etl_item_count") != len(items):
-            changes_detected = True
-
-        # Add new items from ETL and restore removed items
-        for item_name in items:
-            if item_name not in tracker.items:
-                tracker.items[item_name] = self._create_default_item_tasks()
-                changes_detected = True
-            elif getattr(tracker.items[item_name], "removed", False):
-                # Item was removed but is now back in ETL
-                tracker.items[item_name].removed = False
+            # Check for missing metadata (e.g. a new tracker) or mismatched count
+            if "last_synced" not in tracker.metadata or tracker.metadata.get("etl_item_count") != len(items):
                 changes_detected = True
-        
-        # Mark removed items (preserve history)
-        etl_items_set = set(items)
-        for item_name in tracker.items:
-            if item_name not in etl_items_set:
-                if not getattr(tracker.items[item_name], "removed", False):
-                    tracker.items[item_name].removed = True
+            
+            # Add new items from ETL and restore removed items
+            for item_name in items:
+                if item_name not in tracker.items:
+                    tracker.items[item_name] = self._create_default_item_tasks()
+                    tracker._transitions.append((item_name, None, False, True))
+                    record_membership(tracker, tracker.items[item_name], added=True)
+                    changes_detected = True
+                elif getattr(tracker.items[item_name], "removed", False):
+                    # Item was removed but is now back in ETL
+                    tracker.items[item_name].removed = False
+                    tracker._transitions.append((item_name, None, False, True))
+                    record_membership(tracker, tracker.items[item_name], added=True)
                     changes_detected = True
+            
+            # Mark removed items (preserve history)
+            etl_items_set = set(items)
+            for item_name in tracker.items:
+                if item_name not in etl_items_set:
+                    if not getattr(tracker.items[item_name], "removed", False):
+                        tracker.items[item_name].removed = True
+                        tracker._transitions.append((item_name, None, True, False))
+                        record_membership(tracker, tracker.items[item_name], added=False)
+                        changes_detected = True
+            
+            if changes_detected:
+                # Update metadata
+                tracker.metadata["last_synced"] = datetime.now().isoformat()
+                tracker.metadata["etl_item_count"] = len(items)
+            
+            return changes_detected
         
-        if changes_detected:
-            # Update metadata
-            tracker.metadata["last_synced"] = datetime.now().isoformat()
-            tracker.metadata["etl_item_count"] = len(items)
-
-            # Save updated tracker
-            self.save_tracker(week_letter, tracker)
+        self._modify(week_letter, apply, create=True)
     
     def get_progress(self, week_letter: str, task_type: Optional[str] = None) -> TaskProgress:
-        """Get progress statistics for a week."""
-        tracker = self.load_tracker(week_letter)
-        
-        # Count tasks by status
-        counts = {
-            TaskStatus.PENDING: 0,
-            TaskStatus.IN_PROGRESS: 0,
-            TaskStatus.COMPLETED: 0,
-            TaskStatus.FAILED: 0,
-            TaskStatus.SKIPPED: 0,
-        }
-        
-        # Count item-level tasks
-        for item_name, item_tasks in tracker.items.items():
-            if item_tasks.removed:
-                continue
-            
-            for task_name, task_record in item_tasks.tasks.items():
-                if task_type is None or task_name == task_type:
-                    counts[task_record.status] += 1
+        """Get progress statistics for a week from its status counters."""
+        return to_task_progress(ensure_progress(self.load_tracker(week_letter)), task_type)
+    
+    def get_all_progress(self, task_type: Optional[str] = None) -> Dict[str, TaskProgress]:
+        """Get progress statistics for every week with a tracker.
         
-        # Count week-level tasks if not filtering by task type
-        if task_type is None:
-            for task_record in tracker.week_tasks.tasks.values():
-                counts[task_record.status] += 1
+        Answered from the progress summary; only weeks whose tracker changed
+        since their summary entry was written (e.g. edited by hand) are loaded.
         
-        total = sum(counts.values())
+        Args:
+            task_type: Specific task type to check (None for all tasks)
+            
+        Returns:
+            TaskProgress by week letter, in week order
+        """
+        summary = self._get_summary()
+        entries = summary.read()
+        progress, refreshed = {}, {}
         
-        return TaskProgress(
-            total=total,
-            pending=counts[TaskStatus.PENDING],
-            in_progress=counts[TaskStatus.IN_PROGRESS],
-            completed=counts[TaskStatus.COMPLETED],
-            failed=counts[TaskStatus.FAILED],
-            skipped=counts[TaskStatus.SKIPPED],
-        )
+        for char_code in range(ord('A'), ord('Z') + 1):
+            letter = chr(char_code)
+            if not self.tracker_exists(letter):
+                continue
+            
+            signature = self._state_signature(letter)
+            entry = entries.get(letter)
+            if not ProgressSummary.matches(entry, signature):
+                try:
+                    counters = self._compact_week(letter).count_progress()
+                except WeekNotFoundError:
+                    continue
+                entry = refreshed[letter] = {"signature": signature, "progress": counters}
+            progress[letter] = to_task_progress(entry["progress"], task_type)
+        
+        if refreshed:
+            summary.update(refreshed)
+        return progress
     
     def get_ready_tasks(self, limit: Optional[int] = None) -> List[ReadyTask]:
         """Get all ready tasks across all weeks (graph-aware).
@@ -401,55 +642,233 @@ class YAMLTrackerBackend:
             limit: Maximum number of tasks to return (None for unlimited)
             
         Returns:
-            List of ReadyTask objects ready for execution, sorted by week then task type
+            List of ReadyTask objects ready for execution, sorted by week, then critical path first, then item
         """
         ready_tasks = []
         
-        # Check all weeks A-Z
+        # Check all weeks A-Z; each week's tasks come sorted from its index
         for char_code in range(ord('A'), ord('Z') + 1):
+            if limit is not None and len(ready_tasks) >= limit:
+                break
             letter = chr(char_code)
             if not self.tracker_exists(letter):
                 continue
             
             try:
-                tracker = self.load_tracker(letter)
+                remaining = None if limit is None else limit - len(ready_tasks)
+                ready_tasks.extend(self._indexed_ready_tasks(letter, remaining))
             except WeekNotFoundError:
                 continue
-            
-            # Check item-level tasks
-            for item_name, item_tasks in tracker.items.items():
-                if item_tasks.removed:
-                    continue
-                
-                for task_type, task_record in item_tasks.tasks.items():
-                    # Only include pending tasks where dependencies are met
-                    if task_record.status == TaskStatus.PENDING:
-                        if self.can_start_task(letter, item_name, task_type, tracker=tracker):
-                            config = get_task_config(task_type)
-                            ready_tasks.append(ReadyTask(
-                                week_letter=letter,
-                                item_name=item_name,
-                                task_type=task_type,
-                                agent=config.agent
-                            ))
-            
-            # Check week-level tasks
-            for task_type, task_record in tracker.week_tasks.tasks.items():
-                if task_record.status == TaskStatus.PENDING:
-                    if self.can_start_task(letter, None, task_type, tracker=tracker):
-                        config = get_task_config(task_type)
-                        ready_tasks.append(ReadyTask(
-                            week_letter=letter,
-                            item_name=None,
-                            task_type=task_type,
-                            agent=config.agent
-                        ))
-        
-        # Sort by week, then task type for deterministic ordering
-        ready_tasks.sort(key=lambda t: (t.week_letter, t.task_type, t.item_name or ""))
         
         # Apply limit if specified
         if limit is not None:
             ready_tasks = ready_tasks[:limit]
         
         return ready_tasks
+    
+    def _indexed_ready_tasks(self, letter: str, limit: Optional[int] = None) -> List[ReadyTask]:
+        """Get the ready tasks of a week from its ReadyIndex.
+        
+        Args:
+            letter: Letter of the week (A-Z)
+            limit: Maximum number of tasks to return (None for unlimited)
+            
+        Returns:
+            Ready tasks, critical path first, then sorted by item
+        """
+        return self._read_ready_index(letter, lambda index: index.ready_tasks(limit))
+    
+    def _read_ready_index(self, letter: str, read: Callable[[ReadyIndex], Any]) -> Any:
+        """Call ``read`` on the ReadyIndex of a week, building the index on a miss."""
+        tracker_path = self._get_tracker_path(letter)
+        # Taken before loading: a concurrent write only makes the next poll miss
+        signature = self._state_signature(letter)
+        result = ready_index_cache.read(tracker_path, signature, read)
+        if result is None:
+            index = ReadyIndex.build(letter, self._compact_week(letter))
+            result = read(index)
+            ready_index_cache.put(tracker_path, signature, index)
+        return result
+    
+    def _claim_candidates(
+        self,
+        letter: str,
+        tracker: WeekTracker,
+        now: datetime,
+        agent: Optional[str],
+        limit: int
+    ) -> List[ReadyTask]:
+        """Get the claimable tasks of a week: ready ones and those whose lease expired by ``now``.
+        
+        Both come from the week's ReadyIndex, so no pass over the records is
+        needed; each candidate is checked again against ``tracker``.
+        
+        Args:
+            letter: Letter of the week (A-Z)
+            tracker: WeekTracker the claims will be applied to
+            now: Time the leases are checked against
+            agent: Only tasks of this agent (None for any agent)
+            limit: Number of tasks to be claimed; fewer ready tasks are taken from the index
+            
+        Returns:
+            Unsorted list of ReadyTask objects holding the first ``limit`` claimable tasks
+        """
+        ready, in_progress = self._read_ready_index(
+            letter, lambda index: (index.ready_tasks(limit, agent), index.in_progress_tasks())
+        )
+        candidates = [task for task in ready if self._still_ready(tracker, task.item_name, task.task_type)]
+        for item, task_type in in_progress:
+            record = self._get_record(tracker, item, task_type)
+            if record is None or not lease_expired(record, now):
+                continue
+            if self._check_dependencies(tracker, item, task_type):
+                candidates.append(ReadyTask(
+                    week_letter=letter,
+                    item_name=item,
+                    task_type=task_type,
+                    agent=get_task_config(task_type).agent,
+                ))
+        return candidates
+    
+    def _still_ready(self, tracker: WeekTracker, item: Optional[str], task_type: str) -> bool:
+        """Check that a task from the index is still pending with its dependencies met in ``tracker``."""
+        if item is not None and (item not in tracker.items or tracker.items[item].removed):
+            return False
+        record = self._get_record(tracker, item, task_type)
+        return (
+            record is not None
+            and record.status == TaskStatus.PENDING
+            and self._check_dependencies(tracker, item, task_type)
+        )
+    
+    def claim_ready_tasks(
+        self,
+        agent: Optional[str] = None,
+        n: int = 1,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        worker_id: Optional[str] = None
+    ) -> List[ReadyTask]:
+        """Atomically claim up to ``n`` ready tasks for one worker.
+        
+        Claimed tasks move to IN_PROGRESS with a lease, so other workers no
+        longer see them. Tasks whose lease expired are claimable again, with
+        their retry_count incremented. Completing, failing or skipping a task
+        releases its lease.
+        
+        Args:
+            agent: Only claim tasks of this agent (None for any agent)
+            n: Maximum number of tasks to claim
+            lease_seconds: How long the claim holds without renew_lease()
+            worker_id: Identity of the claiming worker (default: hostname and pid)
+            
+        Returns:
+            Claimed tasks in get_ready_tasks order, with their lease
+        """
+        worker_id = worker_id or default_worker_id()
+        claimed = []
+        
+        for char_code in range(ord('A'), ord('Z') + 1):
+            if len(claimed) >= n:
+                break
+            letter = chr(char_code)
+            if not self.tracker_exists(letter):
+                continue
+            
+            remaining = n - len(claimed)
+            
+            def plan(tracker: WeekTracker) -> List[TaskUpdate]:
+                now = datetime.now()
+                updates = []
+                candidates = self._claim_candidates(letter, tracker, now, agent, remaining)
+                for task in select_claims(candidates, agent, remaining):
+                    record = self._get_record(tracker, task.item_name, task.task_type)
+                    fields = lease_fields(worker_id, now, lease_seconds)
+                    if lease_expired(record, now):
+                        fields["retry_count"] = record.retry_count + 1
+                    updates.append(TaskUpdate(
+                        item=task.item_name,
+                        task_type=task.task_type,
+                        status=TaskStatus.IN_PROGRESS,
+                        metadata=fields,
+                    ))
+                return updates
+            
+            for update in self._plan_updates(letter, plan):
+                claimed.append(ReadyTask(
+                    week_letter=letter,
+                    item_name=update.item,
+                    task_type=update.task_type,
+                    agent=get_task_config(update.task_type).agent,
+                    lease_owner=update.metadata["lease_owner"],
+                    lease_expires_at=update.metadata["lease_expires_at"],
+                ))
+        
+        return claimed
+    
+    def renew_lease(
+        self,
+        week_letter: str,
+        item: Optional[str],
+        task_type: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        worker_id: Optional[str] = None
+    ) -> bool:
+        """Extend a lease taken with claim_ready_tasks.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            item: Name of the item (None for week-level tasks)
+            task_type: Type of the claimed task
+            lease_seconds: New lease duration, counted from now
+            worker_id: Worker holding the lease (default: hostname and pid)
+            
+        Returns:
+            False if the worker no longer holds the lease (it expired and was
+            reclaimed, or the task was completed)
+        """
+        worker_id = worker_id or default_worker_id()
+        
+        def plan(tracker: WeekTracker) -> List[TaskUpdate]:
+            record = self._get_record(tracker, item, task_type)
+            if record is None or record.status != TaskStatus.IN_PROGRESS or record.lease_owner != worker_id:
+                return []
+            return [TaskUpdate(
+                item=item,
+                task_type=task_type,
+                status=TaskStatus.IN_PROGRESS,
+                metadata=lease_fields(worker_id, datetime.now(), lease_seconds),
+            )]
+        
+        return bool(self._plan_updates(week_letter, plan))
+    
+    def _get_record(self, tracker: WeekTracker, item: Optional[str], task_type: str) -> Optional[TaskRecord]:
+        """Get the record of a task, or None if it does not exist."""
+        if item is None or get_task_config(task_type).is_week_level:
+            return tracker.week_tasks.get(task_type)
+        item_tasks = tracker.items.get(item)
+        return item_tasks.get(task_type) if item_tasks else None
+    
+    def _plan_updates(
+        self,
+        week_letter: str,
+        plan: Callable[[WeekTracker], List[TaskUpdate]]
+    ) -> List[TaskUpdate]:
+        """Derive updates from the current tracker and apply them atomically.
+        
+        Args:
+            week_letter: Letter of the week (A-Z)
+            plan: Function returning the updates to apply to the given tracker
+            
+        Returns:
+            The updates that were applied
+        """
+        planned = []
+        
+        def apply(tracker: WeekTracker) -> bool:
+            planned[:] = plan(tracker)
+            for update in planned:
+                self._apply_update(tracker, update.item, update.task_type, update.status, update.metadata)
+            return bool(planned)
+        
+        self._modify(week_letter, apply)
+        return planned
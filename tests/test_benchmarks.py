@@ -0,0 +1,49 @@
+"""Unit tests for the benchmark suite."""
+
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.suite import compare, percentile, run_suite
+from benchmarks.synthetic import generate_landscape, parse_scale
+from src.pipeline.index import LandscapeIndex
+
+
+def test_synthetic_landscape():
+    assert parse_scale("1k") == 1000
+    assert parse_scale("100k") == 100000
+    assert parse_scale(250) == 250
+
+    landscape = generate_landscape(500, seed=1)
+    assert landscape == generate_landscape(500, seed=1)
+    index = LandscapeIndex.build(landscape)
+    assert len(index) == 500
+    assert len(set(index.names)) == 500
+
+
+def test_percentile():
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([1.0, 2.0], 95) == 1.95
+    assert percentile([5.0], 95) == 5.0
+
+
+def test_run_suite_reports_every_stage(tmp_path):
+    report = run_suite("200", samples=1, calls=2, workdir=str(tmp_path))
+
+    for stage in ("extract", "transform.get_landscape_by_letter", "load", "sync_with_etl", "update_task",
+                  "get_progress", "load_tracker.restore", "load_tracker.restore.copy", "get_ready_tasks",
+                  "generate_summary", "generate_tool_pages"):
+        result = report["stages"][stage]
+        assert result["p50_ms"] <= result["p95_ms"]
+        assert result["peak_rss_kb"] > 0
+    assert report["stages"]["update_task"]["samples"] == 2
+    assert report["scale"]["items"] == 200
+    # The data tree is removed afterwards
+    assert list(tmp_path.iterdir()) == []
+
+    slower = {"stages": {name: dict(stage, p50_ms=stage["p50_ms"] * 2 + 1) for name, stage in report["stages"].items()}}
+    assert compare(report, report) == []
+    timed = {name for name, stage in report["stages"].items() if stage["p50_ms"]}
+    assert {regression["stage"] for regression in compare(report, slower)} == timed
@@ -0,0 +1,51 @@
+"""Unit tests for the compact tracker representation."""
+
+import random
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tracker.compact import CompactWeek
+from src.tracker.models import ItemTasks, TaskRecord, TaskStatus, WeekTasks, WeekTracker
+from src.tracker.progress import count_progress
+from src.tracker.yaml_backend import YAMLTrackerBackend
+
+
+def _random_tracker(seed, size=60):
+    rng = random.Random(seed)
+    tracker = WeekTracker(week_tasks=WeekTasks(tasks={"blog_post": TaskRecord()}))
+    for n in range(size):
+        tasks = {}
+        for task_type in ("research", "content"):
+            if rng.random() < 0.9:
+                status = rng.choice(list(TaskStatus))
+                tasks[task_type] = TaskRecord(
+                    status=status,
+                    started_at=datetime(2024, 1, 1, 12, n % 60, 30, 123456) if rng.random() < 0.5 else None,
+                )
+        tracker.items[f"Item{n}"] = ItemTasks(tasks=tasks, removed=rng.random() < 0.1)
+    return tracker
+
+
+def test_compact_matches_tracker():
+    backend = YAMLTrackerBackend(config=object())
+    for seed in range(20):
+        tracker = _random_tracker(seed)
+        week = CompactWeek.from_tracker(tracker)
+
+        assert week.count_progress() == count_progress(tracker)
+        for task_type in ("research", "content", "blog_post"):
+            expected = [
+                name for name, item_tasks in tracker.items.items()
+                if not item_tasks.removed
+                and item_tasks.get(task_type) is not None
+                and item_tasks.get(task_type).status == TaskStatus.PENDING
+                and backend._check_dependencies(tracker, name, task_type)
+            ]
+            assert list(week.ready_items(task_type)) == expected
+            for name in list(tracker.items) + ["Missing"]:
+                assert week.dependencies_met(name, task_type) == backend._check_dependencies(tracker, name, task_type)
+        assert week.dependencies_met(None, "blog_post") == backend._check_dependencies(tracker, None, "blog_post")
@@ -0,0 +1,157 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pipeline.cache import ParsedCache
+from src.pipeline.extract import get_landscape_data, load_yaml, stream_landscape_data
+from src.pipeline.transform import get_all_categories, get_landscape_by_letter, get_stats_per_category
+
+TEST_DATA = Path(__file__).parent / 'test_data' / 'landscape.yml'
+EXCLUDED_DATA = Path(__file__).parent / 'test_data' / 'landscape_with_excluded.yml'
+
+
+class LandscapeStub(BaseHTTPRequestHandler):
+    """Serves a landscape document and honours If-None-Match."""
+    body = TEST_DATA.read_bytes()
+    statuses = []
+
+    def do_GET(self):
+        etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.statuses.append(304)
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.statuses.append(200)
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    LandscapeStub.statuses = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), LandscapeStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/landscape.yml'
+
+
+def test_conditional_get_reuses_snapshot():
+    cache_dir = tempfile.mkdtemp()
+    server, url = _serve()
+    try:
+        first = get_landscape_data(url, cache_dir=cache_dir)
+        second = get_landscape_data(url, cache_dir=cache_dir)
+
+        assert LandscapeStub.statuses == [200, 304]
+        assert first == second
+        assert first[0]['name'] == 'Category 1'
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir)
+
+
+def test_conditional_get_refreshes_on_change():
+    cache_dir = tempfile.mkdtemp()
+    server, url = _serve()
+    original_body = LandscapeStub.body
+    try:
+        get_landscape_data(url, cache_dir=cache_dir)
+        LandscapeStub.body = b"landscape:\n  - name: Changed\n    subcategories: []\n"
+        landscape = get_landscape_data(url, cache_dir=cache_dir)
+
+        assert LandscapeStub.statuses == [200, 200]
+        assert landscape == [{'name': 'Changed', 'subcategories': []}]
+    finally:
+        LandscapeStub.body = original_body
+        server.shutdown()
+        shutil.rmtree(cache_dir)
+
+
+def test_parsed_cache_skips_yaml_parse():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        first = get_landscape_data(str(TEST_DATA), cache_dir=cache_dir)
+        with patch('src.pipeline.extract.load_yaml', wraps=load_yaml) as mock_load:
+            second = get_landscape_data(str(TEST_DATA), cache_dir=cache_dir)
+            mock_load.assert_not_called()
+        assert first == second
+        assert len(list((Path(cache_dir) / 'parsed').glob('*.pickle'))) == 1
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test_parsed_cache_evicts_oldest_entries():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        cache = ParsedCache(cache_dir, keep=2)
+        for index in range(4):
+            cache.put(f'digest{index}', [{'name': str(index)}])
+            entry = Path(cache_dir) / 'parsed' / f'digest{index}.pickle'
+            # Spread mtimes so the eviction order is deterministic
+            os.utime(entry, ns=(index * 10**9, index * 10**9))
+        cache.evict()
+
+        assert cache.get('digest0') is None
+        assert cache.get('digest1') is None
+        assert cache.get('digest3') == [{'name': '3'}]
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test_stream_yields_item_records():
+    records = list(stream_landscape_data(str(EXCLUDED_DATA)))
+
+    assert [(r.category, r.subcategory, r.item['name']) for r in records] == [
+        ('Category 1', 'Subcategory 1', 'Item 1'),
+        ('Category 1', 'Subcategory 1', 'Item 2 (no repo)'),
+        ('Category 1', 'Subcategory 1', 'Another Item'),
+        ('Category 1', 'Subcategory 1', 'An item starting with A'),
+        ('Category 2', 'Subcategory 2', 'Item 3'),
+        ('Category 2', 'Subcategory 2', 'Item 4 (no repo)'),
+    ]
+    assert records[2].item == {'name': 'Another Item', 'repo_url': 'https://github.com/another/item', 'project': 'graduated'}
+
+
+def test_stream_keeps_empty_categories():
+    source = tempfile.NamedTemporaryFile('w', suffix='.yml', delete=False)
+    with source:
+        source.write(
+            "other: [1, 2]\n"
+            "landscape:\n"
+            "  - subcategories:\n"
+            "      - items: null\n"
+            "        name: Empty\n"
+            "    name: Late Name\n"
+            "  - name: No Subcategories\n"
+            "    subcategories: []\n"
+        )
+    try:
+        records = list(stream_landscape_data(source.name))
+        assert [tuple(r) for r in records] == [('Late Name', 'Empty', None), ('No Subcategories', None, None)]
+        assert get_stats_per_category(records) == get_stats_per_category(get_landscape_data(source.name))
+    finally:
+        os.unlink(source.name)
+
+
+def test_transforms_consume_stream():
+    landscape = get_landscape_data(str(EXCLUDED_DATA))
+
+    assert get_all_categories(stream_landscape_data(str(EXCLUDED_DATA))) == get_all_categories(landscape)
+    assert get_landscape_by_letter(stream_landscape_data(str(EXCLUDED_DATA))) == get_landscape_by_letter(landscape)
+    by_letter = get_landscape_by_letter(landscape)
+    assert get_landscape_by_letter(landscape, letters=['I', 'A']) == {'A': by_letter['A'], 'I': by_letter['I']}
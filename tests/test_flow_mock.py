@@ -58,6 +58,7 @@ async def test_research_item_mock():
         
         # Mock tracker
         mock_tracker = MagicMock()
+        mock_tracker.__enter__.return_value = mock_tracker
         mock_get_tracker.return_value = mock_tracker
         
         expected_output = ResearchOutput(
@@ -82,6 +83,7 @@ async def test_research_item_mock():
         assert result == expected_output
         # Verify tracker was called
         mock_tracker.update_task.assert_called()
+        mock_tracker.__exit__.assert_called()
 
 @pytest.mark.asyncio
 async def test_write_weekly_post_mock():
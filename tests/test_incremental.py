@@ -0,0 +1,70 @@
+import tempfile
+import shutil
+import os
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import clear_config_cache
+from src.pipeline.extract import get_landscape_data
+from src.pipeline.incremental import EtlState, diff_states
+from src.pipeline.index import LandscapeIndex
+from src.pipeline.instrumentation import REPORT_FILE
+from src.pipeline.runner import run_etl
+
+TEST_DATA = Path(__file__).parent / 'test_data' / 'landscape_with_excluded.yml'
+
+
+def _outputs(output_dir: Path) -> dict:
+    return {
+        path.relative_to(output_dir): path.read_bytes()
+        for path in output_dir.rglob('*')
+        if path.is_file() and '.cache' not in path.parts and path.name not in ('tracker.yaml', REPORT_FILE)
+    }
+
+
+def test_diff_states():
+    old = EtlState.from_index(LandscapeIndex.build(get_landscape_data(str(TEST_DATA))), 6)
+    landscape = get_landscape_data(str(TEST_DATA))
+    items = landscape[0]['subcategories'][0]['items']
+    items[0]['project'] = 'sandbox'
+    del items[2]
+    items.append({'name': 'Zed', 'repo_url': 'https://github.com/zed/zed'})
+    new = EtlState.from_index(LandscapeIndex.build(landscape), 6)
+
+    diff = diff_states(old, new)
+    assert diff.added == {'category_1_subcategory_1/Zed'}
+    assert diff.removed == {'category_1_subcategory_1/Another Item'}
+    assert diff.modified == {'category_1_subcategory_1/Item 1'}
+    assert not diff.structure_changed
+    assert diff.letters == {'A', 'I', 'Z'}
+    assert {letter for letter in new.letters if new.letters[letter] != old.letters[letter]} == {'A', 'I', 'Z'}
+    assert not diff_states(new, new)
+
+
+def test_incremental_run_matches_full_run():
+    clear_config_cache()
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        os.environ['TEST_DATA_DIR'] = str(test_dir)
+        changed = test_dir / 'landscape.yml'
+        changed.write_text(TEST_DATA.read_text().replace('Item 3', 'Zed'))
+
+        with patch('src.pipeline.runner.generate_letter_pages') as letter_pages:
+            run_etl(input_path=str(TEST_DATA), output_dir=str(test_dir / 'incremental'), incremental=True)
+            letter_pages.reset_mock()
+            stats = run_etl(input_path=str(changed), output_dir=str(test_dir / 'incremental'), incremental=True)
+            assert set().union(*(call.kwargs['letters'] for call in letter_pages.call_args_list)) == {'I', 'Z'}
+            unchanged = run_etl(input_path=str(changed), output_dir=str(test_dir / 'incremental'), incremental=True)
+            # Full runs never delete stale files either, so start from the same tree
+            run_etl(input_path=str(TEST_DATA), output_dir=str(test_dir / 'full'))
+            run_etl(input_path=str(changed), output_dir=str(test_dir / 'full'))
+
+        assert stats.written > 0
+        assert (unchanged.written, unchanged.skipped) == (0, 0)
+        assert _outputs(test_dir / 'incremental') == _outputs(test_dir / 'full')
+    finally:
+        shutil.rmtree(test_dir)
@@ -0,0 +1,89 @@
+"""Unit tests for ETL run instrumentation."""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import clear_config_cache
+from src.pipeline.instrumentation import REPORT_FILE, RunReport, peak_rss_kb
+from src.pipeline.runner import run_etl
+from src.pipeline.writer import WriteStats, write_if_changed
+
+
+def test_stages_accumulate_and_count_files():
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        write_stats = WriteStats()
+        report = RunReport(write_stats, workers=1)
+        for letter in "AB":
+            with report.stage("save", items=2) as stage:
+                write_if_changed(test_dir / f"{letter}.txt", letter, stage.files)
+        with report.stage("save") as stage:
+            write_if_changed(test_dir / "A.txt", "A", stage.files)
+        write_if_changed(test_dir / "C.txt", "C", report.files("pool"))
+
+        result = report.finish()
+        save = result["stages"][0]
+        assert (save["name"], save["calls"], save["items"]) == ("save", 3, 4)
+        assert (save["files_written"], save["files_skipped"]) == (2, 1)
+        assert save["wall_ms"] >= 0 and save["peak_rss_kb"] > 0
+        # Stages that were never timed are listed last
+        assert result["stages"][1]["name"] == "pool"
+        assert (result["files_written"], result["files_skipped"]) == (3, 1) == (write_stats.written, write_stats.skipped)
+        assert result["options"] == {"workers": 1}
+    finally:
+        shutil.rmtree(test_dir)
+
+
+
+def test_peak_rss_without_proc_or_resource():
+    with patch('src.pipeline.instrumentation._proc_status_kb', return_value=None):
+        assert peak_rss_kb() > 0
+        # Windows has neither /proc nor the resource module
+        with patch('src.pipeline.instrumentation.resource', None):
+            assert peak_rss_kb() == 0
+
+def test_stages_are_sent_to_logfire_when_configured():
+    observability = MagicMock()
+    observability.logfire_enabled.return_value = True
+    with patch.dict(sys.modules, {"src.agentic.observability": observability}):
+        report = RunReport()
+        with report.stage("extract", items=3, source="test"):
+            pass
+        report.finish()
+
+    observability.logfire.span.assert_called_once_with("etl.extract", source="test")
+    span = observability.logfire.span.return_value.__enter__.return_value
+    assert span.set_attributes.call_args.args[0]["items"] == 3
+    observability.logfire.info.assert_called_once()
+
+
+def test_etl_writes_run_report():
+    clear_config_cache()
+    test_dir = tempfile.mkdtemp()
+    try:
+        os.environ['TEST_DATA_DIR'] = test_dir
+        test_data_path = Path(__file__).parent / 'test_data' / 'landscape_with_excluded.yml'
+
+        with patch('src.pipeline.runner.generate_letter_pages'):
+            stats = run_etl(input_path=str(test_data_path), output_dir=test_dir, trace_memory=True)
+
+        with open(Path(test_dir) / 'extras' / REPORT_FILE) as f:
+            report = json.load(f)
+        stages = {stage['name']: stage for stage in report['stages']}
+        assert list(stages)[:2] == ['extract', 'plan']
+        assert {'partition', 'tasks', 'tracker_sync', 'categories', 'stats', 'summary', 'save_state'} <= set(stages)
+        assert stages['tasks']['calls'] == 26
+        assert stages['stats']['files_written'] == 3
+        assert sum(stage['files_written'] for stage in report['stages']) == report['files_written'] == stats.written
+        assert stages['extract']['peak_traced_kb'] > 0
+        assert report['options']['workers'] == 4
+    finally:
+        shutil.rmtree(test_dir)
@@ -0,0 +1,152 @@
+"""Unit tests for the journaled tracker backend."""
+
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tracker import get_tracker
+from src.tracker.cache import LiveTrackerCache, TrackerCache, file_signature
+from src.tracker.exceptions import DependencyNotMetError
+from src.tracker.journal_backend import JournaledTrackerBackend
+from src.tracker.models import TaskStatus
+from src.tracker.yaml_backend import YAMLTrackerBackend
+
+
+@pytest.fixture
+def test_config():
+    test_dir = Path(tempfile.mkdtemp())
+    cfg = MagicMock()
+    cfg.data_dir = test_dir
+    cfg.weeks_dir = test_dir / "weeks"
+    cfg.cache_dir = test_dir / ".cache"
+    yield cfg
+    shutil.rmtree(test_dir)
+
+
+def _exercise(backend):
+    backend.sync_with_etl("A", ["Alpha", "Argo"])
+    backend.update_task("A", "Alpha", "research", TaskStatus.IN_PROGRESS)
+    backend.update_task("A", "Alpha", "research", TaskStatus.COMPLETED, output_file="research/alpha.yaml")
+    with backend.batch("A") as batch:
+        batch.update_task("Alpha", "content", TaskStatus.IN_PROGRESS)
+        batch.update_task("Argo", "research", TaskStatus.FAILED, error_message="boom", retry_count=1)
+    with pytest.raises(DependencyNotMetError):
+        backend.update_task("A", "Argo", "content", TaskStatus.IN_PROGRESS)
+    return backend.load_tracker("A")
+
+
+def _state(tracker):
+    """Task fields that do not depend on when the operations ran."""
+    return {
+        name: {
+            task_type: (record.status, record.output_file, record.error_message, record.retry_count)
+            for task_type, record in item.tasks.items()
+        }
+        for name, item in tracker.items.items()
+    }
+
+
+def test_journal_appends_instead_of_rewriting(test_config):
+    backend = JournaledTrackerBackend(test_config, cache=TrackerCache())
+    backend.sync_with_etl("A", ["Alpha", "Argo"])
+    snapshot = backend._get_tracker_path("A")
+    signature = file_signature(snapshot)
+
+    tracker = _exercise(backend)
+
+    assert file_signature(snapshot) == signature
+    assert len(backend._get_log_path("A").read_text().splitlines()) == 4
+    # Same state as the rewriting backend, with and without the cache
+    yaml_config = MagicMock()
+    yaml_config.weeks_dir = test_config.data_dir / "yaml"
+    yaml_config.cache_dir = test_config.data_dir / "yaml" / ".cache"
+    assert _state(tracker) == _state(_exercise(YAMLTrackerBackend(yaml_config, cache=TrackerCache())))
+    assert JournaledTrackerBackend(test_config, cache=TrackerCache(), live_cache=LiveTrackerCache()).load_tracker("A") == tracker
+
+    assert backend.get_all_progress() == {"A": backend.get_progress("A")}
+    assert backend.get_progress("A", "research").failed == 1
+
+    history = backend.get_history("A", item="Alpha", task_type="research")
+    assert [event.record.status for event in history] == [TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED]
+
+
+def test_journal_compaction(test_config):
+    backend = get_tracker("journal", config=test_config)
+    assert isinstance(backend, JournaledTrackerBackend)
+    tracker = _exercise(backend)
+
+    backend.compact("A")
+    assert not backend._get_log_path("A").exists()
+    compacted = YAMLTrackerBackend(test_config, cache=TrackerCache()).load_tracker("A")
+    assert compacted.metadata.pop("version") == tracker.metadata.pop("version") + 1
+    assert compacted == tracker
+    assert len(backend.get_history("A")) == 4
+
+    # Size threshold: every write compacts
+    backend.compact_bytes = 1
+    backend.update_task("A", "Alpha", "content", TaskStatus.COMPLETED)
+    assert not backend._get_log_path("A").exists()
+    assert backend.load_tracker("A").items["Alpha"]["content"].status == TaskStatus.COMPLETED
+
+    # Age threshold
+    backend.compact_bytes, backend.compact_age = 1 << 20, 0
+    backend.update_task("A", "Argo", "research", TaskStatus.COMPLETED)
+    assert not backend._get_log_path("A").exists()
+    assert len(backend.get_history("A")) == 6
+
+
+def test_journal_skips_torn_line(test_config):
+    backend = JournaledTrackerBackend(test_config, cache=TrackerCache())
+    backend.sync_with_etl("A", ["Alpha"])
+    backend.update_task("A", "Alpha", "research", TaskStatus.COMPLETED)
+    with open(backend._get_log_path("A"), "a") as f:
+        f.write('{"ts": "2024-01-01T00:00:00", "item": "Alp')
+
+    tracker = JournaledTrackerBackend(test_config, cache=TrackerCache(), live_cache=LiveTrackerCache()).load_tracker("A")
+    assert tracker.items["Alpha"]["research"].status == TaskStatus.COMPLETED
+
+
+def test_journal_appends_without_rebuilding_the_week(test_config, monkeypatch):
+    backend = JournaledTrackerBackend(test_config, cache=TrackerCache(), live_cache=LiveTrackerCache())
+    names = [f"Item{n}" for n in range(500)]
+    backend.sync_with_etl("A", names)
+    backend.update_task("A", names[0], "research", TaskStatus.COMPLETED)
+    backend.get_ready_tasks()
+
+    # Once the week is folded, appends advance it in place: no load, dump or rebuild
+    def rebuild(*args, **kwargs):
+        raise AssertionError("week rebuilt")
+    monkeypatch.setattr(backend, "load_tracker", rebuild)
+    monkeypatch.setattr("src.tracker.cache.dump_tracker", rebuild)
+    monkeypatch.setattr("src.tracker.cache.restore_tracker", rebuild)
+    for name in names[1:50]:
+        backend.update_task("A", name, "research", TaskStatus.COMPLETED)
+    with backend.batch("A") as batch:
+        batch.update_task(names[0], "content", TaskStatus.COMPLETED)
+    claimed = backend.claim_ready_tasks(n=2)
+    # A failing batch leaves nothing behind
+    with pytest.raises(DependencyNotMetError):
+        with backend.batch("A") as batch:
+            batch.update_task(names[1], "content", TaskStatus.IN_PROGRESS)
+            batch.update_task(names[99], "content", TaskStatus.IN_PROGRESS)
+    monkeypatch.undo()
+
+    # Appends by another writer are replayed from the log
+    other = JournaledTrackerBackend(test_config, cache=TrackerCache(), live_cache=LiveTrackerCache())
+    other.update_task("A", names[60], "research", TaskStatus.FAILED)
+    backend.update_task("A", names[61], "research", TaskStatus.SKIPPED)
+
+    tracker = backend.load_tracker("A")
+    assert tracker == other.load_tracker("A")
+    assert all(tracker.items[name]["research"].status == TaskStatus.COMPLETED for name in names[:50])
+    assert tracker.items[names[1]]["content"].status == TaskStatus.PENDING
+    assert [tracker.items[task.item_name][task.task_type].status for task in claimed] == [TaskStatus.IN_PROGRESS] * 2
+    assert (tracker.items[names[60]]["research"].status, tracker.items[names[61]]["research"].status) == (
+        TaskStatus.FAILED, TaskStatus.SKIPPED
+    )
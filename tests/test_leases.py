@@ -0,0 +1,127 @@
+"""Unit tests for claiming ready tasks with leases."""
+
+import pytest
+import tempfile
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tracker.cache import TrackerCache
+from src.tracker.journal_backend import JournaledTrackerBackend
+from src.tracker.models import TaskStatus
+from src.tracker.sqlite_backend import SQLiteTrackerBackend
+from src.tracker.yaml_backend import YAMLTrackerBackend
+
+ITEMS = ["Alpha", "Argo", "Atlantis"]
+
+
+@pytest.fixture(params=["yaml", "journal", "sqlite"])
+def backend(request):
+    test_dir = Path(tempfile.mkdtemp())
+    cfg = MagicMock()
+    cfg.data_dir = test_dir
+    cfg.weeks_dir = test_dir / "weeks"
+    cfg.cache_dir = test_dir / ".cache"
+    if request.param == "sqlite":
+        backend = SQLiteTrackerBackend(cfg)
+    elif request.param == "journal":
+        backend = JournaledTrackerBackend(cfg, cache=TrackerCache())
+    else:
+        backend = YAMLTrackerBackend(cfg, cache=TrackerCache())
+    backend.sync_with_etl("A", ITEMS)
+    yield backend
+    backend.close()
+    shutil.rmtree(test_dir)
+
+
+def _names(tasks):
+    return [task.item_name for task in tasks]
+
+
+def _keys(tasks):
+    return [(task.week_letter, task.item_name, task.task_type) for task in tasks]
+
+
+def test_claims_are_exclusive(backend):
+    first = backend.claim_ready_tasks("researcher", 2, worker_id="w1")
+    second = backend.claim_ready_tasks("researcher", 2, worker_id="w2")
+
+    assert _names(first) == ["Alpha", "Argo"]
+    assert _names(second) == ["Atlantis"]
+    assert {task.lease_owner for task in first} == {"w1"}
+    assert backend.claim_ready_tasks("researcher", 2, worker_id="w3") == []
+    assert backend.get_ready_tasks() == []
+    # Writers have nothing until content is done
+    assert backend.claim_ready_tasks("writer", 5, worker_id="w3") == []
+
+    record = backend.load_tracker("A").items["Alpha"]["research"]
+    assert (record.status, record.lease_owner) == (TaskStatus.IN_PROGRESS, "w1")
+
+
+def test_expired_lease_is_reclaimed(backend):
+    backend.claim_ready_tasks("researcher", 1, lease_seconds=0, worker_id="crashed")
+    time.sleep(0.01)
+
+    reclaimed = backend.claim_ready_tasks("researcher", 1, worker_id="w2")
+    assert _names(reclaimed) == ["Alpha"]
+    record = backend.load_tracker("A").items["Alpha"]["research"]
+    assert (record.lease_owner, record.retry_count) == ("w2", 1)
+    assert not backend.renew_lease("A", "Alpha", "research", worker_id="crashed")
+
+
+def test_renew_and_release(backend):
+    backend.claim_ready_tasks("researcher", 1, lease_seconds=0, worker_id="w1")
+    assert backend.renew_lease("A", "Alpha", "research", lease_seconds=60, worker_id="w1")
+    time.sleep(0.01)
+    assert _names(backend.claim_ready_tasks("researcher", 1, worker_id="w2")) == ["Argo"]
+
+    backend.update_task("A", "Alpha", "research", TaskStatus.COMPLETED)
+    record = backend.load_tracker("A").items["Alpha"]["research"]
+    assert (record.lease_owner, record.lease_expires_at) == (None, None)
+    assert not backend.renew_lease("A", "Alpha", "research", worker_id="w1")
+
+
+def test_claims_follow_ready_order(backend):
+    backend.sync_with_etl("A", ITEMS + ["Borealis"])
+    backend.sync_with_etl("B", ["Beta"])
+    backend.update_task("A", "Alpha", "research", TaskStatus.COMPLETED)
+    backend.update_task("A", "Borealis", "research", TaskStatus.COMPLETED)
+    ready = backend.get_ready_tasks()
+
+    claimed = backend.claim_ready_tasks(n=len(ready), worker_id="w1")
+    assert _keys(claimed) == _keys(ready) == [
+        ("A", "Argo", "research"), ("A", "Atlantis", "research"),
+        ("A", "Alpha", "content"), ("A", "Borealis", "content"),
+        ("B", "Beta", "research"),
+    ]
+
+
+def test_concurrent_claims_do_not_overlap(backend):
+    backend.sync_with_etl("A", [f"Item {i}" for i in range(24)])
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda i: backend.claim_ready_tasks("researcher", 4, worker_id=f"w{i}"), range(4)))
+
+    claimed = [name for tasks in results for name in _names(tasks)]
+    assert len(claimed) == len(set(claimed)) == 16
+
+
+def test_unset_leases_are_not_saved(backend):
+    if type(backend) is not YAMLTrackerBackend:
+        pytest.skip("claims rewrite tracker.yaml only in the YAML backend")
+    path = backend._get_tracker_path("A")
+    assert "lease_" not in path.read_text()
+
+    [task] = backend.claim_ready_tasks("researcher", worker_id="w1")
+    assert "lease_owner: w1" in path.read_text()
+    record = backend.load_tracker("A").items[task.item_name]["research"]
+    assert (record.lease_owner, record.lease_expires_at) == ("w1", task.lease_expires_at)
+
+    backend.update_task("A", task.item_name, "research", TaskStatus.COMPLETED)
+    assert "lease_" not in path.read_text()
@@ -0,0 +1,115 @@
+"""Unit tests for the incremental ready-task index."""
+
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tracker.cache import TrackerCache
+from src.tracker.config import get_task_config
+from src.tracker.journal_backend import JournaledTrackerBackend
+from src.tracker.leases import ready_order
+from src.tracker.models import ReadyTask, TaskStatus
+from src.tracker.ready_index import ReadyIndex, ready_index_cache
+from src.tracker.yaml_backend import YAMLTrackerBackend
+
+
+@pytest.fixture(params=["yaml", "journal"])
+def backend(request):
+    test_dir = Path(tempfile.mkdtemp())
+    cfg = MagicMock()
+    cfg.data_dir = test_dir
+    cfg.weeks_dir = test_dir / "weeks"
+    cfg.cache_dir = test_dir / ".cache"
+    if request.param == "journal":
+        backend = JournaledTrackerBackend(cfg, cache=TrackerCache())
+    else:
+        backend = YAMLTrackerBackend(cfg, cache=TrackerCache())
+    yield backend
+    shutil.rmtree(test_dir)
+
+
+def _keys(tasks):
+    return [(task.week_letter, task.item_name, task.task_type) for task in tasks]
+
+
+def _scan(backend, letter="A"):
+    """Ready tasks from a full pass over the tracker."""
+    tracker = backend.load_tracker(letter)
+    tasks = [(name, item_tasks.tasks) for name, item_tasks in tracker.items.items() if not item_tasks.removed]
+    tasks.append((None, tracker.week_tasks.tasks))
+    ready = [
+        ReadyTask(week_letter=letter, item_name=name, task_type=task_type, agent=get_task_config(task_type).agent)
+        for name, records in tasks
+        for task_type, record in records.items()
+        if record.status == TaskStatus.PENDING and backend.can_start_task(letter, name, task_type, tracker=tracker)
+    ]
+    return _keys(sorted(ready, key=ready_order))
+
+
+def _in_progress(backend, letter="A"):
+    """In-progress tasks held by the index, and from a full pass over the tracker."""
+    tracker = backend.load_tracker(letter)
+    scanned = [
+        (name, task_type)
+        for name, item_tasks in tracker.items.items() if not item_tasks.removed
+        for task_type, record in item_tasks.tasks.items() if record.status == TaskStatus.IN_PROGRESS
+    ]
+    scanned += [
+        (None, task_type)
+        for task_type, record in tracker.week_tasks.tasks.items() if record.status == TaskStatus.IN_PROGRESS
+    ]
+    indexed = ready_index_cache.read(
+        backend._get_tracker_path(letter), backend._state_signature(letter), lambda index: index.in_progress_tasks()
+    )
+    return sorted(indexed, key=str), sorted(scanned, key=str)
+
+
+def test_index_matches_scan(backend):
+    steps = [
+        lambda: backend.sync_with_etl("A", ["Alpha", "Argo", "Atlantis"]),
+        lambda: backend.update_task("A", "Alpha", "research", TaskStatus.COMPLETED),
+        lambda: backend.update_task("A", "Argo", "research", TaskStatus.IN_PROGRESS),
+        lambda: backend.update_task("A", "Atlantis", "research", TaskStatus.IN_PROGRESS),
+        lambda: backend.update_task("A", "Alpha", "content", TaskStatus.COMPLETED),
+        lambda: backend.update_tasks("A", []),
+        lambda: backend.sync_with_etl("A", ["Alpha", "Argo"]),
+        lambda: backend.update_task("A", "Argo", "research", TaskStatus.COMPLETED),
+        lambda: backend.update_task("A", "Argo", "content", TaskStatus.COMPLETED),
+        lambda: backend.update_task("A", None, "blog_post", TaskStatus.IN_PROGRESS),
+        lambda: backend.update_task("A", None, "blog_post", TaskStatus.FAILED),
+        lambda: backend.update_task("A", None, "blog_post", TaskStatus.PENDING),
+        lambda: backend.sync_with_etl("A", ["Alpha", "Argo", "Atlantis", "Avalon"]),
+        lambda: backend.update_task("A", "Alpha", "content", TaskStatus.FAILED),
+    ]
+    for step in steps:
+        step()
+        assert _keys(backend.get_ready_tasks()) == _scan(backend)
+        indexed, scanned = _in_progress(backend)
+        assert indexed == scanned
+
+    # Stop once enough tasks are found, keeping the order of the full list
+    assert _keys(backend.get_ready_tasks(limit=2)) == _scan(backend)[:2]
+
+
+def test_index_advances_without_rebuild(backend, monkeypatch):
+    backend.sync_with_etl("A", ["Alpha", "Argo"])
+    backend.get_ready_tasks()
+
+    builds = []
+    original = ReadyIndex.build.__func__
+    monkeypatch.setattr(ReadyIndex, "build", classmethod(lambda cls, *args: builds.append(args) or original(cls, *args)))
+
+    with backend.batch("A") as batch:
+        batch.update_task("Alpha", "research", TaskStatus.COMPLETED)
+        batch.update_task("Argo", "research", TaskStatus.COMPLETED)
+    backend.update_task("A", "Alpha", "content", TaskStatus.COMPLETED)
+    backend.sync_with_etl("A", ["Alpha"])
+
+    assert _keys(backend.get_ready_tasks()) == [("A", None, "blog_post")]
+    assert builds == []
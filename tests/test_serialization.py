@@ -0,0 +1,35 @@
+import yaml
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.serialization import dump_yaml, load_yaml
+
+SAMPLE = [
+    {
+        'name': 'Gonzo',
+        'description': 'Gonzo is a powerful, real-time log analysis terminal UI inspired by k9s. '
+                       'Analyze log streams with beautiful charts and advanced filtering – all from your terminal.',
+        'featured': True,
+        'project': None,
+    },
+    {
+        'name': "O'Reilly: a 'quoted' name",
+        'description': 'A plain ASCII description that is long enough to be folded by the emitter at eighty columns.',
+        'tags': ['a', 'b'],
+    },
+]
+
+
+def test_dump_yaml_matches_pyyaml_output():
+    assert dump_yaml(SAMPLE) == yaml.dump(SAMPLE)
+    assert dump_yaml(SAMPLE[1:]) == yaml.dump(SAMPLE[1:])
+    kwargs = dict(default_flow_style=False, allow_unicode=True, sort_keys=False)
+    assert dump_yaml(SAMPLE, **kwargs) == yaml.dump(SAMPLE, **kwargs)
+
+
+def test_load_yaml_round_trip():
+    assert load_yaml(dump_yaml(SAMPLE)) == SAMPLE
+    assert load_yaml(dump_yaml(SAMPLE).encode('utf-8')) == SAMPLE
@@ -0,0 +1,158 @@
+"""Unit tests for the SQLite tracker backend."""
+
+import pytest
+import sqlite3
+import tempfile
+import shutil
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tracker import get_tracker
+from src.tracker.models import TaskStatus, TaskUpdate
+from src.tracker.exceptions import (
+    DependencyNotMetError,
+    InvalidTaskTypeError,
+    ItemNotFoundError,
+    WeekNotFoundError,
+)
+from src.tracker.sqlite_backend import SQLiteTrackerBackend
+from src.tracker.yaml_backend import YAMLTrackerBackend
+
+
+@pytest.fixture
+def test_config():
+    test_dir = Path(tempfile.mkdtemp())
+    cfg = MagicMock()
+    cfg.data_dir = test_dir
+    cfg.weeks_dir = test_dir / "weeks"
+    cfg.cache_dir = test_dir / ".cache"
+    yield cfg
+    shutil.rmtree(test_dir)
+
+
+def _exercise(backend):
+    """Run the same sequence of operations and collect every observable result."""
+    backend.sync_with_etl("A", ["Alpha", "Argo", "Atlantis"])
+    backend.sync_with_etl("B", ["Beta"])
+    backend.update_task("A", "Alpha", "research", TaskStatus.IN_PROGRESS)
+    backend.update_task("A", "Alpha", "research", TaskStatus.COMPLETED, output_file="research/alpha.yaml")
+    backend.update_task("A", "Argo", "research", TaskStatus.FAILED, error_message="boom", retry_count=1)
+    backend.sync_with_etl("A", ["Alpha", "Argo", "Apex"])
+    with backend.batch("B") as batch:
+        batch.update_task("Beta", "research", TaskStatus.COMPLETED, output_file="research/beta.yaml")
+        batch.update_task("Beta", "content", TaskStatus.IN_PROGRESS)
+    with pytest.raises(ItemNotFoundError):
+        backend.update_tasks("B", [
+            TaskUpdate(item="Beta", task_type="content", status=TaskStatus.COMPLETED),
+            TaskUpdate(item=None, task_type="blog_post", status=TaskStatus.COMPLETED),
+            TaskUpdate(item="Missing", task_type="research", status=TaskStatus.IN_PROGRESS),
+        ])
+
+    results = {
+        "pending_research": backend.get_pending_items("A", "research"),
+        "pending_content": backend.get_pending_items("A", "content"),
+        "can_start_content": [backend.can_start_task("A", name, "content") for name in ("Alpha", "Argo", "Nope")],
+        "can_start_blog": backend.can_start_task("A", None, "blog_post"),
+        "progress": backend.get_progress("A").model_dump(),
+        "progress_research": backend.get_progress("A", "research").model_dump(),
+        "progress_blog": backend.get_progress("A", "blog_post").model_dump(),
+        "all_progress": {letter: p.model_dump() for letter, p in backend.get_all_progress().items()},
+        "ready": [task.model_dump() for task in backend.get_ready_tasks()],
+        "ready_limited": [task.model_dump() for task in backend.get_ready_tasks(limit=2)],
+    }
+    tracker = backend.load_tracker("A")
+    results["items"] = {
+        name: (item.removed, {task_type: record.status for task_type, record in item.tasks.items()})
+        for name, item in tracker.items.items()
+    }
+    alpha = tracker.items["Alpha"]["research"]
+    results["alpha_research"] = (alpha.output_file, alpha.started_at is not None, alpha.completed_at is not None)
+    argo = tracker.items["Argo"]["research"]
+    results["argo_research"] = (argo.error_message, argo.retry_count)
+    # The YAML backend's write counter has no SQLite counterpart
+    results["metadata"] = sorted(set(tracker.metadata) - {"version"})
+    beta = backend.load_tracker("B").items["Beta"]
+    results["beta"] = {task_type: (record.status, record.output_file) for task_type, record in beta.tasks.items()}
+    return results
+
+
+def test_sqlite_matches_yaml_backend(test_config):
+    yaml_results = _exercise(YAMLTrackerBackend(test_config))
+    sqlite_results = _exercise(SQLiteTrackerBackend(test_config))
+
+    assert sqlite_results == yaml_results
+    assert sqlite_results["items"]["Atlantis"][0] is True
+    assert sqlite_results["pending_content"] == ["Alpha"]
+
+
+def test_sqlite_errors(test_config):
+    backend = get_tracker("sqlite", config=test_config)
+    assert isinstance(backend, SQLiteTrackerBackend)
+    backend.sync_with_etl("A", ["Alpha"])
+
+    with pytest.raises(WeekNotFoundError):
+        backend.load_tracker("Q")
+    with pytest.raises(InvalidTaskTypeError):
+        backend.update_task("A", "Alpha", "invalid", TaskStatus.COMPLETED)
+    with pytest.raises(ItemNotFoundError):
+        backend.update_task("A", "Missing", "research", TaskStatus.COMPLETED)
+    with pytest.raises(DependencyNotMetError):
+        backend.update_task("A", "Alpha", "content", TaskStatus.IN_PROGRESS)
+    # The failed update must not have left a half-written row behind
+    assert backend.load_tracker("A").items["Alpha"]["content"].status == TaskStatus.PENDING
+
+
+def test_sqlite_initializes_from_tasks_yaml(test_config):
+    week_dir = test_config.weeks_dir / "00-A"
+    week_dir.mkdir(parents=True)
+    (week_dir / "tasks.yaml").write_text("- Alpha\n- Argo\n")
+
+    backend = SQLiteTrackerBackend(test_config)
+    assert backend.get_pending_items("A", "research") == ["Alpha", "Argo"]
+    assert backend.tracker_exists("A")
+
+
+def test_sqlite_yaml_import_export(test_config):
+    yaml_backend = YAMLTrackerBackend(test_config)
+    yaml_backend.sync_with_etl("A", ["Alpha", "Argo"])
+    yaml_backend.update_task("A", "Alpha", "research", TaskStatus.COMPLETED, output_file="research/alpha.yaml")
+    original = yaml_backend.load_tracker("A")
+
+    backend = SQLiteTrackerBackend(test_config, db_path=test_config.data_dir / "import.db")
+    assert backend.import_from_yaml() == ["A"]
+    assert backend.load_tracker("A") == original
+
+    backend.update_task("A", "Argo", "research", TaskStatus.SKIPPED)
+    assert backend.export_to_yaml() == ["A"]
+    exported, stored = yaml_backend.load_tracker("A"), backend.load_tracker("A")
+    # Saving through the YAML backend bumps its write counter
+    assert exported.metadata.pop("version") == stored.metadata.pop("version") + 1
+    assert exported == stored
+
+
+def test_sqlite_closes_as_context_manager(test_config):
+    with get_tracker("sqlite", config=test_config) as backend:
+        backend.sync_with_etl("A", ["Alpha"])
+    with pytest.raises(sqlite3.ProgrammingError):
+        backend.tracker_exists("A")
+
+
+def test_sqlite_lease_expiry_ignores_timestamp_format(test_config):
+    with SQLiteTrackerBackend(test_config) as backend:
+        backend.sync_with_etl("A", ["Alpha"])
+        [task] = backend.claim_ready_tasks("researcher", worker_id="w1")
+        # Lapsed a minute ago, written with a +14:00 offset: as text it sorts after "now"
+        lapsed = (datetime.now(timezone.utc) - timedelta(minutes=1)).astimezone(timezone(timedelta(hours=14)))
+        backend.update_task("A", "Alpha", "research", TaskStatus.IN_PROGRESS, lease_expires_at=lapsed)
+        assert backend.load_tracker("A").items["Alpha"]["research"].lease_expires_at == lapsed
+        # Databases from before the epoch column get it filled in when opened
+        backend._conn.execute("ALTER TABLE tasks DROP COLUMN lease_expires_ts")
+
+    with SQLiteTrackerBackend(test_config) as backend:
+        [reclaimed] = backend.claim_ready_tasks("researcher", worker_id="w2")
+        assert (reclaimed.item_name, reclaimed.lease_owner) == ("Alpha", "w2")
@@ -0,0 +1,167 @@
+"""Unit tests for the ETL stage graph and its scheduler."""
+
+import os
+import shutil
+import tempfile
+import threading
+import tracemalloc
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import clear_config_cache
+from src.pipeline.runner import run_etl
+from src.pipeline.stages import Artifact, Stage, StageGraph, load_run, save_run
+
+TEST_DATA = Path(__file__).parent / 'test_data' / 'landscape_with_excluded.yml'
+
+
+def _graph(calls):
+    def stage(name, inputs=(), outputs=(), **kwargs):
+        def run(*args):
+            calls.append(name)
+            return {output: f"{name}({','.join(map(str, args))})" for output in outputs}
+        return Stage(name, run, inputs=inputs, outputs=outputs, **kwargs)
+
+    return StageGraph([
+        stage("split", inputs=("source",), outputs=("left", "right")),
+        stage("left", inputs=("left",), outputs=("left_done",)),
+        stage("right", inputs=("right",)),
+        stage("join", inputs=("left_done",), after=("right",)),
+    ], sources=["source"])
+
+
+def test_graph_rejects_invalid_stages():
+    run = lambda *args: None
+    with pytest.raises(ValueError, match="Duplicate"):
+        StageGraph([Stage("a", run), Stage("a", run)])
+    with pytest.raises(ValueError, match="more than once"):
+        StageGraph([Stage("a", run, outputs=("x",)), Stage("b", run, outputs=("x",))])
+    with pytest.raises(ValueError, match="no stage produces"):
+        StageGraph([Stage("a", run, inputs=("x",))])
+    with pytest.raises(ValueError, match="cycle"):
+        StageGraph([Stage("a", run, inputs=("y",), outputs=("x",)), Stage("b", run, inputs=("x",), outputs=("y",))])
+    with pytest.raises(ValueError, match="Unknown stage"):
+        _graph([]).select(["missing"])
+
+
+def test_independent_stages_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    order = []
+
+    def wait(name):
+        def run(value):
+            barrier.wait()
+            order.append(name)
+        return run
+
+    graph = StageGraph([
+        Stage("a", wait("a"), inputs=("source",)),
+        Stage("b", wait("b"), inputs=("source",)),
+        Stage("c", lambda: order.append("c"), after=("a", "b")),
+    ], sources=["source"])
+    result = graph.run({"source": Artifact(1, "1")}, workers=2)
+    # a and b only pass the barrier if they run at the same time
+    assert sorted(order[:2]) == ["a", "b"] and order[2] == "c"
+    assert sorted(result.ran) == ["a", "b", "c"]
+
+
+def test_unchanged_stages_are_skipped():
+    calls = []
+    graph = _graph(calls)
+    first = graph.run({"source": Artifact(1, "v1")}, workers=2)
+    assert first.values["left_done"] == "left(split(1))" and len(calls) == 4
+
+    calls.clear()
+    same = graph.run({"source": Artifact(1, "v1")}, previous=first)
+    assert calls == [] and sorted(same.skipped) == ["join", "left", "right", "split"]
+    assert same.keys == first.keys and same.fingerprints == first.fingerprints
+
+    # A stage missing from the previous run runs, and the skipped stage it reads from too
+    calls.clear()
+    del same.keys["left"]
+    graph.run({"source": Artifact(1, "v1")}, previous=same)
+    assert calls == ["split", "left"]
+
+    calls.clear()
+    graph.run({"source": Artifact(2, "v2")}, previous=first)
+    assert sorted(calls) == ["join", "left", "right", "split"]
+
+
+def test_artifact_fingerprints_stop_reruns():
+    calls = []
+    graph = StageGraph([
+        Stage("names", lambda value: {"names": Artifact(value["names"], ",".join(value["names"]))},
+              inputs=("source",), outputs=("names",)),
+        Stage("sync", lambda names: calls.append(names), inputs=("names",)),
+    ], sources=["source"])
+    first = graph.run({"source": Artifact({"names": ["a"], "text": "x"}, "v1")})
+    second = graph.run({"source": Artifact({"names": ["a"], "text": "y"}, "v2")}, previous=first)
+    assert second.ran == ["names"] and second.skipped == ["sync"] and calls == [["a"]]
+
+
+def test_only_runs_selected_stages_and_their_producers():
+    calls = []
+    graph = _graph(calls)
+    assert graph.select(["join"]) == {"split", "left", "join"}
+    result = graph.run({"source": Artifact(1, "v1")}, only=["join"])
+    assert sorted(calls) == ["join", "left", "split"] and "right" not in result.keys
+
+
+def test_keys_round_trip():
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        assert load_run(test_dir) is None
+        first = _graph([]).run({"source": Artifact(1, "v1")})
+        save_run(test_dir, first)
+        saved = load_run(test_dir)
+        assert (saved.keys, saved.fingerprints) == (first.keys, first.fingerprints)
+    finally:
+        shutil.rmtree(test_dir)
+
+
+def test_etl_only_stats():
+    clear_config_cache()
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        os.environ['TEST_DATA_DIR'] = str(test_dir)
+        output_dir = test_dir / 'data'
+        with patch('src.pipeline.runner.generate_letter_pages') as letter_pages:
+            stats = run_etl(input_path=str(TEST_DATA), output_dir=str(output_dir), only=['stats'])
+            letter_pages.assert_not_called()
+            with pytest.raises(ValueError, match="Unknown stage"):
+                run_etl(input_path=str(TEST_DATA), output_dir=str(output_dir), only=['statz'])
+
+        assert stats.written == 3
+        assert sorted(path.name for path in (output_dir / 'stats').iterdir()) == [
+            'stats_by_status.yaml', 'stats_per_category.yaml', 'stats_per_category_per_week.yaml',
+        ]
+        assert not (output_dir / 'weeks').exists() or not any((output_dir / 'weeks').iterdir())
+    finally:
+        shutil.rmtree(test_dir)
+
+
+def test_failed_etl_closes_tracker_and_stops_tracing():
+    clear_config_cache()
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        os.environ['TEST_DATA_DIR'] = str(test_dir)
+        output_dir = str(test_dir / 'data')
+        with patch('src.pipeline.runner.get_tracker') as get_tracker:
+            tracker = get_tracker.return_value = MagicMock()
+            with pytest.raises(ValueError, match="Unknown stage"):
+                run_etl(input_path=str(TEST_DATA), output_dir=output_dir, only=['nope'])
+            tracker.close.assert_called_once()
+
+            tracker = get_tracker.return_value = MagicMock()
+            with pytest.raises(FileNotFoundError):
+                run_etl(input_path=str(test_dir / 'missing.yml'), output_dir=output_dir, trace_memory=True)
+            tracker.close.assert_called_once()
+            assert not tracemalloc.is_tracing()
+    finally:
+        shutil.rmtree(test_dir)
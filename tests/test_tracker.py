@@ -20,10 +20,14 @@ from src.tracker.models import (
     WeekTasks,
     WeekTracker,
     TaskProgress,
+    TaskUpdate,
 )
 from src.tracker.config import (
     TaskTypeConfig,
     TASK_TYPES,
+    TASK_GRAPH,
+    TaskGraph,
+    get_dependents,
     get_task_config,
     is_valid_task_type,
 )
@@ -33,6 +37,7 @@ from src.tracker.exceptions import (
     InvalidTaskTypeError,
     ItemNotFoundError,
     WeekNotFoundError,
+    DependencyCycleError,
 )
 from src.tracker.yaml_backend import YAMLTrackerBackend
 from src.tracker import get_tracker
@@ -172,6 +177,30 @@ def test_is_valid_task_type():
     assert is_valid_task_type("invalid") == False
 
 
+def test_task_graph():
+    """Test the compiled task dependency graph."""
+    assert TASK_GRAPH.topological_order() == ["research", "content", "blog_post"]
+    assert TASK_GRAPH.dependents["research"] == ("content",)
+    assert get_dependents("content") == ["blog_post"]
+    assert TASK_GRAPH.week_task_types == ("blog_post",)
+    assert TASK_GRAPH.depth["research"] == 2
+    assert sorted(TASK_GRAPH.dependencies, key=TASK_GRAPH.schedule_key) == ["research", "content", "blog_post"]
+    
+    with pytest.raises(TypeError):
+        TASK_GRAPH.dependencies["research"] = ("content",)
+    
+    cyclic = {
+        "a": TaskTypeConfig(name="a", depends_on=["b"]),
+        "b": TaskTypeConfig(name="b", depends_on=["a"]),
+        "c": TaskTypeConfig(name="c"),
+    }
+    with pytest.raises(DependencyCycleError, match="a, b"):
+        TaskGraph.compile(cyclic)
+    
+    with pytest.raises(InvalidTaskTypeError):
+        TaskGraph.compile({"a": TaskTypeConfig(name="a", depends_on=["missing"])})
+
+
 def test_tracker_exists():
     """Test tracker_exists method."""
     import shutil
@@ -179,6 +208,7 @@ def test_tracker_exists():
     # Override config for testing
     backend.cfg = MagicMock()
     backend.cfg.weeks_dir = Path("/tmp/test_weeks")
+    backend.cfg.cache_dir = Path("/tmp/test_weeks/.cache")
 
     # Ensure directory doesn't exist
     week_dir = Path("/tmp/test_weeks") / "00-A"
@@ -205,6 +235,7 @@ def test_load_tracker_nonexistent():
     # Override config for testing
     backend.cfg = MagicMock()
     backend.cfg.weeks_dir = Path("/tmp/test_weeks")
+    backend.cfg.cache_dir = Path("/tmp/test_weeks/.cache")
 
     # Ensure no tracker files exist
     week_dir = Path("/tmp/test_weeks") / "00-A"
@@ -221,6 +252,7 @@ def test_initialize_from_tasks():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -255,6 +287,7 @@ def test_save_and_load_tracker():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -289,6 +322,7 @@ def test_get_pending_items():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -324,6 +358,7 @@ def test_can_start_task_no_dependencies():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -351,6 +386,7 @@ def test_can_start_task_with_dependencies():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -385,6 +421,7 @@ def test_can_start_week_task():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -419,6 +456,7 @@ def test_update_task():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -458,6 +496,7 @@ def test_update_task_dependency_check():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -487,6 +526,7 @@ def test_update_task_invalid_type():
     with patch('src.config.load_config') as mock_load_config:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = Path("/tmp/test_weeks")
+        mock_cfg.cache_dir = Path("/tmp/test_weeks/.cache")
         mock_load_config.return_value = mock_cfg
 
         backend = YAMLTrackerBackend()
@@ -522,6 +562,7 @@ def test_sync_with_etl_idempotency():
     try:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = temp_dir
+        mock_cfg.cache_dir = temp_dir / ".cache"
 
         backend = YAMLTrackerBackend(config=mock_cfg)
         week_letter = 'A'
@@ -563,6 +604,7 @@ def test_sync_with_etl_reappearing_item():
     try:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = temp_dir
+        mock_cfg.cache_dir = temp_dir / ".cache"
 
         backend = YAMLTrackerBackend(config=mock_cfg)
         week_letter = 'A'
@@ -602,6 +644,7 @@ def test_sync_with_etl_missing_metadata():
     try:
         mock_cfg = MagicMock()
         mock_cfg.weeks_dir = temp_dir
+        mock_cfg.cache_dir = temp_dir / ".cache"
 
         backend = YAMLTrackerBackend(config=mock_cfg)
         week_letter = 'A'
@@ -627,3 +670,142 @@ def test_sync_with_etl_missing_metadata():
     finally:
         if temp_dir.exists():
             shutil.rmtree(temp_dir)
+
+def test_tracker_cache_hits_and_invalidation():
+    """Test that parsed trackers are cached and re-read when the file changes."""
+    from src.tracker.cache import TrackerCache
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        mock_cfg = MagicMock()
+        mock_cfg.weeks_dir = temp_dir
+        mock_cfg.cache_dir = temp_dir / ".cache"
+        cache = TrackerCache(maxsize=1)
+        backend = YAMLTrackerBackend(config=mock_cfg, cache=cache)
+
+        # save_tracker writes through, so the first load is already a hit
+        backend.sync_with_etl('A', ['Item1'])
+        tracker = backend.load_tracker('A')
+        assert cache.cache_info().hits == 1
+
+        # Callers get copies
+        tracker.items['Item1']['research'].status = TaskStatus.FAILED
+        assert backend.load_tracker('A').items['Item1']['research'].status == TaskStatus.PENDING
+
+        # An external edit changes the file signature
+        tracker_path = backend._get_tracker_path('A')
+        tracker_path.write_text(tracker_path.read_text().replace('pending', 'skipped', 1))
+        assert backend.load_tracker('A').items['Item1']['research'].status == TaskStatus.SKIPPED
+        assert cache.cache_info().misses == 1
+
+        # LRU bound
+        backend.sync_with_etl('B', ['Item2'])
+        assert cache.cache_info().currsize == 1
+        backend.load_tracker('A')
+        assert cache.cache_info().misses == 2
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_restore_tracker_shares_nothing():
+    """Test that a tracker rebuilt from its dump equals the original and shares no mutable state."""
+    from src.tracker.cache import dump_tracker, restore_tracker
+
+    tracker = WeekTracker(
+        items={'Item1': ItemTasks(tasks={'research': TaskRecord(status=TaskStatus.COMPLETED, completed_at=datetime.now())})},
+        week_tasks=WeekTasks(tasks={'blog_post': TaskRecord()}),
+        metadata={'progress': {'research': {'completed': 1}}, 'tags': ['a']},
+    )
+    data = dump_tracker(tracker)
+    restored = restore_tracker(data)
+    assert restored == tracker
+
+    restored.metadata['progress']['research']['completed'] = 2
+    restored.metadata['tags'].append('b')
+    restored.items['Item1']['research'].status = TaskStatus.FAILED
+    assert tracker.metadata == {'progress': {'research': {'completed': 1}}, 'tags': ['a']}
+    assert tracker.items['Item1']['research'].status == TaskStatus.COMPLETED
+    # The dump can be restored again unchanged
+    assert restore_tracker(data) == tracker
+
+
+def test_progress_counters_and_summary():
+    """Test that status counters follow transitions and the summary answers without loading."""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        mock_cfg = MagicMock()
+        mock_cfg.weeks_dir = temp_dir
+        mock_cfg.cache_dir = temp_dir / ".cache"
+        backend = YAMLTrackerBackend(config=mock_cfg)
+        
+        backend.sync_with_etl('A', ['Item1', 'Item2', 'Item3'])
+        backend.sync_with_etl('B', ['Item4'])
+        backend.update_task('A', 'Item1', 'research', TaskStatus.COMPLETED)
+        backend.update_task('A', 'Item2', 'research', TaskStatus.FAILED)
+        backend.sync_with_etl('A', ['Item1', 'Item2'])
+        backend.update_task('A', None, 'blog_post', TaskStatus.SKIPPED)
+        
+        progress = backend.get_progress('A', 'research')
+        assert (progress.total, progress.completed, progress.failed, progress.pending) == (2, 1, 1, 0)
+        assert backend.get_progress('A', 'blog_post').skipped == 1
+        assert backend.get_progress('A').total == 5
+        
+        # Answered from progress.json alone
+        with patch.object(backend, 'load_tracker', side_effect=AssertionError("tracker loaded")):
+            all_progress = backend.get_all_progress('research')
+        assert list(all_progress) == ['A', 'B']
+        assert all_progress['A'] == progress
+        assert all_progress['B'].pending == 1
+        # Kept out of the committed weeks directory
+        assert (temp_dir / '.cache' / 'progress.json').exists()
+        assert not list(temp_dir.glob('progress.json*'))
+        
+        # A hand edit invalidates the week's summary entry
+        tracker_path = backend._get_tracker_path('B')
+        tracker_path.write_text(tracker_path.read_text().replace('pending', 'completed', 1))
+        assert backend.get_all_progress('research')['B'].completed == 1
+        assert backend.get_progress('B', 'research').completed == 1
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_batch_updates_single_write():
+    """Test that a batch applies all updates with one save and is all-or-nothing."""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        mock_cfg = MagicMock()
+        mock_cfg.weeks_dir = temp_dir
+        mock_cfg.cache_dir = temp_dir / ".cache"
+        backend = YAMLTrackerBackend(config=mock_cfg)
+        backend.sync_with_etl('A', ['Item1', 'Item2'])
+
+        with patch.object(backend, 'save_tracker', wraps=backend.save_tracker) as save:
+            with backend.batch('A') as batch:
+                batch.update_task('Item1', 'research', TaskStatus.COMPLETED, output_file='research/item1.yaml')
+                # Sees the completion queued above
+                batch.update_task('Item1', 'content', TaskStatus.IN_PROGRESS)
+                batch.update_task('Item2', 'research', TaskStatus.SKIPPED)
+            assert save.call_count == 1
+
+        tracker = backend.load_tracker('A')
+        assert tracker.items['Item1']['research'].output_file == 'research/item1.yaml'
+        assert tracker.items['Item1']['content'].status == TaskStatus.IN_PROGRESS
+        assert tracker.items['Item2']['research'].status == TaskStatus.SKIPPED
+
+        # One invalid update rejects the whole batch
+        with pytest.raises(DependencyNotMetError):
+            backend.update_tasks('A', [
+                TaskUpdate(item='Item2', task_type='research', status=TaskStatus.COMPLETED),
+                TaskUpdate(item='Item2', task_type='content', status=TaskStatus.COMPLETED),
+                TaskUpdate(item=None, task_type='blog_post', status=TaskStatus.IN_PROGRESS),
+            ])
+        assert backend.load_tracker('A').items['Item2']['research'].status == TaskStatus.SKIPPED
+
+        # An exception inside the block discards the queued updates
+        with pytest.raises(RuntimeError):
+            with backend.batch('A') as batch:
+                batch.update_task('Item2', 'research', TaskStatus.COMPLETED)
+                raise RuntimeError("abort")
+        assert backend.load_tracker('A').items['Item2']['research'].status == TaskStatus.SKIPPED
+    finally:
+        shutil.rmtree(temp_dir)
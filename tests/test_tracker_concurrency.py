@@ -0,0 +1,87 @@
+"""Concurrent writers against the file-based tracker backends."""
+
+import pytest
+import tempfile
+import shutil
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tracker.cache import TrackerCache
+from src.tracker.exceptions import TrackerConflictError
+from src.tracker.journal_backend import JournaledTrackerBackend
+from src.tracker.models import TaskStatus
+from src.tracker.yaml_backend import YAMLTrackerBackend
+
+BACKENDS = {"yaml": YAMLTrackerBackend, "journal": JournaledTrackerBackend}
+ITEMS = [f"Item {i}" for i in range(24)]
+
+
+def _backend(kind, weeks_dir):
+    cfg = SimpleNamespace(weeks_dir=Path(weeks_dir), data_dir=Path(weeks_dir), cache_dir=Path(weeks_dir) / ".cache")
+    return BACKENDS[kind](cfg, cache=TrackerCache())
+
+
+def _complete(kind, weeks_dir, names):
+    backend = _backend(kind, weeks_dir)
+    for name in names:
+        backend.update_task("A", name, "research", TaskStatus.COMPLETED, output_file=f"research/{name}.yaml")
+
+
+@pytest.fixture
+def weeks_dir():
+    test_dir = Path(tempfile.mkdtemp())
+    yield test_dir
+    shutil.rmtree(test_dir)
+
+
+def _assert_all_completed(kind, weeks_dir):
+    tracker = _backend(kind, weeks_dir).load_tracker("A")
+    assert {name: item["research"].status for name, item in tracker.items.items()} == {
+        name: TaskStatus.COMPLETED for name in ITEMS
+    }
+
+
+@pytest.mark.parametrize("kind", sorted(BACKENDS))
+def test_concurrent_threads_lose_no_updates(kind, weeks_dir):
+    _backend(kind, weeks_dir).sync_with_etl("A", ITEMS)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda i: _complete(kind, weeks_dir, ITEMS[i::4]), range(4)))
+
+    _assert_all_completed(kind, weeks_dir)
+
+
+@pytest.mark.parametrize("kind", sorted(BACKENDS))
+def test_concurrent_processes_lose_no_updates(kind, weeks_dir):
+    _backend(kind, weeks_dir).sync_with_etl("A", ITEMS)
+
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_complete, args=(kind, str(weeks_dir), ITEMS[i::4])) for i in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert [worker.exitcode for worker in workers] == [0, 0, 0, 0]
+
+    _assert_all_completed(kind, weeks_dir)
+
+
+def test_stale_save_conflicts(weeks_dir):
+    backend = _backend("yaml", weeks_dir)
+    backend.sync_with_etl("A", ITEMS)
+    stale = backend.load_tracker("A")
+    version = stale.metadata["version"]
+
+    backend.update_task("A", "Item 0", "research", TaskStatus.COMPLETED)
+    assert backend.load_tracker("A").metadata["version"] == version + 1
+
+    stale.items["Item 1"]["research"].status = TaskStatus.SKIPPED
+    with pytest.raises(TrackerConflictError):
+        backend.save_tracker("A", stale, expected_version=version)
+    assert backend.load_tracker("A").items["Item 0"]["research"].status == TaskStatus.COMPLETED
@@ -0,0 +1,82 @@
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pipeline.extract import get_landscape_data
+from src.pipeline.index import LandscapeIndex
+from src.pipeline.transform import (
+    get_categories,
+    get_items,
+    get_all_categories,
+    get_stats_per_category,
+    get_stats_by_status,
+    get_items_without_repo_url,
+    get_landscape_by_letter,
+    get_only_letter,
+    get_tasks_for_letter,
+    make_path,
+)
+
+TEST_DATA = Path(__file__).parent / 'test_data' / 'landscape_with_excluded.yml'
+
+
+def test_landscape_index_columns():
+    index = LandscapeIndex.build(get_landscape_data(str(TEST_DATA)))
+
+    assert index.categories == ['Category 1', 'Category 2']
+    assert index.subcategory_paths == ['category_1_subcategory_1', 'category_2_subcategory_2']
+    assert index.names == ['Item 1', 'Item 2 (no repo)', 'Another Item', 'An item starting with A', 'Item 3', 'Item 4 (no repo)']
+    assert list(index.subcategory_ids) == [0, 0, 0, 0, 1, 1]
+    assert list(index.valid) == [1, 0, 1, 1, 1, 0]
+    assert index.letters == ['I', 'I', 'A', 'A', 'I', 'I']
+    assert [index.statuses[code] for code in index.status_codes] == [None, None, 'graduated', None, None, None]
+
+
+def test_transforms_share_index():
+    landscape = get_landscape_data(str(TEST_DATA))
+    index = LandscapeIndex.build(landscape)
+
+    for transform in (get_categories, get_items, get_all_categories, get_stats_per_category,
+                      get_stats_by_status, get_items_without_repo_url, get_landscape_by_letter):
+        assert transform(index) == transform(landscape)
+
+
+def test_letter_buckets():
+    index = LandscapeIndex.build(get_landscape_data(str(TEST_DATA)))
+
+    assert index.rows_for_letter('A') == [2, 3]
+    assert index.rows_for_letter('Ano') == [2]
+    assert index.rows_for_letter('Z') == []
+    assert get_tasks_for_letter('I', index) == ['Item 1', 'Item 3']
+    assert get_only_letter('A', index) == {
+        'category_1_subcategory_1': [index.items[2], index.items[3]],
+        'category_2_subcategory_2': [],
+    }
+
+
+def test_make_path():
+    assert make_path('App Definition and Development', 'Database') == 'app_definition_and_development_database'
+    assert make_path('Provisioning', 'Automation & Configuration') == 'provisioning_automation_configuration'
+    assert make_path('Serverless', 'Tools - Security, Compliance / Misc') == 'serverless_tools_security_compliance___misc'
+
+
+def test_featured_limit():
+    index = LandscapeIndex.build(get_landscape_data(str(TEST_DATA)))
+
+    def featured(by_letter):
+        return {
+            item['name']: item['featured']
+            for letter in by_letter.values()
+            for items in letter['partial'].values()
+            for item in items
+        }
+
+    assert featured(get_landscape_by_letter(index, featured_limit=1)) == {
+        'Another Item': True,
+        'An item starting with A': False,
+        'Item 1': True,
+        'Item 3': True,
+    }
+    assert not any(featured(get_landscape_by_letter(index, featured_limit=0)).values())
@@ -0,0 +1,87 @@
+import tempfile
+import shutil
+import os
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import clear_config_cache
+from src.pipeline.instrumentation import REPORT_FILE
+from src.pipeline.runner import run_etl
+from src.pipeline.writer import WriteStats, write_if_changed, write_yaml_if_changed
+
+
+def test_write_if_changed_skips_identical_content():
+    test_dir = tempfile.mkdtemp()
+    try:
+        path = Path(test_dir) / 'nested' / 'out.yaml'
+        stats = WriteStats()
+
+        assert write_yaml_if_changed(path, {'a': 1}, stats)
+        os.utime(path, ns=(0, 0))
+        assert not write_yaml_if_changed(path, {'a': 1}, stats)
+        assert path.stat().st_mtime_ns == 0
+        assert write_if_changed(path, 'a: 2\n', stats)
+        assert path.read_text() == 'a: 2\n'
+
+        assert (stats.written, stats.skipped) == (2, 1)
+        assert [p.name for p in path.parent.iterdir()] == ['out.yaml']
+    finally:
+        shutil.rmtree(test_dir)
+
+
+def test_write_if_changed_keeps_file_mode():
+    test_dir = tempfile.mkdtemp()
+    try:
+        path = Path(test_dir) / 'out.yaml'
+        with patch('src.pipeline.writer._UMASK', 0o022):
+            write_if_changed(path, 'a: 1\n')
+        assert path.stat().st_mode & 0o777 == 0o644
+
+        os.chmod(path, 0o664)
+        write_if_changed(path, 'a: 2\n')
+        assert path.stat().st_mode & 0o777 == 0o664
+    finally:
+        shutil.rmtree(test_dir)
+
+
+def test_etl_rerun_writes_nothing():
+    clear_config_cache()
+    test_dir = tempfile.mkdtemp()
+    try:
+        os.environ['TEST_DATA_DIR'] = test_dir
+        test_data_path = Path(__file__).parent / 'test_data' / 'landscape_with_excluded.yml'
+
+        with patch('src.pipeline.runner.generate_letter_pages'):
+            first = run_etl(input_path=str(test_data_path), output_dir=test_dir)
+            second = run_etl(input_path=str(test_data_path), output_dir=test_dir)
+
+        assert first.written > 0 and first.skipped == 0
+        assert second.written == 0 and second.skipped == first.written
+    finally:
+        shutil.rmtree(test_dir)
+
+
+def test_etl_workers_produce_identical_output():
+    clear_config_cache()
+    test_dir = tempfile.mkdtemp()
+    try:
+        os.environ['TEST_DATA_DIR'] = test_dir
+        test_data_path = Path(__file__).parent / 'test_data' / 'landscape_with_excluded.yml'
+        outputs = {}
+        for workers in (1, 8):
+            output_dir = Path(test_dir) / f'workers_{workers}'
+            with patch('src.pipeline.runner.generate_letter_pages'):
+                run_etl(input_path=str(test_data_path), output_dir=str(output_dir), workers=workers)
+            outputs[workers] = {
+                path.relative_to(output_dir): path.read_bytes()
+                for path in output_dir.rglob('*')
+                if path.is_file() and '.cache' not in path.parts and path.name != REPORT_FILE
+            }
+
+        assert outputs[1] == outputs[8]
+    finally:
+        shutil.rmtree(test_dir)